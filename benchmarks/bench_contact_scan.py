@@ -0,0 +1,164 @@
+"""
+홈페이지 연락처 스캔 속도/결과 비교: 기존 스캐너 vs 한 번에 훑는 스캐너(SmartExtractor.extract_info_from_text)
+
+실행: python benchmarks/bench_contact_scan.py [--seconds 2]
+fixtures/ 아래 HTML을 홈페이지처럼 스캔함.
+- legacy: 보이는 텍스트 + 원본 HTML을 이어 붙여 unicode_escape로 통째로 디코딩한 뒤 스캔 (기존 코드 그대로)
+- reference: legacy와 같은 방식이지만 디코딩만 새 스캐너와 같게 한 것 (한글이 깨지지 않음)
+- new: 보이는 텍스트와 원본을 각각 한 번씩, '@'/숫자 구간만 스캔
+
+identical은 new와 reference의 결과가 같은지(스캔 방식만 바꾸고 결과는 그대로인지),
+legacy_diff는 unicode_escape 때문에 한글 키워드('팩스', '계좌' 등)를 못 찾던 기존 결과와 달라진 항목.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+# config.py가 WEBHOOK_URL을 요구하므로 벤치마크용 값을 넣어둠 (실제로 전송하지 않음)
+os.environ.setdefault("WEBHOOK_URL", "http://127.0.0.1/bench")
+
+from utils.smart_extractor import SmartExtractor, unescape_js
+
+CORPUS = [
+    "benchmarks/fixtures/company_home.html",
+    "benchmarks/fixtures/innobiz_list.html",
+    "benchmarks/fixtures/mainbiz_list.html",
+]
+
+
+class LegacyScanner:
+    """변경 전 SmartExtractor.extract_info_from_text (비교용 사본)"""
+    def __init__(self, extractor, decode):
+        self.x = extractor
+        self.decode = decode
+
+    def is_garbage_number(self, mid, end, full_formatted):
+        if not mid or not end: return True
+        if full_formatted in list(self.x.garbage_full_numbers):
+            return True
+        garbage_patterns = ['0000', '1111', '2222', '3333', '4444', '5555', '6666', '7777', '8888', '9999', '1234', '2345', '5678', '4321']
+        if mid in garbage_patterns or end in garbage_patterns:
+            return True
+        if mid == end:
+            return True
+        if len(mid) < 3 or len(end) < 4:
+            return True
+        return False
+
+    def extract_info_from_text(self, text, info_dict):
+        if not text: return
+        text = self.decode(text)
+        text_lower = text.lower()
+
+        emails = self.x.email_pattern.findall(text)
+        for email in emails:
+            if not any(ext in email.lower() for ext in ['.png', '.jpg', '.gif', '.js', 'w3.org', 'example', 'sentry', 'u003e', '.css', 'node_modules']):
+                info_dict['email'].add(email)
+
+        for match in self.x.phone_regex.finditer(text_lower):
+            groups = match.groupdict()
+            area, mid, end = "", "", ""
+            if groups['intl_area']:
+                area, mid, end = groups['intl_area'], groups['intl_mid'], groups['intl_end']
+                if not area.startswith('0'): area = '0' + area
+            elif groups['rep_head']:
+                area, mid, end = groups['rep_head'], None, groups['rep_tail']
+            elif groups['dom_area_sep']:
+                area, mid, end = groups['dom_area_sep'], groups['dom_mid_sep'], groups['dom_end_sep']
+            elif groups['dom_area_raw']:
+                area, mid, end = groups['dom_area_raw'], groups['dom_mid_raw'], groups['dom_end_raw']
+
+            full_number = self.x.normalize_phone(area, mid, end)
+            if self.is_garbage_number(mid, end, full_number):
+                continue
+
+            start_pos = match.start()
+            context_prev = text_lower[max(0, start_pos - 20):start_pos]
+            context_next = text_lower[match.end():min(len(text_lower), match.end() + 10)]
+            combined_context = context_prev + " " + context_next
+            if any(k in combined_context for k in self.x.negative_keywords):
+                continue
+            if any(keyword in context_prev for keyword in self.x.fax_keywords):
+                info_dict['fax'].add(full_number)
+            else:
+                info_dict['tel'].add(full_number)
+
+
+def unicode_escape(text):
+    try:
+        return text.encode('utf-8').decode('unicode_escape')
+    except Exception:
+        return text
+
+
+def prepare(path):
+    with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+        raw = f.read()
+    visible = BeautifulSoup(raw, 'html.parser').get_text(separator=' ', strip=True)
+    return raw, visible
+
+
+def scan_combined(scanner, raw, visible):
+    info = {'email': set(), 'tel': set(), 'fax': set()}
+    scanner.extract_info_from_text(f"{visible} {raw}", info)
+    return info
+
+
+def scan_new(extractor, raw, visible):
+    info = {'email': set(), 'tel': set(), 'fax': set()}
+    extractor.extract_info_from_text(visible, info)
+    if raw != visible:
+        extractor.extract_info_from_text(raw, info)
+    return info
+
+
+def measure(func, docs, seconds):
+    total_bytes = sum(len(raw.encode('utf-8')) + len(visible.encode('utf-8')) for raw, visible in docs)
+    rounds = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for raw, visible in docs:
+            func(raw, visible)
+        rounds += 1
+    return rounds * total_bytes / (time.perf_counter() - started) / 1e6
+
+
+def diff(a, b):
+    return {k: {"added": len(b[k] - a[k]), "removed": len(a[k] - b[k])} for k in a if a[k] != b[k]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    extractor = SmartExtractor(rate_limit=False)
+    legacy = LegacyScanner(extractor, unicode_escape)
+    reference = LegacyScanner(extractor, unescape_js)
+
+    docs = [prepare(path) for path in CORPUS]
+    report = {"documents": {}}
+    for path, (raw, visible) in zip(CORPUS, docs):
+        new = scan_new(extractor, raw, visible)
+        report["documents"][os.path.basename(path)] = {
+            "identical": new == scan_combined(reference, raw, visible),
+            "legacy_diff": diff(scan_combined(legacy, raw, visible), new),
+        }
+
+    legacy_rate = measure(lambda r, v: scan_combined(legacy, r, v), docs, args.seconds)
+    new_rate = measure(lambda r, v: scan_new(extractor, r, v), docs, args.seconds)
+    report["legacy_mb_per_sec"] = round(legacy_rate, 2)
+    report["new_mb_per_sec"] = round(new_rate, 2)
+    report["speedup"] = round(new_rate / legacy_rate, 2) if legacy_rate else None
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+중복 검사 메모리 인덱스 측정: 대용량 crawl_state_*.db 로드 시간, 메모리, 조회 속도
+
+실행: python benchmarks/bench_dedup_index.py [--rows 1000000] [--db 기존_DB_경로]
+--db를 주지 않으면 임시 폴더에 무작위 해시로 DB를 만들어 측정함.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from utils.dedup_index import FingerprintIndex
+
+
+def build_db(path, rows):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS items (item_hash TEXT PRIMARY KEY, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+        batch = []
+        for i in range(rows):
+            batch.append((hashlib.md5(str(i).encode()).hexdigest(),))
+            if len(batch) == 50000:
+                conn.executemany("INSERT OR IGNORE INTO items (item_hash) VALUES (?)", batch)
+                batch.clear()
+        if batch:
+            conn.executemany("INSERT OR IGNORE INTO items (item_hash) VALUES (?)", batch)
+        conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--db', default=None)
+    parser.add_argument('--lookups', type=int, default=200_000)
+    args = parser.parse_args()
+
+    db_path = args.db
+    if not db_path:
+        db_path = os.path.join(tempfile.mkdtemp(), "crawl_state_bench.db")
+        build_db(db_path, args.rows)
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    started = time.perf_counter()
+    index = FingerprintIndex()
+    index.load(row[0] for row in conn.execute("SELECT item_hash FROM items"))
+    load_seconds = time.perf_counter() - started
+
+    # 로드 중 최대 메모리는 tracemalloc이 느려지므로 따로 한 번 더 측정
+    tracemalloc.start()
+    FingerprintIndex().load(row[0] for row in conn.execute("SELECT item_hash FROM items"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    hashes = [row[0] for row in conn.execute("SELECT item_hash FROM items LIMIT ?", (args.lookups // 2,))]
+    probes = hashes + [hashlib.md5(f"new-{i}".encode()).hexdigest() for i in range(args.lookups - len(hashes))]
+    random.shuffle(probes)
+
+    started = time.perf_counter()
+    hits = sum(1 for h in probes if index.fingerprint(h) in index)
+    index_rate = len(probes) / (time.perf_counter() - started)
+
+    sample = probes[:20000]
+    started = time.perf_counter()
+    for h in sample:
+        conn.execute("SELECT 1 FROM items WHERE item_hash = ?", (h,)).fetchone()
+    sqlite_rate = len(sample) / (time.perf_counter() - started)
+
+    print(json.dumps({
+        "rows": rows,
+        "load_seconds": round(load_seconds, 3),
+        "index_mb": round(index.memory_bytes() / 1024 / 1024, 2),
+        "index_mb_per_million": round(index.memory_bytes() / 1024 / 1024 / max(rows, 1) * 1_000_000, 2),
+        "peak_load_mb": round(peak / 1024 / 1024, 1),
+        "index_lookups_per_sec": int(index_rate),
+        "sqlite_lookups_per_sec": int(sqlite_rate),
+        "hits": hits,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
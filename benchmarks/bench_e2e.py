@@ -0,0 +1,288 @@
+"""
+오프라인 end-to-end 벤치마크: 로컬 대역 서버(stand_in_server.py)를 상대로 GenericAsyncCrawler를 실제로 돌림
+
+실행: python benchmarks/bench_e2e.py [--sources innobiz,mainbiz] [--pages 30] [--latency 0.02]
+                                    [--error-rate 0.05] [--output result.json] [--compare before.json]
+
+목록 페이지 → 추출 → 중복 검사 → (심층 크롤링) → 보관함 → 웹훅까지 전부 거치며, 결과는 JSON으로 출력함.
+- pages_per_sec / items_per_sec: 웹훅이 실제로 받은 아이템 기준
+- stages: 단계별 지연 p50/p99 (fetch, parse:*, dedup, deep_crawl, upload, page)
+- peak_rss_mb: 크롤러 프로세스 / 파싱 풀 워커 중 최대
+- loop_lag_ms: 10ms마다 깨어나는 타이머가 늦게 깨어난 정도 (이벤트 루프가 막힌 시간)
+
+실행할 때마다 임시 폴더에서 돌기 때문에 states/ 는 항상 비어 있는 상태로 시작함.
+기본적으로 속도 제한기와 호스트당 연결 수 제한은 끔 (모든 요청이 127.0.0.1로 가므로). --keep-limits로 유지.
+--compare로 이전 결과 파일을 주면 주요 수치의 변화율을 같이 출력함 (커밋 사이 비교용).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+PORT = int(os.environ.get("BENCH_PORT") or _free_port())
+BASE_URL = f"http://127.0.0.1:{PORT}"
+# 업로더가 로컬 웹훅 대역으로 보내도록 config.py를 불러오기 전에 설정
+os.environ["WEBHOOK_URL"] = f"{BASE_URL}/webhook"
+
+import aiohttp
+
+from benchmarks.stand_in_server import SOURCES, add_arguments, server_options, serve
+from core.engine import GenericAsyncCrawler
+from core.parse_pool import ParsePool
+from utils.data_processor import DataProcessor
+from utils.metrics import Metrics
+
+TICK = 0.01
+# 변화율을 출력할 지표 (--compare)
+COMPARE_KEYS = ["pages_per_sec", "items_per_sec", "loop_lag_ms.p99", "peak_rss_mb.crawler", "stages.page.p50_ms", "stages.page.p99_ms"]
+
+
+class StageTimer:
+    """코루틴 메서드를 감싸서 호출마다 걸린 시간을 단계별로 기록"""
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def wrap(self, owner, attr, stage=None):
+        original = getattr(owner, attr)
+        samples = self.samples
+
+        async def timed(*args, **kwargs):
+            name = stage or f"parse:{getattr(args[0], '__name__', 'call')}"
+            started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                samples[name].append(time.perf_counter() - started)
+
+        setattr(owner, attr, timed)
+
+    def summary(self):
+        return {name: summarize(values, scale=1000) for name, values in sorted(self.samples.items())}
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def summarize(values, scale=1000):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 0.5) * scale, 2) if values else None,
+        "p99_ms": round(percentile(values, 0.99) * scale, 2) if values else None,
+    }
+
+
+async def lag_monitor(samples, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(TICK)
+        samples.append(loop.time() - started - TICK)
+
+
+def peak_rss_mb(who):
+    # 리눅스는 KB, macOS는 바이트 단위
+    rss = resource.getrusage(who).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def write_configs(names, args, workdir):
+    """저장소의 설정 파일을 로컬 서버 주소/페이지 수로 바꾼 사본을 만듦"""
+    paths = []
+    for name in names:
+        with open(os.path.join(ROOT, SOURCES[name][0]), encoding='utf-8') as f:
+            config = json.load(f)
+        config['request']['url'] = f"{BASE_URL}/list/{name}"
+        config['request']['pagination']['max_page'] = args.pages
+        config['concurrency'] = args.concurrency
+        config['hooks_file'] = None
+        if args.no_deep_crawl:
+            config['deep_crawl'] = False
+        if not args.keep_limits:
+            config['rate_limit'] = False
+            # 실제로는 기업마다 호스트가 다르므로 호스트당 연결 수 제한을 풀어서 비슷하게 맞춤
+            config['http_pool'] = {'limit_per_host': 0}
+            config['browser_state'] = False
+
+        path = os.path.join(workdir, f"{name}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False)
+        paths.append(path)
+    return paths
+
+
+async def run_crawlers(config_paths, args):
+    timer = StageTimer()
+    timer.wrap(ParsePool, 'run')
+
+    await DataProcessor.start_worker()
+    await ParsePool.start()
+    timer.wrap(DataProcessor._uploader, 'send', 'upload')
+
+    crawlers = [GenericAsyncCrawler(path) for path in config_paths]
+    for crawler in crawlers:
+        timer.wrap(crawler.fetcher, 'fetch', 'fetch')
+        timer.wrap(crawler.state_manager, 'filter_new', 'dedup')
+        timer.wrap(crawler.extractor, 'process_company', 'deep_crawl')
+        timer.wrap(crawler, 'process_page', 'page')
+        if not args.keep_limits:
+            crawler.extractor.rate_limit = False
+
+    lag = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(lag_monitor(lag, stop))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(crawler.run() for crawler in crawlers))
+    finally:
+        await DataProcessor.stop_worker()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await monitor
+        await ParsePool.shutdown()
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{BASE_URL}/stats") as resp:
+            server_stats = await resp.json()
+
+    lag.sort()
+    pages = len(timer.samples.get('page', []))
+    items = server_stats.get('webhook_items', 0)
+    return {
+        "elapsed_sec": round(elapsed, 2),
+        "pages": pages,
+        "items_uploaded": items,
+        "pages_per_sec": round(pages / elapsed, 2),
+        "items_per_sec": round(items / elapsed, 2),
+        "stages": timer.summary(),
+        "loop_lag_ms": {
+            "p50": round(percentile(lag, 0.5) * 1000, 2) if lag else None,
+            "p99": round(percentile(lag, 0.99) * 1000, 2) if lag else None,
+            "max": round(lag[-1] * 1000, 2) if lag else None,
+        },
+        # 파싱 풀 워커는 shutdown 후에야 RUSAGE_CHILDREN에 잡힘 (대역 서버는 아직 살아 있어서 제외됨)
+        "peak_rss_mb": {
+            "crawler": peak_rss_mb(resource.RUSAGE_SELF),
+            "parse_workers": peak_rss_mb(resource.RUSAGE_CHILDREN),
+        },
+        "server": server_stats,
+        # --metrics: 크롤러 내부 지표 (utils/metrics.py) 스냅샷
+        "metrics": Metrics.snapshot() if Metrics.enabled else None,
+    }
+
+
+def git_revision():
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT, capture_output=True, text=True)
+        return rev.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+    except OSError:
+        return None
+
+
+def lookup(report, dotted):
+    value = report
+    for key in dotted.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare(before, after):
+    """주요 지표의 이전/이후 값과 변화율"""
+    result = {}
+    for key in COMPARE_KEYS:
+        old, new = lookup(before, key), lookup(after, key)
+        change = None
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)) and old:
+            change = f"{(new - old) / old * 100:+.1f}%"
+        result[key] = {"before": old, "after": new, "change": change}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sources', default=",".join(SOURCES), help="쉼표로 구분 (기본: 전부)")
+    parser.add_argument('--pages', type=int, default=30, help="출처마다 수집할 페이지 수")
+    parser.add_argument('--concurrency', type=int, default=3)
+    parser.add_argument('--no-deep-crawl', action='store_true')
+    parser.add_argument('--keep-limits', action='store_true', help="속도 제한기/호스트당 연결 제한 유지")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    parser.add_argument('--verbose', action='store_true', help="크롤러 로그 출력")
+    parser.add_argument('--metrics', action='store_true', help="크롤러 내부 지표를 켜고 결과에 포함 (오버헤드 비교용)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    names = [name.strip() for name in args.sources.split(',') if name.strip()]
+    if args.metrics:
+        Metrics.configure(enabled=True)
+
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Event()
+    server = ctx.Process(target=serve, args=(PORT, server_options(args), ready), name="StandInServer", daemon=True)
+    server.start()
+    if not ready.wait(timeout=30):
+        server.terminate()
+        raise RuntimeError("Stand-in server did not start")
+
+    origin = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_e2e_") as workdir:
+            config_paths = write_configs(names, args, workdir)
+            # states/ (중복 검사 DB, 보관함)를 임시 폴더에 만들도록 작업 폴더를 옮김
+            os.chdir(workdir)
+            try:
+                metrics = asyncio.run(run_crawlers(config_paths, args))
+            finally:
+                os.chdir(origin)
+    finally:
+        server.terminate()
+        server.join()
+
+    report = {
+        "revision": git_revision(),
+        "params": {k: v for k, v in vars(args).items() if k not in ('output', 'compare', 'verbose')},
+        "cpu_count": os.cpu_count(),
+        **metrics,
+    }
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            report["compare"] = compare(json.load(f), report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+목록 페이지 추출 속도 비교: 기존 BeautifulSoup 경로 vs 컴파일된 lxml 추출 계획
+
+실행: python benchmarks/bench_extraction.py [--seconds 3]
+fixtures/ 아래에 저장된 이노비즈/메인비즈 목록 페이지를 사용함.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from core.strategies import CssStrategy, StrategyFactory
+
+FIXTURES = {
+    "innobiz": ("configs/innobiz.json", "benchmarks/fixtures/innobiz_list.html"),
+    "mainbiz": ("configs/mainbiz.json", "benchmarks/fixtures/mainbiz_list.html"),
+}
+
+
+def legacy_extract(content, rules):
+    # 기존 엔진처럼 페이지마다 전략(과 SmartExtractor)을 새로 만들고 BeautifulSoup으로 파싱
+    return CssStrategy()._extract_with_soup(content, rules)
+
+
+def compiled_extract(content, rules):
+    return StrategyFactory.get('css').extract(content, rules)
+
+
+def measure(func, content, rules, seconds):
+    pages = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        func(content, rules)
+        pages += 1
+    return pages / (time.perf_counter() - started)
+
+
+def comparable(records, rules):
+    """inner_html 필드는 직렬화 방식만 다르므로 비교에서 제외"""
+    markup = {k for k, v in rules.get('fields', {}).items() if isinstance(v, str) and v.endswith('> inner_html')}
+    return [{k: v for k, v in r.items() if k not in markup} for r in records]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+
+    report = {}
+    for name, (config_path, fixture_path) in FIXTURES.items():
+        with open(os.path.join(ROOT, config_path), encoding='utf-8') as f:
+            rules = json.load(f)['extraction']
+        with open(os.path.join(ROOT, fixture_path), encoding='utf-8') as f:
+            content = f.read()
+
+        legacy = legacy_extract(content, rules)
+        compiled = compiled_extract(content, rules)
+        identical = comparable(legacy, rules) == comparable(compiled, rules)
+
+        legacy_rate = measure(legacy_extract, content, rules, args.seconds)
+        compiled_rate = measure(compiled_extract, content, rules, args.seconds)
+
+        report[name] = {
+            "records": len(compiled),
+            "identical": identical,
+            "legacy_pages_per_sec": round(legacy_rate, 1),
+            "compiled_pages_per_sec": round(compiled_rate, 1),
+            "speedup": round(compiled_rate / legacy_rate, 2) if legacy_rate else None,
+        }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
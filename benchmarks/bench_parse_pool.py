@@ -0,0 +1,109 @@
+"""
+목록 페이지 추출 중 이벤트 루프 지연 비교: 이벤트 루프에서 바로 추출 vs ParsePool(프로세스 풀)
+
+실행: python benchmarks/bench_parse_pool.py [--crawlers 4] [--pages 40] [--workers 2]
+크롤러 여러 개가 fixtures/ 목록 페이지를 '받아서'(짧은 sleep) 추출하는 동안
+10ms마다 깨어나는 타이머가 얼마나 늦게 깨어나는지(=다른 네트워크 작업이 기다린 시간)를 잼.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+# config.py가 WEBHOOK_URL을 요구하므로 벤치마크용 값을 넣어둠 (실제로 전송하지 않음)
+os.environ.setdefault("WEBHOOK_URL", "http://127.0.0.1/bench")
+
+from core.parse_pool import ParsePool
+from core.strategies import StrategyFactory, extract_records
+
+FIXTURES = {
+    "innobiz": ("configs/innobiz.json", "benchmarks/fixtures/innobiz_list.html"),
+    "mainbiz": ("configs/mainbiz.json", "benchmarks/fixtures/mainbiz_list.html"),
+}
+TICK = 0.01
+
+
+def load_fixtures():
+    pages = []
+    for config_path, fixture_path in FIXTURES.values():
+        with open(os.path.join(ROOT, config_path), encoding='utf-8') as f:
+            rules = json.load(f)['extraction']
+        with open(os.path.join(ROOT, fixture_path), encoding='utf-8') as f:
+            pages.append((f.read(), rules))
+    return pages
+
+
+async def lag_monitor(samples, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(TICK)
+        samples.append(loop.time() - started - TICK)
+
+
+async def crawl(pages, count, use_pool):
+    records = 0
+    for i in range(count):
+        await asyncio.sleep(random.uniform(0.005, 0.02))  # 네트워크 대기 흉내
+        content, rules = pages[i % len(pages)]
+        if use_pool:
+            items = await ParsePool.run(extract_records, 'css', content, rules, size=len(content))
+        else:
+            items = StrategyFactory.get('css').extract(content, rules)
+        records += len(items)
+    return records
+
+
+async def scenario(pages, args, use_pool):
+    if use_pool:
+        ParsePool.configure(workers=args.workers, inline_below_bytes=0)
+        await ParsePool.start()
+    else:
+        # 이벤트 루프 쪽 계획도 미리 컴파일해서 같은 조건으로 비교
+        for content, rules in pages:
+            StrategyFactory.get('css').extract(content, rules)
+
+    samples = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(lag_monitor(samples, stop))
+    started = time.perf_counter()
+    records = await asyncio.gather(*(crawl(pages, args.pages, use_pool) for _ in range(args.crawlers)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    if use_pool:
+        await ParsePool.shutdown()
+
+    samples.sort()
+    return {
+        "pages_per_sec": round(args.crawlers * args.pages / elapsed, 1),
+        "records": sum(records),
+        "lag_p50_ms": round(statistics.median(samples) * 1000, 2),
+        "lag_p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 2),
+        "lag_max_ms": round(samples[-1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--crawlers', type=int, default=4)
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    args = parser.parse_args()
+
+    pages = load_fixtures()
+    report = {
+        "inline": asyncio.run(scenario(pages, args, use_pool=False)),
+        "pool": asyncio.run(scenario(pages, args, use_pool=True)),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
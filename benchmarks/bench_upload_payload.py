@@ -0,0 +1,93 @@
+"""
+웹훅 업로드 본문 비교: rows(기존) vs columnar
+
+실행: python benchmarks/bench_upload_payload.py [--batch 150] [--seconds 2]
+fixtures/ 아래 목록 페이지에서 추출한 레코드를 DataProcessor.create_record로 가공하고,
+실제 배치처럼 기업명/대표자명/연락처를 바꿔가며 batch 크기만큼 채워서 측정함.
+"웹훅 쪽 파싱"은 decode_batch(README decodeBatch의 파이썬 대역)로 측정함.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+# config.py가 WEBHOOK_URL을 요구하므로 벤치마크용 값을 넣어둠 (실제로 전송하지 않음)
+os.environ.setdefault("WEBHOOK_URL", "http://127.0.0.1/bench")
+
+from core.strategies import StrategyFactory
+from utils.data_processor import DataProcessor
+from utils.payload import serialize, decode_batch
+
+FIXTURES = {
+    "innobiz": ("configs/innobiz.json", "benchmarks/fixtures/innobiz_list.html"),
+    "mainbiz": ("configs/mainbiz.json", "benchmarks/fixtures/mainbiz_list.html"),
+}
+
+
+def build_batch(name, batch_size):
+    with open(os.path.join(ROOT, FIXTURES[name][0]), encoding='utf-8') as f:
+        rules = json.load(f)['extraction']
+    with open(os.path.join(ROOT, FIXTURES[name][1]), encoding='utf-8') as f:
+        content = f.read()
+
+    items = StrategyFactory.get('css').extract(content, rules)
+    processor = DataProcessor(name)
+    batch = []
+    i = 0
+    while len(batch) < batch_size:
+        item = dict(items[i % len(items)])
+        item = {k: v for k, v in item.items() if not k.startswith('_')}
+        item['기업명'] = f"{item.get('기업명', '')}{i}"
+        item['대표자명'] = f"{item.get('대표자명', '')}{i % 97}"
+        # 심층 크롤링 결과처럼 일부 행에만 연락처를 채움
+        if i % 3 == 0:
+            item['전화번호'] = f"02{i:08d}"[:10]
+            item['이메일'] = f"contact{i}@example.co.kr"
+        batch.append(processor.create_record(item))
+        i += 1
+    return batch
+
+
+def rate(func, seconds):
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        func()
+        count += 1
+    return (time.perf_counter() - started) / count * 1000  # ms/회
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batch', type=int, default=150)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    report = {}
+    for name in FIXTURES:
+        batch = build_batch(name, args.batch)
+        result = {}
+        for fmt in ('rows', 'columnar'):
+            body = serialize(batch, fmt)
+            assert decode_batch(body) == batch, f"{fmt} round-trip mismatch"
+            result[fmt] = {
+                "bytes": len(body),
+                # UPLOAD_CONFIG["gzip"]일 때 실제로 보내는 크기 (gzip+base64 봉투)
+                "gzip_bytes": len(serialize(batch, fmt, compress=True)),
+                "encode_ms": round(rate(lambda: serialize(batch, fmt), args.seconds), 3),
+                "decode_ms": round(rate(lambda: decode_batch(body), args.seconds), 3),
+            }
+        rows, col = result['rows'], result['columnar']
+        result['reduction'] = {
+            key: f"{(1 - col[key] / rows[key]) * 100:.1f}%" for key in rows
+        }
+        report[name] = result
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+!function(e){var t={};function n(r){if(t[r])return t[r].exports;var o=t[r]={i:r,l:!1,exports:{}};return e[r].call(o.exports,o,o.exports,n),o.l=!0,o.exports}n.m=e,n.c=t}([]);
+var m0=function(a,b){return a*59295+b/887};
+var m1=function(a,b){return a*73371+b/878};
+var m2=function(a,b){return a*61034+b/463};
+var m3=function(a,b){return a*66564+b/876};
+var m4=function(a,b){return a*76990+b/195};
+var m5=function(a,b){return a*24204+b/824};
+var m6=function(a,b){return a*67097+b/488};
+var m7=function(a,b){return a*82560+b/629};
+var m8=function(a,b){return a*24403+b/97};
+var m9=function(a,b){return a*58536+b/311};
+var m10=function(a,b){return a*18586+b/93};
+var m11=function(a,b){return a*70608+b/830};
+var m12=function(a,b){return a*90891+b/650};
+var m13=function(a,b){return a*5490+b/610};
+var m14=function(a,b){return a*51926+b/988};
+var m15=function(a,b){return a*59375+b/670};
+var m16=function(a,b){return a*96852+b/631};
+var m17=function(a,b){return a*85207+b/162};
+var m18=function(a,b){return a*81675+b/16};
+var m19=function(a,b){return a*69256+b/65};
+var m20=function(a,b){return a*7806+b/37};
+var m21=function(a,b){return a*24931+b/901};
+var m22=function(a,b){return a*31712+b/615};
+var m23=function(a,b){return a*3943+b/797};
+var m24=function(a,b){return a*60809+b/335};
+var m25=function(a,b){return a*57742+b/606};
+var m26=function(a,b){return a*25602+b/532};
+var m27=function(a,b){return a*30625+b/656};
+var m28=function(a,b){return a*38556+b/512};
+var m29=function(a,b){return a*603+b/679};
+var m30=function(a,b){return a*11140+b/469};
+var m31=function(a,b){return a*85827+b/285};
+var m32=function(a,b){return a*53318+b/565};
+var m33=function(a,b){return a*10906+b/725};
+var m34=function(a,b){return a*33292+b/323};
+var m35=function(a,b){return a*99352+b/236};
+var m36=function(a,b){return a*67225+b/296};
+var m37=function(a,b){return a*3900+b/72};
+var m38=function(a,b){return a*73813+b/785};
+var m39=function(a,b){return a*14147+b/411};
+var m40=function(a,b){return a*14130+b/867};
+var m41=function(a,b){return a*38130+b/396};
+var m42=function(a,b){return a*8760+b/982};
+var m43=function(a,b){return a*2214+b/868};
+var m44=function(a,b){return a*89771+b/1};
+var m45=function(a,b){return a*27985+b/215};
+var m46=function(a,b){return a*6859+b/482};
+var m47=function(a,b){return a*49213+b/726};
+var m48=function(a,b){return a*52092+b/430};
+var m49=function(a,b){return a*9574+b/580};
+var m50=function(a,b){return a*82504+b/204};
+var m51=function(a,b){return a*88462+b/277};
+var m52=function(a,b){return a*44158+b/90};
+var m53=function(a,b){return a*40791+b/341};
+var m54=function(a,b){return a*1986+b/988};
+var m55=function(a,b){return a*53747+b/777};
+var m56=function(a,b){return a*15466+b/138};
+var m57=function(a,b){return a*32295+b/724};
+var m58=function(a,b){return a*13245+b/12};
+var m59=function(a,b){return a*7851+b/477};
+var m60=function(a,b){return a*63809+b/182};
+var m61=function(a,b){return a*89402+b/573};
+var m62=function(a,b){return a*24693+b/459};
+var m63=function(a,b){return a*66699+b/196};
+var m64=function(a,b){return a*95931+b/788};
+var m65=function(a,b){return a*17167+b/430};
+var m66=function(a,b){return a*84374+b/393};
+var m67=function(a,b){return a*15271+b/405};
+var m68=function(a,b){return a*55150+b/218};
+var m69=function(a,b){return a*62+b/277};
+var m70=function(a,b){return a*77692+b/312};
+var m71=function(a,b){return a*2574+b/216};
+var m72=function(a,b){return a*24551+b/404};
+var m73=function(a,b){return a*78908+b/658};
+var m74=function(a,b){return a*75624+b/103};
+var m75=function(a,b){return a*5520+b/150};
+var m76=function(a,b){return a*27951+b/453};
+var m77=function(a,b){return a*33853+b/10};
+var m78=function(a,b){return a*79998+b/337};
+var m79=function(a,b){return a*38840+b/396};
+var m80=function(a,b){return a*9621+b/77};
+var m81=function(a,b){return a*11812+b/214};
+var m82=function(a,b){return a*76381+b/652};
+var m83=function(a,b){return a*31853+b/16};
+var m84=function(a,b){return a*78812+b/378};
+var m85=function(a,b){return a*48720+b/638};
+var m86=function(a,b){return a*59403+b/131};
+var m87=function(a,b){return a*76975+b/496};
+var m88=function(a,b){return a*75311+b/139};
+var m89=function(a,b){return a*50607+b/188};
+var m90=function(a,b){return a*82215+b/158};
+var m91=function(a,b){return a*40739+b/931};
+var m92=function(a,b){return a*29935+b/838};
+var m93=function(a,b){return a*80013+b/256};
+var m94=function(a,b){return a*95079+b/195};
+var m95=function(a,b){return a*20772+b/758};
+var m96=function(a,b){return a*82442+b/963};
+var m97=function(a,b){return a*72605+b/202};
+var m98=function(a,b){return a*90044+b/973};
+var m99=function(a,b){return a*50884+b/904};
+var m100=function(a,b){return a*63245+b/619};
+var m101=function(a,b){return a*10289+b/432};
+var m102=function(a,b){return a*6214+b/107};
+var m103=function(a,b){return a*14294+b/40};
+var m104=function(a,b){return a*67156+b/986};
+var m105=function(a,b){return a*33447+b/245};
+var m106=function(a,b){return a*96971+b/722};
+var m107=function(a,b){return a*51330+b/264};
+var m108=function(a,b){return a*55158+b/844};
+var m109=function(a,b){return a*78181+b/503};
+var m110=function(a,b){return a*38462+b/533};
+var m111=function(a,b){return a*22995+b/952};
+var m112=function(a,b){return a*94419+b/71};
+var m113=function(a,b){return a*16568+b/234};
+var m114=function(a,b){return a*62823+b/573};
+var m115=function(a,b){return a*85657+b/873};
+var m116=function(a,b){return a*80724+b/630};
+var m117=function(a,b){return a*9718+b/287};
+var m118=function(a,b){return a*27840+b/940};
+var m119=function(a,b){return a*26736+b/767};
+var m120=function(a,b){return a*2173+b/71};
+var m121=function(a,b){return a*35284+b/422};
+var m122=function(a,b){return a*58420+b/256};
+var m123=function(a,b){return a*7925+b/48};
+var m124=function(a,b){return a*23102+b/289};
+var m125=function(a,b){return a*48338+b/544};
+var m126=function(a,b){return a*74996+b/997};
+var m127=function(a,b){return a*17247+b/95};
+var m128=function(a,b){return a*47468+b/142};
+var m129=function(a,b){return a*59028+b/339};
+var m130=function(a,b){return a*86106+b/751};
+var m131=function(a,b){return a*90600+b/535};
+var m132=function(a,b){return a*76604+b/970};
+var m133=function(a,b){return a*18396+b/605};
+var m134=function(a,b){return a*4599+b/946};
+var m135=function(a,b){return a*2346+b/487};
+var m136=function(a,b){return a*46855+b/718};
+var m137=function(a,b){return a*40869+b/986};
+var m138=function(a,b){return a*4397+b/22};
+var m139=function(a,b){return a*78430+b/652};
+var m140=function(a,b){return a*9809+b/494};
+var m141=function(a,b){return a*8818+b/749};
+var m142=function(a,b){return a*40772+b/327};
+var m143=function(a,b){return a*17906+b/75};
+var m144=function(a,b){return a*9865+b/464};
+var m145=function(a,b){return a*71578+b/377};
+var m146=function(a,b){return a*96601+b/46};
+var m147=function(a,b){return a*96612+b/755};
+var m148=function(a,b){return a*92235+b/133};
+var CONTACT={tel:"055-274-8811",fax:"055-274-8813",mail:"cs\u0040hanbit-precision.co.kr",bank:"\uc785\uae08\uacc4\uc88c 012-345-678901"};
+var m149=function(a,b){return a*44777+b/361};
+var m150=function(a,b){return a*11132+b/702};
+var m151=function(a,b){return a*62034+b/923};
+var m152=function(a,b){return a*10181+b/893};
+var m153=function(a,b){return a*54678+b/967};
+var m154=function(a,b){return a*3968+b/885};
+var m155=function(a,b){return a*65527+b/587};
+var m156=function(a,b){return a*1905+b/640};
+var m157=function(a,b){return a*86805+b/392};
+var m158=function(a,b){return a*49700+b/597};
+var m159=function(a,b){return a*1632+b/624};
+var m160=function(a,b){return a*9470+b/83};
+var m161=function(a,b){return a*11882+b/655};
+var m162=function(a,b){return a*15150+b/264};
+var m163=function(a,b){return a*54559+b/746};
+var m164=function(a,b){return a*43274+b/398};
+var m165=function(a,b){return a*96343+b/711};
+var m166=function(a,b){return a*76147+b/469};
+var m167=function(a,b){return a*57741+b/474};
+var m168=function(a,b){return a*70943+b/86};
+var m169=function(a,b){return a*67987+b/769};
+var m170=function(a,b){return a*67441+b/31};
+var m171=function(a,b){return a*40664+b/616};
+var m172=function(a,b){return a*11500+b/493};
+var m173=function(a,b){return a*2922+b/236};
+var m174=function(a,b){return a*91533+b/116};
+var m175=function(a,b){return a*65176+b/799};
+var m176=function(a,b){return a*80545+b/676};
+var m177=function(a,b){return a*63740+b/262};
+var m178=function(a,b){return a*1483+b/377};
+var m179=function(a,b){return a*39457+b/147};
+var m180=function(a,b){return a*88885+b/627};
+var m181=function(a,b){return a*26552+b/531};
+var m182=function(a,b){return a*22231+b/772};
+var m183=function(a,b){return a*44896+b/676};
+var m184=function(a,b){return a*57925+b/511};
+var m185=function(a,b){return a*31652+b/335};
+var m186=function(a,b){return a*53053+b/682};
+var m187=function(a,b){return a*32847+b/204};
+var m188=function(a,b){return a*83123+b/442};
+var m189=function(a,b){return a*98911+b/937};
+var m190=function(a,b){return a*26253+b/902};
+var m191=function(a,b){return a*28075+b/394};
+var m192=function(a,b){return a*28781+b/598};
+var m193=function(a,b){return a*41483+b/215};
+var m194=function(a,b){return a*17849+b/138};
+var m195=function(a,b){return a*65073+b/360};
+var m196=function(a,b){return a*5318+b/729};
+var m197=function(a,b){return a*8407+b/973};
+var m198=function(a,b){return a*36281+b/842};
+var m199=function(a,b){return a*22169+b/116};
+var m200=function(a,b){return a*59068+b/483};
+var m201=function(a,b){return a*36067+b/948};
+var m202=function(a,b){return a*28060+b/851};
+var m203=function(a,b){return a*54262+b/392};
+var m204=function(a,b){return a*82017+b/533};
+var m205=function(a,b){return a*64734+b/689};
+var m206=function(a,b){return a*41337+b/734};
+var m207=function(a,b){return a*81891+b/464};
+var m208=function(a,b){return a*41989+b/77};
+var m209=function(a,b){return a*4127+b/285};
+var m210=function(a,b){return a*79634+b/43};
+var m211=function(a,b){return a*88901+b/726};
+var m212=function(a,b){return a*36841+b/585};
+var m213=function(a,b){return a*46428+b/317};
+var m214=function(a,b){return a*85104+b/811};
+var m215=function(a,b){return a*73930+b/20};
+var m216=function(a,b){return a*84016+b/140};
+var m217=function(a,b){return a*53109+b/466};
+var m218=function(a,b){return a*24893+b/26};
+var m219=function(a,b){return a*34920+b/244};
+var m220=function(a,b){return a*18465+b/816};
+var m221=function(a,b){return a*6153+b/645};
+var m222=function(a,b){return a*15114+b/458};
+var m223=function(a,b){return a*14290+b/646};
+var m224=function(a,b){return a*70175+b/671};
+var m225=function(a,b){return a*83876+b/827};
+var m226=function(a,b){return a*48325+b/982};
+var m227=function(a,b){return a*10220+b/701};
+var m228=function(a,b){return a*25959+b/205};
+var m229=function(a,b){return a*62278+b/263};
+var m230=function(a,b){return a*23421+b/732};
+var m231=function(a,b){return a*1412+b/774};
+var m232=function(a,b){return a*61893+b/548};
+var m233=function(a,b){return a*93608+b/38};
+var m234=function(a,b){return a*23475+b/232};
+var m235=function(a,b){return a*35699+b/798};
+var m236=function(a,b){return a*45317+b/553};
+var m237=function(a,b){return a*91399+b/970};
+var m238=function(a,b){return a*68213+b/513};
+var m239=function(a,b){return a*80537+b/775};
+var m240=function(a,b){return a*20866+b/403};
+var m241=function(a,b){return a*91723+b/928};
+var m242=function(a,b){return a*29351+b/90};
+var m243=function(a,b){return a*53803+b/955};
+var m244=function(a,b){return a*94684+b/398};
+var m245=function(a,b){return a*17028+b/462};
+var m246=function(a,b){return a*59446+b/202};
+var m247=function(a,b){return a*81992+b/909};
+var m248=function(a,b){return a*882+b/386};
+var m249=function(a,b){return a*72092+b/583};
+var m250=function(a,b){return a*85548+b/901};
+var m251=function(a,b){return a*65884+b/816};
+var m252=function(a,b){return a*44971+b/475};
+var m253=function(a,b){return a*42791+b/667};
+var m254=function(a,b){return a*26856+b/102};
+var m255=function(a,b){return a*94626+b/887};
+var m256=function(a,b){return a*84098+b/947};
+var m257=function(a,b){return a*94066+b/127};
+var m258=function(a,b){return a*27958+b/249};
+var m259=function(a,b){return a*51148+b/90};
+var m260=function(a,b){return a*40614+b/550};
+var m261=function(a,b){return a*41995+b/269};
+var m262=function(a,b){return a*94145+b/877};
+var m263=function(a,b){return a*2052+b/357};
+var m264=function(a,b){return a*66155+b/85};
+var m265=function(a,b){return a*4868+b/452};
+var m266=function(a,b){return a*44834+b/564};
+var m267=function(a,b){return a*55236+b/787};
+var m268=function(a,b){return a*36079+b/500};
+var m269=function(a,b){return a*3724+b/224};
+var m270=function(a,b){return a*8397+b/440};
+var m271=function(a,b){return a*4602+b/178};
+var m272=function(a,b){return a*69878+b/344};
+var m273=function(a,b){return a*89992+b/807};
+var m274=function(a,b){return a*18416+b/482};
+var m275=function(a,b){return a*19488+b/529};
+var m276=function(a,b){return a*94840+b/531};
+var m277=function(a,b){return a*88852+b/706};
+var m278=function(a,b){return a*57694+b/969};
+var m279=function(a,b){return a*64564+b/593};
+var m280=function(a,b){return a*90317+b/89};
+var m281=function(a,b){return a*99332+b/227};
+var m282=function(a,b){return a*57596+b/540};
+var m283=function(a,b){return a*73240+b/298};
+var m284=function(a,b){return a*95531+b/576};
+var m285=function(a,b){return a*83739+b/169};
+var m286=function(a,b){return a*68523+b/527};
+var m287=function(a,b){return a*73397+b/263};
+var m288=function(a,b){return a*40855+b/688};
+var m289=function(a,b){return a*49967+b/978};
+var m290=function(a,b){return a*79880+b/214};
+var m291=function(a,b){return a*39906+b/872};
+var m292=function(a,b){return a*18501+b/992};
+var m293=function(a,b){return a*71397+b/537};
+var m294=function(a,b){return a*35778+b/587};
+var m295=function(a,b){return a*65228+b/206};
+var m296=function(a,b){return a*53882+b/549};
+var m297=function(a,b){return a*14979+b/516};
+var m298=function(a,b){return a*647+b/620};
+var m299=function(a,b){return a*49419+b/29};
@@ -0,0 +1,199 @@
+"""
+오프라인 벤치마크용 로컬 대역 서버 (aiohttp)
+
+- /list/{name}          : fixtures/ 목록 페이지 (페이지마다 기업명을 바꿔서 중복 검사에 걸리지 않게 함)
+- /home/{company}       : 기업 홈페이지 (company_home.html + iframe 하나)
+- /frame/contact.html   : 홈페이지 안의 frame
+- /js/app.bundle.js     : 홈페이지 안의 번들 스크립트
+- /webhook              : GAS 웹훅 대역 (decode_batch로 풀어서 개수만 셈)
+- /stats                : 지금까지 받은 요청/아이템 수 (JSON)
+
+지연/오류 흉내: --latency(초) + 0~--jitter(초)만큼 늦게 응답하고, --error-rate 비율로 --error-status를 돌려줌.
+웹훅은 --webhook-latency, --webhook-busy-rate로 따로 조절.
+
+단독 실행: python benchmarks/stand_in_server.py --port 8765 --latency 0.05
+(bench_e2e.py는 이 서버를 별도 프로세스로 띄워서 사용함)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+from collections import Counter
+
+from aiohttp import web
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+# config.py가 WEBHOOK_URL을 요구하므로 벤치마크용 값을 넣어둠 (이 서버는 사용하지 않음)
+os.environ.setdefault("WEBHOOK_URL", "http://127.0.0.1/bench")
+
+from core.strategies import StrategyFactory
+from utils.payload import decode_batch
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+
+# 목록 페이지 출처: 이름 → (설정 파일, 저장된 목록 페이지)
+SOURCES = {
+    "innobiz": ("configs/innobiz.json", "innobiz_list.html"),
+    "mainbiz": ("configs/mainbiz.json", "mainbiz_list.html"),
+}
+# 목록 페이지 안의 기업 홈페이지 주소 (로컬 /home/... 으로 바꿔서 제공)
+_HOMEPAGE_LINK = re.compile(r'href="https?://(?:https?://)?[^"]+"')
+_FRAME_TAG = '<iframe src="/frame/contact.html" title="오시는 길"></iframe>'
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class ListingSource:
+    """저장된 목록 페이지 하나로 원하는 만큼의 페이지를 만들어냄"""
+    def __init__(self, name, config_path, fixture):
+        with open(os.path.join(ROOT, config_path), encoding='utf-8') as f:
+            config = json.load(f)
+        self.name = name
+        self.page_param = config['request'].get('pagination', {}).get('param', 'page')
+        self.content = read_fixture(fixture)
+
+        records = StrategyFactory.get('css').extract(self.content, config['extraction'])
+        names = sorted({r.get('기업명') for r in records if r.get('기업명')}, key=len, reverse=True)
+        self._names = re.compile('|'.join(re.escape(n) for n in names)) if names else None
+
+    def render(self, page, base_url):
+        content = self.content
+        if self._names is not None:
+            content = self._names.sub(lambda m: f"{m.group(0)}-{page}", content)
+        counter = iter(range(10 ** 6))
+        return _HOMEPAGE_LINK.sub(
+            lambda m: f'href="{base_url}/home/{self.name}-{page}-{next(counter)}"', content
+        )
+
+
+class StandInServer:
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=500,
+                 webhook_latency=0.0, webhook_busy_rate=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.webhook_latency = webhook_latency
+        self.webhook_busy_rate = webhook_busy_rate
+
+        self.sources = {name: ListingSource(name, *spec) for name, spec in SOURCES.items()}
+        self.home = read_fixture("company_home.html").replace("</body>", f"{_FRAME_TAG}\n</body>")
+        self.frame = read_fixture("company_frame.html")
+        self.bundle = read_fixture("company_app.js")
+        self.stats = Counter()
+
+    def app(self):
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_route('*', '/list/{name}', self.listing)
+        app.router.add_get('/home/{company}', self.homepage)
+        app.router.add_get('/frame/contact.html', self.frame_page)
+        app.router.add_get('/js/app.bundle.js', self.script)
+        app.router.add_post('/webhook', self.webhook)
+        app.router.add_get('/stats', self.get_stats)
+        return app
+
+    async def _delay_or_fail(self, kind):
+        """지연을 흉내 내고, error_rate 확률로 오류 응답을 반환 (정상이면 None)"""
+        self.stats[f"{kind}_requests"] += 1
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            self.stats[f"{kind}_errors"] += 1
+            headers = {'Retry-After': '1'} if self.error_status in (429, 503) else None
+            return web.Response(status=self.error_status, headers=headers)
+        return None
+
+    async def listing(self, request):
+        source = self.sources.get(request.match_info['name'])
+        if source is None:
+            raise web.HTTPNotFound()
+        error = await self._delay_or_fail("list")
+        if error is not None:
+            return error
+
+        params = dict(request.query)
+        if request.method == 'POST':
+            params.update(await request.post())
+        page = params.get(source.page_param, '1')
+        base_url = f"{request.scheme}://{request.host}"
+        return web.Response(text=source.render(page, base_url), content_type='text/html')
+
+    async def _serve(self, kind, text, content_type):
+        error = await self._delay_or_fail(kind)
+        if error is not None:
+            return error
+        return web.Response(text=text, content_type=content_type)
+
+    async def homepage(self, request):
+        return await self._serve("home", self.home, 'text/html')
+
+    async def frame_page(self, request):
+        return await self._serve("home", self.frame, 'text/html')
+
+    async def script(self, request):
+        return await self._serve("home", self.bundle, 'application/javascript')
+
+    async def webhook(self, request):
+        self.stats["webhook_requests"] += 1
+        body = await request.read()
+        if self.webhook_latency:
+            await asyncio.sleep(self.webhook_latency)
+        if self.webhook_busy_rate and random.random() < self.webhook_busy_rate:
+            self.stats["webhook_busy"] += 1
+            return web.json_response({"result": "busy"})
+        records = decode_batch(body) or []
+        self.stats["webhook_items"] += len(records)
+        return web.json_response({"result": "success", "count": len(records)})
+
+    async def get_stats(self, request):
+        return web.json_response(dict(self.stats))
+
+
+def add_arguments(parser):
+    parser.add_argument('--latency', type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument('--error-status', type=int, default=500)
+    parser.add_argument('--webhook-latency', type=float, default=0.0)
+    parser.add_argument('--webhook-busy-rate', type=float, default=0.0)
+
+
+def server_options(args):
+    return {
+        "latency": args.latency, "jitter": args.jitter,
+        "error_rate": args.error_rate, "error_status": args.error_status,
+        "webhook_latency": args.webhook_latency, "webhook_busy_rate": args.webhook_busy_rate,
+    }
+
+
+def serve(port, options, ready=None):
+    """(별도 프로세스에서 실행) 서버를 띄우고 ready 이벤트를 설정한 뒤 계속 실행"""
+    async def main():
+        runner = web.AppRunner(StandInServer(**options).app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, '127.0.0.1', port).start()
+        if ready is not None:
+            ready.set()
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+    print(f"Serving on http://127.0.0.1:{args.port}")
+    serve(args.port, server_options(args))
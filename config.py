@@ -38,4 +38,106 @@ BROWSER_CONFIG = {
         "--ignore-certificate-errors", 
         "--enable-features=NetworkService,NetworkServiceInProcess"
     ]
-}
\ No newline at end of file
+}
+
+# 심층 크롤링(기업 홈페이지)용 공유 HTTP 커넥션 풀 설정
+# 설정 파일의 "http_pool" 항목으로 사이트별 덮어쓰기 가능
+HTTP_POOL_CONFIG = {
+    "limit": 100,             # 전체 동시 연결 수
+    "limit_per_host": 4,      # 호스트 하나당 동시 연결 수
+    "ttl_dns_cache": 300,     # DNS 조회 결과 캐시 시간(초)
+    "keepalive_timeout": 30   # 사용 끝난 연결을 재사용하려고 열어두는 시간(초)
+}
+
+# 업로드 대기 배치 보관함 (전송 성공 전까지 디스크에 보관, 다음 실행 때 재전송)
+OUTBOX_CONFIG = {
+    "path": os.path.join("states", "upload_outbox.db"),
+    "buffer_size": 2000,      # 메모리 큐 최대 아이템 수 (가득 차면 크롤러가 대기)
+    "max_replays": 5          # 재시작 시 재전송을 시도할 최대 실패 횟수 (넘으면 보관만 함)
+}
+
+# GAS 웹훅 업로드 설정
+UPLOAD_CONFIG = {
+    "max_in_flight": 3,       # 동시에 전송 중일 수 있는 배치 수
+    "batch_size": 150,        # 시작 배치 크기 (응답 속도에 따라 자동 조절)
+    "min_batch_size": 50,
+    "max_batch_size": 500,
+    "increase_step": 25,      # 빠르게 성공하면 늘리는 양
+    "decrease_factor": 0.5,   # busy/429/느린 응답이면 곱하는 값
+    "target_latency": 8.0,    # 이보다 오래 걸린 응답은 '느림'으로 봄 (초)
+    "max_retries": 10,
+    "timeout": 45,
+    "format": "rows",         # "columnar"면 헤더+값 배열로 전송 (GAS에 README의 decodeBatch 필요)
+    "gzip": False,            # True면 gzip+base64로 감싸서 전송. README GAS 코드의 최신 decodeBatch가 배포돼 있어야 함
+                              # (예전 코드로는 모든 배치가 no_data로 실패해 보관함에 쌓임)
+    "report_interval": 30     # 전송 속도 로그 주기 (초)
+}
+
+# 브라우저 수집 시 차단할 리소스 (설정 파일 request.resource_policy가 true거나 딕셔너리일 때 적용)
+# stylesheet는 요소가 보이는지(visible) 판정이나 클릭 위치에 영향을 줄 수 있어 기본값에서 제외
+RESOURCE_POLICY = {
+    "block_types": ["image", "media", "font"],
+    "block_patterns": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*adservice.google.*", "*facebook.net*",
+        "*connect.facebook.com*", "*wcs.naver.net*", "*analytics.kakao.com*",
+        "*hotjar.com*", "*clarity.ms*", "*criteo.*", "*/gtag/js*"
+    ],
+    "wait_until": "domcontentloaded",  # networkidle 대신 DOM만 준비되면 진행
+    "wait_for": None,                  # 이 선택자가 보일 때까지 추가로 대기 (예: "table.list")
+    "baseline_pages": 0                # 처음 N번은 차단 없이 로드해서 절약량 비교 기준으로 씀
+}
+
+# 브라우저 저장 상태(쿠키, localStorage) 보관 설정
+# 설정 파일의 "browser_state": false 로 끄거나 {"ttl_hours": 6} 처럼 사이트별로 덮어쓰기 가능
+BROWSER_STATE_CONFIG = {
+    "dir": "states",          # states/browser_{domain_group}.json 으로 저장
+    "ttl_hours": 12           # 저장한 지 이 시간이 지나면 버리고 새로 시작
+}
+
+# 도메인별 요청 속도 제한 (목록 페이지: domain_group 단위, 설정 파일 "rate_limit"으로 덮어쓰기 / false면 끔)
+RATE_LIMIT_CONFIG = {
+    "initial_rate": 2.0,      # 시작 속도 (초당 요청 수)
+    "min_rate": 0.2,          # 아무리 느려져도 이 밑으로는 안 내려감
+    "max_rate": 8.0,          # 아무리 빨라져도 이 위로는 안 올라감
+    "burst": 2,               # 쉬었다가 한꺼번에 보낼 수 있는 요청 수
+    "increase_step": 0.05,    # 성공이 이어질 때 1초마다 올리는 속도
+    "decrease_factor": 0.5,   # 429/503/타임아웃/Retry-After를 받으면 곱하는 값
+    "jitter": 0.3             # 요청 간격에 더하는 무작위 비율 (0.3 = 최대 30%)
+}
+
+# 심층 크롤링(기업 홈페이지) 호스트별 속도 제한 (RATE_LIMIT_CONFIG 위에 덮어씀)
+HOST_RATE_LIMIT_CONFIG = {
+    "initial_rate": 4.0,
+    "max_rate": 10.0,
+    "burst": 4,               # 홈페이지 + frame/script를 몇 개까지 바로 받을지
+    "idle_seconds": 300       # 이 시간 동안 요청이 없던 호스트의 속도 제한기는 메모리에서 뺌 (통계는 합계에 남음)
+}
+
+# 목록 페이지 요청 재시도 (설정 파일 "retry"로 덮어쓰기)
+RETRY_CONFIG = {
+    "classes": {                                           # 여기 없는 오류(404 등 4xx, 파싱 오류)는 재시도 안 함
+        "throttle": {"attempts": 4, "base_delay": 5},      # 429, 503
+        "server":   {"attempts": 3, "base_delay": 2},      # 그 밖의 5xx
+        "timeout":  {"attempts": 3, "base_delay": 2},
+        "network":  {"attempts": 3, "base_delay": 1}       # 연결 끊김, 응답 중단 등
+    },
+    "max_delay": 60,          # 한 번에 기다리는 최대 시간(초)
+    "max_page_attempts": 3    # 재시도 후에도 실패한 페이지를 다시 돌려볼 최대 횟수 (넘으면 포기)
+}
+
+# 목록 페이지 추출/연락처 스캔을 돌리는 프로세스 풀 (이벤트 루프를 막지 않도록 별도 프로세스에서 파싱)
+PARSE_POOL_CONFIG = {
+    "workers": None,              # 워커 프로세스 수 (None이면 CPU 수 - 1, 0이면 끄고 이벤트 루프에서 바로 실행)
+    "inline_below_bytes": 16384   # 이보다 작은 내용은 프로세스 간 전달 비용이 더 커서 그냥 바로 실행
+}
+
+# 단계별 처리 시간/처리량 지표 (main.py --metrics, --metrics-port 로도 켤 수 있음)
+METRICS_CONFIG = {
+    "enabled": False,             # 꺼져 있으면 기록하지 않음 (오버헤드 거의 없음)
+    "host": "127.0.0.1",
+    "port": None,                 # 숫자를 넣으면 http://host:port/metrics (Prometheus), /metrics.json 제공
+    "snapshot_path": os.path.join("states", "metrics.json"),  # 주기적으로 저장하는 JSON 스냅샷 (None이면 끔)
+    "snapshot_interval": 30,      # 스냅샷 저장 주기 (초)
+    "buckets": [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]  # 지연 히스토그램 경계 (초)
+}
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+
+from .resource_policy import ResourcePolicy
+from .capture import ResponseCapture
+
+
+class _Tab:
+    __slots__ = ('page', 'context', 'current', 'capture')
+
+    def __init__(self):
+        self.page = None
+        self.context = None
+        self.capture = None
+        # 이 탭이 지금 보여주고 있는 페이지 번호 (None이면 설정 액션부터 다시 실행)
+        self.current = None
+
+
+class BrowserTabPool:
+    """
+    `type: browser` 수집에서 탭을 재사용하며 페이지를 넘기는 풀.
+
+    설정 파일의 request.browser_session 예:
+
+        "browser_session": {
+          "tabs": 2,                     // 동시에 쓸 탭 수 (기본: concurrency)
+          "isolate": false,              // true면 탭마다 컨텍스트(쿠키/저장소)를 따로 씀
+          "wait_for_change": "div.list", // 페이지를 넘긴 뒤 이 요소 내용이 바뀔 때까지 대기
+          "next_page": [                 // 다음 페이지로 넘기는 액션 ({page} = 이동할 페이지 번호)
+            { "type": "click", "selector": "a.page[data-page='{page}']" }
+          ],
+          "jumpable": false              // (생략 가능) {page}가 있어도 한 페이지씩만 넘김
+        }
+
+    탭마다 처음 한 번만 url 접속 + actions(검색 조건 설정 등)를 실행하고,
+    이후에는 next_page 액션만 실행함. next_page에 {page}가 있으면 원하는 페이지로 바로 이동하고,
+    없으면 '다음' 버튼으로 보고 필요한 만큼 반복함.
+    페이지 번호가 일부(1~10)만 보이는 페이저처럼 아무 페이지로나 갈 수 없으면 "jumpable": false로
+    {page}를 쓰더라도 바로 다음 페이지로만 넘기게 함.
+    한 페이지씩만 넘길 수 있으면 탭마다 앞 페이지를 전부 다시 넘겨야 하므로 탭을 1개로 고정하고,
+    기다리는 요청 중 가장 앞 페이지부터 처리함 (뒤 페이지를 먼저 넘기면 처음부터 다시 설정해야 함).
+    뒤로 가야 하거나 넘기다 실패한 탭은 설정 액션부터 다시 실행함.
+    """
+    def __init__(self, fetcher, req_config, logger=None):
+        self.fetcher = fetcher
+        self.logger = logger or logging.getLogger("BrowserTabPool")
+
+        session = req_config.get('browser_session') or {}
+        pagination = req_config.get('pagination', {})
+        self.size = max(1, int(session.get('tabs', 1)))
+        self.isolate = session.get('isolate', False)
+        self.wait_for_change = session.get('wait_for_change')
+        self.next_page_actions = session.get('next_page', [])
+        self.jumpable = session.get(
+            'jumpable', any('{page}' in str(v) for action in self.next_page_actions for v in action.values())
+        )
+        if not self.jumpable and self.size > 1:
+            self.logger.warning(
+                f"⚠️ browser_session: next_page only turns one page at a time, so {self.size} tabs "
+                f"would each re-turn every earlier page. Using 1 tab."
+            )
+            self.size = 1
+        self.policy = ResourcePolicy.from_config(req_config)
+        self.capture = ResponseCapture.from_config(req_config)
+        self.start_page = pagination.get('start', 1)
+        self.step = pagination.get('step', 1)
+
+        self._tabs = []
+        self._idle = []
+        self._waiting = []
+        self._available = asyncio.Condition()
+
+        # 통계
+        self.pages = 0
+        self.setups = 0
+        self.turns = 0
+
+    async def fetch(self, config, page_num):
+        tab = await self._acquire(page_num)
+        try:
+            if tab.capture:
+                tab.capture.arm()
+            moved = await self._move_to(tab, config, page_num)
+            if tab.capture:
+                # 페이지를 넘기지 않았으면(이미 그 페이지) 마지막으로 받은 응답을 그대로 씀
+                content = await tab.capture.json(fresh=moved)
+            else:
+                content = await tab.page.content()
+            self.pages += 1
+            return content
+        except Exception:
+            # 어느 페이지에 있는지 알 수 없으므로 다음에 처음부터 다시 설정
+            tab.current = None
+            raise
+        finally:
+            await self._release(tab)
+
+    async def _acquire(self, page_num):
+        """넘겨야 할 페이지 수가 가장 적은 탭을 고름 (모두 사용 중이면 새로 만들거나 대기)"""
+        async with self._available:
+            self._waiting.append(page_num)
+            try:
+                while True:
+                    # 한 페이지씩만 넘길 수 있으면 기다리는 요청 중 가장 앞 페이지가 먼저 탭을 씀
+                    if self.jumpable or page_num == min(self._waiting):
+                        if self._idle:
+                            tab = min(self._idle, key=lambda t: self._cost(t, page_num))
+                            self._idle.remove(tab)
+                            return tab
+                        if len(self._tabs) < self.size:
+                            tab = _Tab()
+                            self._tabs.append(tab)
+                            return tab
+                    await self._available.wait()
+            finally:
+                self._waiting.remove(page_num)
+                if self._idle or len(self._tabs) < self.size:
+                    # 취소된 요청이 가장 앞 페이지였으면 다음 요청이 탭을 쓸 수 있게 깨움
+                    self._available.notify_all()
+
+    async def _release(self, tab):
+        async with self._available:
+            self._idle.append(tab)
+            self._available.notify_all()
+
+    def _cost(self, tab, page_num):
+        if tab.current is None or tab.current > page_num:
+            return float('inf')
+        if self.jumpable:
+            return 0 if tab.current == page_num else 1
+        return (page_num - tab.current) // self.step
+
+    async def _move_to(self, tab, config, page_num):
+        if tab.page is None or tab.page.is_closed():
+            if self.isolate:
+                tab.context = await self.fetcher.new_context()
+            tab.page = await self.fetcher.new_page(tab.context, policy=self.policy)
+            tab.capture = self.capture.attach(tab.page) if self.capture else None
+            tab.current = None
+
+        moved = False
+        if tab.current is None or tab.current > page_num:
+            await self._setup(tab, config)
+            moved = True
+
+        if tab.current == page_num:
+            return moved
+        if self.jumpable:
+            await self._turn(tab, page_num)
+        else:
+            for target in range(tab.current + self.step, page_num + 1, self.step):
+                await self._turn(tab, target)
+        tab.current = page_num
+        return True
+
+    async def _setup(self, tab, config):
+        self.logger.debug(f"Tab setup: {config['url']}")
+        try:
+            started = await self.fetcher.open_url(tab.page, config['url'], self.policy)
+            if 'actions' in config:
+                await self.fetcher.run_actions(tab.page, config['actions'])
+        except Exception as e:
+            # 저장된 상태로 로그인/검색 설정이 안 되는 것일 수 있으므로 버림 (다른 탭도 처음부터)
+            await self.fetcher.invalidate_state(f"tab setup failed ({type(e).__name__})")
+            self.reset()
+            raise
+        self.fetcher.finish_load(tab.page, started)
+        tab.current = self.start_page
+        self.setups += 1
+
+    def reset(self):
+        """모든 탭이 다음 요청 때 설정 액션부터 다시 실행하게 함 (쿠키를 비웠을 때)"""
+        for tab in self._tabs:
+            tab.current = None
+
+    async def _turn(self, tab, target):
+        if not self.next_page_actions:
+            raise ValueError("browser_session.next_page is not configured")
+
+        before = None
+        if self.wait_for_change:
+            before = await tab.page.evaluate(
+                "(sel) => { const el = document.querySelector(sel); return el ? el.innerText : null; }",
+                self.wait_for_change
+            )
+        started = self.fetcher.begin_load(tab.page)
+        await self.fetcher.run_actions(tab.page, self.next_page_actions, page_num=target)
+        if self.wait_for_change:
+            await tab.page.wait_for_function(
+                "([sel, before]) => { const el = document.querySelector(sel); return el && el.innerText !== before; }",
+                arg=[self.wait_for_change, before],
+                timeout=15000
+            )
+        self.fetcher.finish_load(tab.page, started)
+        tab.current = target
+        self.turns += 1
+
+    async def close(self):
+        if self.pages:
+            self.logger.info(
+                f"🧭 Browser session: {self.pages} pages with {len(self._tabs)} tabs, "
+                f"{self.setups} setups, {self.turns} page turns"
+            )
+        for tab in self._tabs:
+            try:
+                if tab.page is not None and not tab.page.is_closed():
+                    await tab.page.close()
+                if tab.context is not None:
+                    await tab.context.close()
+            except Exception:
+                pass
+        self._tabs = []
+        self._idle = []
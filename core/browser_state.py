@@ -0,0 +1,76 @@
+import os
+import json
+import time
+import logging
+
+from config import BROWSER_STATE_CONFIG
+
+
+class BrowserStateStore:
+    """
+    브라우저 컨텍스트의 저장 상태(쿠키, localStorage)를 domain_group별 파일로 보관.
+
+    다음 실행 때 같은 상태로 컨텍스트를 만들어서 로그인/보안 확인을 다시 하지 않게 함.
+    - 저장한 지 ttl_hours가 지난 파일은 버림. 복원한 상태를 다시 저장할 때는 처음 저장 시각을 그대로 두므로
+      계속 실행해도 만료가 미뤄지지 않음 (새로 warm-up/로그인해서 얻은 상태만 fresh=True로 시각을 갱신)
+    - 만료 시각이 지난 쿠키는 복원하지 않음
+    - 보안 확인 페이지를 다시 만나는 등 상태가 더 이상 통하지 않으면 invalidate()로 삭제
+    """
+    def __init__(self, key, config=None, logger=None):
+        options = dict(BROWSER_STATE_CONFIG)
+        options.update(config or {})
+        self.path = os.path.join(options['dir'], f"browser_{key}.json")
+        self.ttl = options['ttl_hours'] * 3600
+        self.logger = logger or logging.getLogger("BrowserState")
+        self.user_agent = None
+        # 지금 들고 있는 상태를 처음 얻은 시각 (복원했거나 저장한 적 없으면 None)
+        self.saved_at = None
+
+    def load(self):
+        """유효한 저장 상태(Playwright storage_state 형식)를 반환, 없으면 None"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Browser state unreadable, ignoring: {e}")
+            return None
+
+        age = time.time() - saved.get('saved_at', 0)
+        if age > self.ttl:
+            self.logger.info(f"⌛ Browser state expired ({age / 3600:.1f}h old). Starting fresh.")
+            self.invalidate()
+            return None
+
+        state = saved.get('state') or {}
+        now = time.time()
+        cookies = [c for c in state.get('cookies', []) if c.get('expires', -1) in (-1, None) or c['expires'] > now]
+        if not cookies and not state.get('origins'):
+            return None
+        state['cookies'] = cookies
+        self.user_agent = saved.get('user_agent')
+        self.saved_at = saved.get('saved_at')
+        self.logger.info(f"♻️ Restored browser state ({age / 3600:.1f}h old, {len(cookies)} cookies)")
+        return state
+
+    def save(self, state, user_agent=None, fresh=False):
+        """fresh: 이번 실행에서 새로 warm-up/로그인해서 얻은 상태 (아니면 복원한 상태의 저장 시각 유지)"""
+        if user_agent:
+            self.user_agent = user_agent
+        if fresh or self.saved_at is None:
+            self.saved_at = time.time()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # 같은 domain_group을 여러 프로세스가 동시에 저장할 수 있으므로 임시 파일은 프로세스별로
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': self.saved_at, 'user_agent': self.user_agent, 'state': state}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def invalidate(self):
+        self.user_agent = None
+        self.saved_at = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
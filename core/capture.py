@@ -0,0 +1,76 @@
+import re
+import asyncio
+import fnmatch
+
+
+class CaptureTimeout(Exception):
+    """capture.url_pattern에 맞는 응답이 오지 않음 (대부분 설정 문제라 재시도/감속하지 않음).
+    TimeoutError를 상속하지 않아야 네트워크 타임아웃으로 분류되지 않음"""
+
+
+class ResponseCapture:
+    """
+    브라우저가 백그라운드로 호출하는 API 응답(JSON)을 가로채는 설정.
+
+    설정 파일 request.capture:
+        "capture": {
+          "url_pattern": "*/api/search*",   // 가로챌 응답 URL (와일드카드 *)
+          "resource_types": ["xhr", "fetch"],
+          "timeout": 15,                    // 응답을 기다리는 최대 시간(초)
+          "settle": 0.5                     // 이 시간 동안 새 응답이 없으면 마지막 응답을 사용
+        }
+
+    capture가 있으면 page.content() 대신 마지막으로 받은 응답의 JSON을 반환하므로,
+    extraction은 "strategy": "json" + "base_path"로 설정함.
+    """
+    def __init__(self, spec):
+        self.pattern = re.compile(fnmatch.translate(spec['url_pattern']))
+        self.resource_types = set(spec.get('resource_types', ['xhr', 'fetch']))
+        self.timeout = spec.get('timeout', 15)
+        self.settle = spec.get('settle', 0.5)
+
+    @classmethod
+    def from_config(cls, req_config):
+        spec = req_config.get('capture')
+        return cls(spec) if spec else None
+
+    def matches(self, response):
+        return response.request.resource_type in self.resource_types and bool(self.pattern.match(response.url))
+
+    def attach(self, page):
+        return PageCapture(page, self)
+
+
+class PageCapture:
+    """탭 하나에서 조건에 맞는 응답 중 가장 최근 것을 기억"""
+    def __init__(self, page, capture):
+        self.capture = capture
+        self._latest = None
+        self._arrived = asyncio.Event()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if self.capture.matches(response):
+            self._latest = response
+            self._arrived.set()
+
+    def arm(self):
+        """이후에 도착하는 응답만 기다리도록 표시 (마지막 응답은 남겨둠)"""
+        self._arrived.clear()
+
+    async def json(self, fresh=True):
+        """응답이 도착하고 settle 동안 더 오지 않으면 마지막 응답의 JSON 반환"""
+        if fresh or self._latest is None:
+            try:
+                await asyncio.wait_for(self._arrived.wait(), self.capture.timeout)
+            except asyncio.TimeoutError:
+                raise CaptureTimeout(
+                    f"No response matched capture pattern within {self.capture.timeout}s"
+                ) from None
+            while True:
+                self._arrived.clear()
+                try:
+                    await asyncio.wait_for(self._arrived.wait(), self.capture.settle)
+                except asyncio.TimeoutError:
+                    break
+        return await self._latest.json()
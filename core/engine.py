@@ -1,132 +1,271 @@
 import asyncio
 import logging
 import json
-import random
 import copy
 from urllib.parse import urlparse
 
-from .network import AsyncFetcher
-from .strategies import StrategyFactory
+from .network import AsyncFetcher, create_pooled_session
+from .strategies import StrategyFactory, extract_records
+from .parse_pool import ParsePool
+from .extraction_plan import node_field_names
 from .hooks import HookManager
+from .scheduler import PageScheduler
+from .pipeline import DeepCrawlStage
+from .retry import RetryPolicy
+from config import RETRY_CONFIG, RATE_LIMIT_CONFIG
 from utils.data_processor import DataProcessor
 from utils.state_manager import StateManager
 from utils.smart_extractor import SmartExtractor
+from utils.metrics import Metrics
 
 class GenericAsyncCrawler:
-    def __init__(self, config_path):
+    def __init__(self, config_path, shard=None, rate_share=1.0):
         with open(config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
             
         self.name = self.config.get('name', 'Unknown')
         self.domain_group = self.config.get('domain_group', 'default')
+
+        # 페이지 범위 분할 (shard_index, shard_count). 샤드마다 체크포인트/실패 목록 키가 따로 있음
+        self.shard_index, self.shard_count = shard or (0, 1)
+        self.shard_suffix = f"_s{self.shard_index}of{self.shard_count}" if self.shard_count > 1 else ""
         
-        self.logger = logging.getLogger(f"Crawler_{self.name}")
+        self.logger = logging.getLogger(f"Crawler_{self.name}{self.shard_suffix}")
+
+        rate_limit = self.config.get('rate_limit')
+        if rate_limit is not False and rate_share < 1:
+            # 같은 도메인을 여러 프로세스가 나눠 치므로, 도메인 전체 속도가 한 프로세스일 때와 같도록
+            # 이 프로세스 몫(rate_share = 이 프로세스의 샤드 수 / 전체 샤드 수)만큼만 씀.
+            # 같은 프로세스의 샤드끼리는 domain_group 속도 제한기 하나를 같이 쓰므로 샤드 수로 나누지 않음
+            rate_limit = {**RATE_LIMIT_CONFIG, **(rate_limit if isinstance(rate_limit, dict) else {})}
+            for key in ('initial_rate', 'min_rate', 'max_rate', 'increase_step'):
+                rate_limit[key] = rate_limit[key] * rate_share
         
-        self.fetcher = AsyncFetcher(f"Fetcher_{self.name}")
+        self.fetcher = AsyncFetcher(
+            f"Fetcher_{self.name}{self.shard_suffix}",
+            state_key=self.domain_group,
+            state_config=self.config.get('browser_state'),
+            rate_limit=rate_limit
+        )
         self.processor = DataProcessor(source_name=self.name)
-        self.state_manager = StateManager(self.domain_group)
+        self.state_manager = StateManager(self.domain_group, identity_fields=self.config.get('identity_fields'))
         self.hook_manager = HookManager(self.config.get('hooks_file'))
         self.extractor = SmartExtractor()
         self.concurrency = self.config.get('concurrency', 3)
-        self.semaphore = asyncio.Semaphore(self.concurrency)
+        browser_session = self.config['request'].get('browser_session')
+        if browser_session is not None:
+            # 탭 수를 따로 정하지 않으면 동시에 수집하는 페이지 수만큼 탭을 씀
+            browser_session.setdefault('tabs', self.concurrency)
+        # '> node' 필드는 훅에 파싱된 요소를 넘기기 위한 것이라 저장 전에 제거
+        self.node_fields = node_field_names(self.config['extraction'])
+
+        # 목록 페이지 재시도: 요청 단위 백오프 + 끝내 실패한 페이지는 state DB에 보관 후 재수집
+        self.retry_policy = RetryPolicy(self.config.get('retry'), logger=self.logger)
+        self.max_page_attempts = {**RETRY_CONFIG, **(self.config.get('retry') or {})}['max_page_attempts']
+        self.failed_key = f"{self.name}{self.shard_suffix}"
+        self._page_errors = {}
+        self.pages_recovered = 0
+        self.pages_abandoned = 0
+
+        self.deep_stage = None
+        if self.config.get('deep_crawl', False):
+            self.deep_stage = DeepCrawlStage(
+                self.extractor,
+                self.processor,
+                concurrency=self.config.get('deep_crawl_concurrency', 5),
+                queue_size=self.config.get('deep_crawl_queue_size'),
+                logger=self.logger
+            )
+            Metrics.register_gauge(
+                "crawler_queue_items", self.deep_stage.queue.qsize, queue="deep_crawl", crawler=self.name
+            )
 
     async def run(self):
         self.logger.info(f"🚀 Start Crawling: {self.name} (Max {self.concurrency} threads)")
         
         try:
             await self.hook_manager.run("on_start", self.fetcher)
+            if self.deep_stage:
+                # 모든 기업 홈페이지 요청이 하나의 커넥션 풀을 재사용하도록 세션 주입
+                self.extractor.session = create_pooled_session(self.config.get('http_pool'))
+                self.deep_stage.start()
             
-            tasks = []
             req_config = self.config['request']
             pagination = req_config.get('pagination', {})
             
             if pagination:
-                start = pagination.get('start', 1)
-                end = pagination.get('max_page', 10)
+                # 샤드 i/n은 start+i*step부터 n칸씩 건너뛰며 맡음 (페이지마다 응답 시간이 달라도 고르게 나뉨)
                 step = pagination.get('step', 1)
+                scheduler = PageScheduler(
+                    self.state_manager,
+                    f"{self.name}_progress{self.shard_suffix}",
+                    start=pagination.get('start', 1) + self.shard_index * step,
+                    end=pagination.get('max_page', 10),
+                    step=step * self.shard_count,
+                    concurrency=self.concurrency,
+                    logger=self.logger
+                )
+                # 구버전 체크포인트는 분할하지 않은 실행에서만 이어받음
+                await scheduler.load(legacy_key=f"{self.name}_last_page" if self.shard_count == 1 else None)
 
-                checkpoint_key = f"{self.name}_last_page"
-                last_page = await self.state_manager.get_checkpoint(checkpoint_key)
-
-                if last_page:
-                    start = int(last_page)
-                    self.logger.info(f"🔄 이어하기 감지: {start}페이지부터 다시 시작합니다. (Last: {last_page})")
+                # 지난 실행에서 실패로 남은 페이지부터 다시 시도
+                await self.retry_failed_pages("Startup")
 
-                if start > end:
-                     self.logger.info(f"✨ 이미 모든 페이지({end}) 수집이 완료되었습니다.")
+                if scheduler.is_finished:
+                     self.logger.info(f"✨ 이미 모든 페이지({scheduler.end}) 수집이 완료되었습니다.")
                      return
-                
-                for page in range(start, end + 1, step):
-                    tasks.append(self.process_page(page))
-            else:
-                tasks.append(self.process_page(1))
 
-            await asyncio.gather(*tasks)
+                if scheduler.watermark >= scheduler.start or scheduler.done:
+                    self.logger.info(f"🔄 이어하기 감지: {scheduler.next_page}페이지부터 다시 시작합니다. (완료 {scheduler.watermark}, 선행 완료 {len(scheduler.done)}개)")
+
+                await scheduler.run(self.process_page, on_failure=self.record_failed_page)
+                await self.retry_failed_pages("End-of-run")
+            else:
+                await self.process_page(1)
             
         except Exception as e:
             self.logger.error(f"Critical Error in {self.name}: {e}")
         finally:
+            await self._report_retries()
+            if self.deep_stage:
+                await self.deep_stage.close()
+            if self.extractor.session:
+                await self.extractor.session.close()
+                self.extractor.session = None
             await self.processor.flush()
+            await self.state_manager.close()
             await self.fetcher.close()
             await self.hook_manager.run("on_finish")
             self.logger.info(f"🏁 Finished Crawling: {self.name}")
 
+    async def record_failed_page(self, page_num):
+        """재시도 후에도 실패한 페이지를 state DB에 기록 (기록되면 True → 체크포인트가 지나갈 수 있음)"""
+        error = self._page_errors.pop(page_num, "unknown error")
+        attempts = await self.state_manager.record_failed_page(self.failed_key, page_num, error)
+        if attempts >= self.max_page_attempts:
+            self.pages_abandoned += 1
+            self.logger.error(f"🪦 Page {page_num} abandoned after {attempts} attempts: {error}")
+        return True
+
+    async def retry_failed_pages(self, phase):
+        """실패 목록에 남은 페이지를 다시 수집 (시작 시 1회, 끝날 때 1회)"""
+        failed = await self.state_manager.get_failed_pages(self.failed_key, self.max_page_attempts)
+        if not failed:
+            return
+        self.logger.info(f"🔁 {phase} pass: retrying {len(failed)} failed pages")
+
+        queue = asyncio.Queue()
+        for page_num, _ in failed:
+            queue.put_nowait(page_num)
+
+        async def worker():
+            while not queue.empty():
+                page_num = queue.get_nowait()
+                if await self.process_page(page_num):
+                    await self.state_manager.resolve_failed_page(self.failed_key, page_num)
+                    self.pages_recovered += 1
+                else:
+                    await self.record_failed_page(page_num)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(failed)))))
+
+    async def _report_retries(self):
+        policy = self.retry_policy
+        remaining = await self.state_manager.count_failed_pages(self.failed_key)
+        if policy.retried or self.pages_recovered or self.pages_abandoned or remaining:
+            self.logger.info(
+                f"🔁 Retry summary: {policy.retried} request retries ({policy.recovered} recovered), "
+                f"{self.pages_recovered} failed pages recovered, {self.pages_abandoned} abandoned, "
+                f"{remaining} still in failed_pages"
+            )
+
     async def process_page(self, page_num):
-        async with self.semaphore:
-            try:
-                req_params = copy.deepcopy(self.config['request'])
-                
-                target_url = req_params['url'].replace('{page}', str(page_num))
-                req_params['url'] = target_url
-                
-                if 'data' in req_params and isinstance(req_params['data'], dict):
-                    for k, v in req_params['data'].items():
-                        if isinstance(v, str):
-                            req_params['data'][k] = v.replace('{page}', str(page_num))
-                
-                if 'params' in req_params:
-                     pg_key = self.config['request'].get('pagination', {}).get('param')
-                     if pg_key:
-                         req_params['params'][pg_key] = page_num
+        """페이지 하나를 수집. 성공(또는 의도적 건너뜀) 시 True를 반환해 스케줄러가 완료로 기록하게 함"""
+        with Metrics.timer("page", crawler=self.name):
+            ok = await self._process_page(page_num)
+        Metrics.inc("crawler_pages_total", crawler=self.name, result="ok" if ok else "error")
+        return ok
+
+    async def _process_page(self, page_num):
+        try:
+            req_params = copy.deepcopy(self.config['request'])
+            
+            target_url = req_params['url'].replace('{page}', str(page_num))
+            req_params['url'] = target_url
+            
+            if 'data' in req_params and isinstance(req_params['data'], dict):
+                for k, v in req_params['data'].items():
+                    if isinstance(v, str):
+                        req_params['data'][k] = v.replace('{page}', str(page_num))
+            
+            if 'params' in req_params:
+                 pg_key = self.config['request'].get('pagination', {}).get('param')
+                 if pg_key:
+                     req_params['params'][pg_key] = page_num
 
+            with Metrics.timer("hooks", crawler=self.name):
                 req_params = await self.hook_manager.run("before_request", req_params, page_num)
-                if not req_params: return
-
-                self.logger.debug(f"Fetching page {page_num}...")
-                content = await self.fetcher.fetch(self.config['type'], req_params)
-                
-                strategy_name = self.config['extraction'].get('strategy', 'css')
-                strategy = StrategyFactory.get(strategy_name)
-                extracted_items = strategy.extract(content, self.config['extraction'])
-                
-                new_count = 0
-                duplicate_count = 0
+            if not req_params: return True
 
+            self.logger.debug(f"Fetching page {page_num}...")
+            # 재시도 대기 시간까지 포함 (요청 하나하나의 시간은 AsyncFetcher의 "request" 단계)
+            with Metrics.timer("fetch", crawler=self.name):
+                content = await self.retry_policy.run(
+                    self.fetcher.fetch, self.config['type'], req_params, page_num=page_num,
+                    label=f"Page {page_num}"
+                )
+            
+            strategy_name = self.config['extraction'].get('strategy', 'css')
+            with Metrics.timer("parse", crawler=self.name):
+                if self.node_fields or not isinstance(content, str):
+                    # '> node' 필드는 파싱된 요소라 다른 프로세스에서 넘겨받을 수 없음 (캡처된 JSON은 이미 파싱됨)
+                    strategy = StrategyFactory.get(strategy_name)
+                    extracted_items = strategy.extract(content, self.config['extraction'])
+                else:
+                    extracted_items = await ParsePool.run(
+                        extract_records, strategy_name, content, self.config['extraction'], size=len(content)
+                    )
+            
+            items = []
+            with Metrics.timer("hooks", crawler=self.name):
                 for item in extracted_items:
                     item = await self.hook_manager.run("before_save", item)
                     if not item: continue
+                    for field in self.node_fields:
+                        item.pop(field, None)
+                    items.append(item)
 
-                    if await self.state_manager.is_new(item):
-                        if self.config.get('deep_crawl', False) and item.get('홈페이지'):
-                            loop = asyncio.get_running_loop()
-                            item = await self.extractor.process_company(item)
-                        new_count += 1
-                        await self.processor.process(item)
+            # 페이지 단위로 한 번에 중복 검사 (커밋 1회)
+            with Metrics.timer("dedup", crawler=self.name):
+                new_items = await self.state_manager.filter_new(items)
+            new_count = len(new_items)
+            duplicate_count = len(items) - new_count
+
+            # 큐에 넣기 전에 디스크(spool)에 적어둠 (중복 검사에는 이미 기록됐으므로 도중에 죽어도 다음 실행 때 전송)
+            # 심층 크롤링/업로드 큐가 가득 차 있으면 여기서 기다림
+            with Metrics.timer("enqueue", crawler=self.name):
+                spool_ids = await self.processor.spool(new_items)
+                for item, spool_id in zip(new_items, spool_ids):
+                    if self.deep_stage and item.get('홈페이지'):
+                        await self.deep_stage.submit(item, spool_id)
                     else:
-                        duplicate_count += 1
-                
-                first_item_check = ""
-                if extracted_items:
-                    first_item_name = extracted_items[0].get('기업명', 'Unknown')
-                    first_item_check = f" (First: {first_item_name})"
+                        await self.processor.process(item, spool_id)
 
-                self.logger.info(f"Page {page_num}: Extracted {len(extracted_items)} items. {new_count} new, {duplicate_count} skipped.{first_item_check}")
+            Metrics.inc("crawler_items_total", len(extracted_items), crawler=self.name, kind="extracted")
+            Metrics.inc("crawler_items_total", new_count, crawler=self.name, kind="new")
+            Metrics.inc("crawler_items_total", duplicate_count, crawler=self.name, kind="duplicate")
+            
+            first_item_check = ""
+            if extracted_items:
+                first_item_name = extracted_items[0].get('기업명', 'Unknown')
+                first_item_check = f" (First: {first_item_name})"
 
-                checkpoint_key = f"{self.name}_last_page"
-                await self.state_manager.save_checkpoint(checkpoint_key, page_num)
+            self.logger.info(f"Page {page_num}: Extracted {len(extracted_items)} items. {new_count} new, {duplicate_count} skipped.{first_item_check}")
 
-                await asyncio.sleep(random.uniform(0.5, 1.5))
+            return True
 
-            except Exception as e:
-                self.logger.error(f"Error on page {page_num}: {e}")
-                await self.hook_manager.run("on_error", e, page_num)
\ No newline at end of file
+        except Exception as e:
+            self.logger.error(f"Error on page {page_num}: {e}")
+            self._page_errors[page_num] = f"{type(e).__name__}: {e}"
+            await self.hook_manager.run("on_error", e, page_num)
+            return False
@@ -0,0 +1,237 @@
+import logging
+
+import lxml.etree
+import lxml.html
+from bs4.builder import HTMLTreeBuilder
+from cssselect import GenericTranslator, HTMLTranslator
+from cssselect.parser import SelectorError
+from cssselect.xpath import ExpressionError
+
+from .field_extractors import build_field_extractor
+
+# BeautifulSoup(html.parser)이 리스트로 돌려주는 속성들 (결과를 똑같이 맞추기 위해 사용)
+CDATA_LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+
+# BeautifulSoup의 get_text()가 무시하는 태그
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+_VISIBLE_TEXT = lxml.etree.XPath(
+    ".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]"
+)
+_ALL_TEXT = lxml.etree.XPath(".//text()")
+
+# smart_extraction이 스캔하는 부분: 텍스트 노드, 주석, tel:/mailto: 링크 (마크업/속성 전체는 보지 않음)
+SMART_FIELDS = ('이메일', '전화번호', '팩스')
+# 조각 사이 구분자. 공백 외 문자가 있어서 서로 다른 태그에 걸친 번호가 붙어 보이지 않음 (마크업의 태그와 같은 역할)
+CONTACT_SEPARATOR = " | "
+# 공백뿐인 텍스트 노드는 XPath 단계에서 제외.
+# smart_strings=False: 결과마다 부모 참조가 달린 문자열 객체를 만들지 않음 (행마다 호출되므로)
+_CONTACT_PARTS = lxml.etree.XPath(
+    "descendant::text()[normalize-space()] | descendant::comment()[normalize-space()]"
+    " | descendant::a[starts-with(@href, 'tel:') or starts-with(@href, 'mailto:')]/@href",
+    smart_strings=False
+)
+
+
+def smart_selector(rules):
+    """"smart_extraction": {"selector": "td.contact"} 처럼 스캔 범위를 좁힌 경우 그 선택자"""
+    spec = rules.get('smart_extraction')
+    return spec.get('selector') if isinstance(spec, dict) else None
+
+
+def needs_smart_extraction(record):
+    """필드에서 이미 이메일/전화번호/팩스를 모두 얻었으면 스캔할 필요 없음"""
+    return not all(record.get(field) for field in SMART_FIELDS)
+
+
+class PlanUnsupported(Exception):
+    """cssselect로 옮길 수 없는 규칙. 이 경우 BeautifulSoup 경로를 그대로 사용함"""
+
+
+def parse_field_rule(selector_str):
+    """'td.name > href' 형태의 필드 규칙을 (selector, attr)로 분리"""
+    if ' > ' in selector_str:
+        selector, attr = selector_str.rsplit(' > ', 1)
+    else:
+        selector, attr = selector_str, 'text'
+    return selector, attr
+
+
+def node_field_names(rules):
+    """'> node'로 파싱된 요소 자체를 받는 필드 이름들 (훅 전달용, 저장 전에 제거해야 함)"""
+    names = set()
+    for name, selector_str in rules.get('fields', {}).items():
+        if isinstance(selector_str, str) and parse_field_rule(selector_str)[1] == 'node':
+            names.add(name)
+    return names
+
+
+class FieldRule:
+    __slots__ = ('name', 'selector', 'attr', 'xpath', 'extractor')
+
+    def __init__(self, name, selector, attr, xpath=None, extractor=None):
+        self.name = name
+        self.selector = selector
+        self.attr = attr
+        self.xpath = xpath
+        self.extractor = extractor
+
+
+class ExtractionPlan:
+    """
+    설정 하나당 한 번만 만드는 컴파일된 추출 계획.
+
+    CSS 선택자를 미리 XPath로 변환/컴파일해두고 lxml로 파싱하므로,
+    페이지마다 필드 문자열을 다시 쪼개거나 soupsieve를 거치지 않음.
+    결과 레코드는 CssStrategy/XmlStrategy의 BeautifulSoup 경로와 동일하게 맞춤.
+    """
+    def __init__(self, rules, mode='html'):
+        self.mode = mode
+        self.logger = logging.getLogger("ExtractionPlan")
+        translator = HTMLTranslator() if mode == 'html' else GenericTranslator()
+        if node_field_names(rules):
+            # 훅이 받는 요소 타입을 하나로 맞추기 위해 '> node' 필드가 있으면 항상 BeautifulSoup Tag를 넘김
+            raise PlanUnsupported("'> node' fields are passed to hooks as BeautifulSoup Tags")
+
+        base_selector = rules.get('base_selector', 'body' if mode == 'html' else '')
+        try:
+            self.base_xpath = None
+            if base_selector:
+                self.base_xpath = lxml.etree.XPath(
+                    translator.css_to_xpath(base_selector, prefix='descendant-or-self::')
+                )
+
+            self.fields = []
+            for name, selector_str in rules.get('fields', {}).items():
+                if isinstance(selector_str, dict):
+                    if self.mode != 'html':
+                        raise PlanUnsupported(f"Field extractor in XML mode: {name}")
+                    self.fields.append(FieldRule(name, None, None, extractor=build_field_extractor(selector_str)))
+                    continue
+                selector, attr = parse_field_rule(selector_str)
+                xpath = None
+                if selector != 'self':
+                    # select_one()과 같이 자기 자신은 제외하고 후손만 탐색
+                    xpath = lxml.etree.XPath(translator.css_to_xpath(selector, prefix='descendant::'))
+                self.fields.append(FieldRule(name, selector, attr, xpath))
+        except (SelectorError, ExpressionError, lxml.etree.XPathSyntaxError) as e:
+            raise PlanUnsupported(str(e))
+
+        self.smart_extraction = bool(rules.get('smart_extraction'))
+        self.smart_xpath = None
+        if smart_selector(rules):
+            try:
+                self.smart_xpath = lxml.etree.XPath(
+                    translator.css_to_xpath(smart_selector(rules), prefix='descendant::')
+                )
+            except (SelectorError, ExpressionError, lxml.etree.XPathSyntaxError) as e:
+                raise PlanUnsupported(str(e))
+        # 첫 페이지에서 BeautifulSoup 경로와 결과가 같은지 확인됐는지 여부
+        self.verified = False
+
+    def parse(self, content):
+        """문서를 파싱해 루트 요소 반환. 비어 있으면 None"""
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        if not content or not content.strip():
+            return None
+
+        try:
+            if self.mode == 'html':
+                try:
+                    return lxml.html.document_fromstring(content)
+                except ValueError:
+                    # <?xml encoding=...?> 선언이 붙은 문자열은 바이트로 다시 파싱
+                    parser = lxml.html.HTMLParser(encoding='utf-8')
+                    return lxml.html.document_fromstring(content.encode('utf-8'), parser=parser)
+
+            parser = lxml.etree.XMLParser(recover=True, resolve_entities=False)
+            root = lxml.etree.fromstring(content.encode('utf-8'), parser=parser)
+        except lxml.etree.ParserError:
+            return None
+
+        if root is not None and self._has_namespaces(root):
+            # 네임스페이스가 있는 XML은 soupsieve와 매칭 규칙이 달라 BeautifulSoup 경로로 넘김
+            raise PlanUnsupported("Namespaced XML")
+        return root
+
+    def _has_namespaces(self, root):
+        for el in root.iter():
+            if isinstance(el.tag, str) and el.tag.startswith('{'):
+                return True
+        return False
+
+    def get_text(self, el):
+        """BeautifulSoup의 get_text(strip=True)와 같은 결과"""
+        if self.mode == 'html' and el.tag not in _NON_TEXT_TAGS:
+            strings = _VISIBLE_TEXT(el)
+        else:
+            strings = _ALL_TEXT(el)
+        return "".join(s.strip() for s in strings if s.strip())
+
+    def get_attr(self, el, attr):
+        value = el.get(attr)
+        if value is None:
+            return ''
+        if self.mode == 'html' and (
+            attr in CDATA_LIST_ATTRIBUTES['*'] or attr in CDATA_LIST_ATTRIBUTES.get(el.tag, ())
+        ):
+            return value.split()
+        return value
+
+    def contact_text(self, el):
+        """smart_extraction이 스캔할 텍스트 (CssStrategy._contact_text와 같은 결과)"""
+        scopes = self.smart_xpath(el) if self.smart_xpath is not None else [el]
+        parts = []
+        for scope in scopes:
+            # 주석은 요소로 나오므로 내용만
+            parts.extend(node if isinstance(node, str) else node.text for node in _CONTACT_PARTS(scope))
+        return CONTACT_SEPARATOR.join(parts)
+
+    def to_markup(self, el):
+        method = 'html' if self.mode == 'html' else 'xml'
+        return lxml.etree.tostring(el, encoding='unicode', method=method, with_tail=False)
+
+    def extract(self, content, smart_extractor=None):
+        root = self.parse(content)
+        if root is None:
+            return []
+
+        elements = self.base_xpath(root) if self.base_xpath is not None else [root]
+
+        results = []
+        for el in elements:
+            record = {}
+
+            for field in self.fields:
+                if field.extractor is not None:
+                    record[field.name] = field.extractor.from_lxml(el, self.get_text)
+                    continue
+
+                if field.xpath is None:
+                    target = el
+                else:
+                    matches = field.xpath(el)
+                    target = matches[0] if matches else None
+
+                if target is not None:
+                    if field.attr == 'text':
+                        val = self.get_text(target)
+                    elif field.attr == 'inner_html':
+                        val = self.to_markup(target)
+                    else:
+                        val = self.get_attr(target, field.attr)
+                    record[field.name] = val
+                else:
+                    record[field.name] = ""
+
+            if self.smart_extraction and smart_extractor and needs_smart_extraction(record):
+                smart_data = smart_extractor.extract_contacts(self.contact_text(el))
+
+                for k, v in smart_data.items():
+                    if k not in record or not record[k]:
+                        record[k] = v
+
+            if any(record.values()):
+                results.append(record)
+
+        return results
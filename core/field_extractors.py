@@ -0,0 +1,113 @@
+"""
+설정 파일에서 문자열 선택자 대신 딕셔너리로 지정하는 필드 추출기.
+
+    "대표자명": {"extractor": "sibling_label", "label": "대표자명"}
+    "홈페이지": {"extractor": "comment_link"}
+
+이미 파싱된 행(row) 요소에서 바로 값을 꺼내므로, `_raw_html`로 직렬화한 뒤
+훅에서 다시 파싱할 필요가 없음. lxml(컴파일된 추출 계획)과 BeautifulSoup 양쪽을 모두 지원함.
+"""
+import lxml.etree
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup, Comment
+from cssselect import HTMLTranslator
+
+
+_translator = HTMLTranslator()
+
+
+def _css_xpath(selector, prefix):
+    return lxml.etree.XPath(_translator.css_to_xpath(selector, prefix=prefix))
+
+
+def _soup_text(tag):
+    return tag.get_text(strip=True)
+
+
+def _lxml_single_string(el):
+    """BeautifulSoup의 `.string`과 같은 규칙: 자식이 문자열 하나뿐일 때만 그 값을 반환"""
+    children = list(el)
+    if not children:
+        return el.text
+    if len(children) == 1 and not el.text and not children[0].tail and isinstance(children[0].tag, str):
+        return _lxml_single_string(children[0])
+    return None
+
+
+class SiblingLabelExtractor:
+    """
+    '라벨' 요소를 찾고, 그 뒤에 오는 형제 '값' 요소들의 텍스트를 이어붙임.
+    (예: <span class="list-tit">대표자명</span><span class="list-info">홍길동</span>)
+    """
+    def __init__(self, spec):
+        self.label = spec['label']
+        self.label_selector = spec.get('label_selector', 'span.list-tit')
+        self.value_selector = spec.get('value_selector', 'span.list-info')
+        self._label_xpath = _css_xpath(self.label_selector, 'descendant::')
+        self._value_xpath = _css_xpath(self.value_selector, 'self::')
+
+    def from_lxml(self, el, get_text):
+        for label in self._label_xpath(el):
+            if _lxml_single_string(label) != self.label:
+                continue
+            values = [sib for sib in label.itersiblings() if self._value_xpath(sib)]
+            return "".join(get_text(v) for v in values)
+        return ""
+
+    def from_soup(self, el):
+        for label in el.select(self.label_selector):
+            if label.string != self.label:
+                continue
+            values = [sib for sib in label.find_next_siblings() if soupsieve.match(self.value_selector, sib)]
+            return "".join(_soup_text(v) for v in values)
+        return ""
+
+
+class CommentLinkExtractor:
+    """
+    HTML 주석(<!-- <a href="..."> -->) 속에 숨겨진 링크를 꺼냄.
+    'http://https://' 처럼 스킴이 두 번 붙은 주소는 바로잡음.
+    """
+    def __init__(self, spec):
+        self.attr = spec.get('attr', 'href')
+
+    def _fix_scheme(self, link):
+        return link.replace("http://https://", "https://")
+
+    def from_lxml(self, el, get_text):
+        for comment in el.iter(lxml.etree.Comment):
+            text = comment.text or ""
+            if "href" not in text:
+                continue
+            try:
+                fragment = lxml.html.fragment_fromstring(text, create_parent='div')
+            except lxml.etree.ParserError:
+                continue
+            a_tag = next(fragment.iter('a'), None)
+            if a_tag is not None and a_tag.get(self.attr):
+                return self._fix_scheme(a_tag.get(self.attr))
+        return ""
+
+    def from_soup(self, el):
+        for comment in el.find_all(string=lambda text: isinstance(text, Comment)):
+            if "href" not in comment:
+                continue
+            fragment = BeautifulSoup(str(comment), 'html.parser')
+            a_tag = fragment.find('a')
+            if a_tag and a_tag.get(self.attr):
+                return self._fix_scheme(a_tag.get(self.attr))
+        return ""
+
+
+FIELD_EXTRACTORS = {
+    'sibling_label': SiblingLabelExtractor,
+    'comment_link': CommentLinkExtractor,
+}
+
+
+def build_field_extractor(spec):
+    name = spec.get('extractor')
+    if name not in FIELD_EXTRACTORS:
+        raise ValueError(f"Unknown field extractor: {name}")
+    return FIELD_EXTRACTORS[name](spec)
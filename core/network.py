@@ -4,6 +4,7 @@ import logging
 import random
 import json
 import copy
+from http.cookies import SimpleCookie
 
 try:
     from patchright.async_api import async_playwright
@@ -12,15 +13,63 @@ except ImportError:
     from playwright.async_api import async_playwright
     USING_PATCHRIGHT = False
 
-from config import USER_AGENTS, BROWSER_CONFIG, DEFAULT_HEADERS
+from config import USER_AGENTS, BROWSER_CONFIG, DEFAULT_HEADERS, HTTP_POOL_CONFIG
+from utils.metrics import Metrics
+from .browser_pool import BrowserTabPool
+from .resource_policy import ResourcePolicy, PageMeter, ResourceStats
+from .capture import ResponseCapture
+from .browser_state import BrowserStateStore
+from .rate_limiter import AdaptiveRateLimiter, retry_after_seconds
+
+WEBDRIVER_PATCH = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+"""
+
+def create_pooled_session(pool_config=None):
+    """
+    커넥션 풀/DNS 캐시/keep-alive를 공유하는 오래 사는 세션 생성.
+    `pool_config`의 값이 HTTP_POOL_CONFIG 기본값을 덮어씀.
+    """
+    options = dict(HTTP_POOL_CONFIG)
+    options.update(pool_config or {})
+
+    connector = aiohttp.TCPConnector(
+        limit=options.get('limit', 100),
+        limit_per_host=options.get('limit_per_host', 0),
+        ttl_dns_cache=options.get('ttl_dns_cache', 10),
+        use_dns_cache=True,
+        keepalive_timeout=options.get('keepalive_timeout', 15),
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 class AsyncFetcher:
-    def __init__(self, context_name="Fetcher"):
+    def __init__(self, context_name="Fetcher", state_key=None, state_config=None, rate_limit=None):
+        self.name = context_name
         self.logger = logging.getLogger(context_name)
+        # 같은 domain_group의 모든 크롤러가 공유하는 속도 제한기 (rate_limit=False면 끔)
+        self.rate_limiter = None
+        if state_key and rate_limit is not False:
+            self.rate_limiter = AdaptiveRateLimiter.for_key(state_key, rate_limit or None)
+        # state_key(domain_group)가 있으면 브라우저 쿠키/localStorage를 실행 간에 보관 (state_config=False면 끔)
+        self.state_store = None
+        if state_key and state_config is not False:
+            self.state_store = BrowserStateStore(state_key, state_config or None, logger=self.logger)
+        self._state_restored = False
+        # 이번 실행에서 새로 통과(warm-up/로그인)한 상태가 컨텍스트에 있는지 (종료 시 저장 여부)
+        self._state_fresh = False
         self.playwright = None
         self.browser = None
         self.context = None
         self.http_session = None
+        self.tab_pool = None
+        # 리소스 차단 정책을 쓰는 탭의 계측기와 페이지 로드 통계
+        self._meters = {}
+        self.resource_stats = ResourceStats(self.logger)
+        # hybrid 모드: 브라우저에서 받아온 User-Agent/헤더와 세션 갱신 상태
+        self.hybrid_headers = None
+        self._warm_lock = asyncio.Lock()
+        self._warm_generation = 0
+        self._rewarms = 0
         
         if USING_PATCHRIGHT:
             self.logger.info("🛡️ Anti-Bot Engine: Patchright (Detected & Active)")
@@ -29,18 +78,66 @@ class AsyncFetcher:
 
     def _get_headers(self):
         headers = DEFAULT_HEADERS.copy()
-        headers["User-Agent"] = random.choice(USER_AGENTS)
+        if self.hybrid_headers:
+            # 브라우저 세션(쿠키)은 User-Agent와 묶여 있으므로 섞지 않고 그대로 씀
+            headers.update(self.hybrid_headers)
+        else:
+            headers["User-Agent"] = random.choice(USER_AGENTS)
         return headers
 
     async def _get_http_session(self):
         if self.http_session is None or self.http_session.closed:
-            self.http_session = aiohttp.ClientSession()
+            self.http_session = create_pooled_session()
         return self.http_session
 
-    async def fetch(self, type, req_config):
+    async def fetch(self, type, req_config, page_num=None):
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self._measured_fetch(type, req_config, page_num)
+
+        with Metrics.timer("rate_limit_wait", fetcher=self.name):
+            await limiter.acquire()
+        try:
+            content = await self._measured_fetch(type, req_config, page_num)
+        except aiohttp.ClientResponseError as e:
+            if e.status in (429, 503):
+                limiter.on_throttle(retry_after_seconds(e.headers), reason=f"HTTP {e.status}")
+            raise
+        except asyncio.TimeoutError:
+            limiter.on_throttle(reason="timeout")
+            raise
+        limiter.on_success()
+        return content
+
+    async def _measured_fetch(self, type, req_config, page_num=None):
+        """요청 하나의 시간/결과와 진행 중인 요청 수를 기록 (지표가 꺼져 있으면 바로 _fetch)"""
+        if not Metrics.enabled:
+            return await self._fetch(type, req_config, page_num)
+        result = "error"
+        Metrics.add_gauge("crawler_inflight_requests", 1, kind="list")
+        try:
+            with Metrics.timer("request", fetcher=self.name, type=type):
+                content = await self._fetch(type, req_config, page_num)
+            result = "ok"
+            return content
+        except aiohttp.ClientResponseError as e:
+            result = str(e.status)
+            raise
+        except asyncio.TimeoutError:
+            result = "timeout"
+            raise
+        finally:
+            Metrics.add_gauge("crawler_inflight_requests", -1, kind="list")
+            Metrics.inc("crawler_requests_total", kind="list", fetcher=self.name, result=result)
+
+    async def _fetch(self, type, req_config, page_num=None):
         if type in ['api', 'html']:
             return await self._fetch_http(req_config)
+        elif type == 'hybrid':
+            return await self._fetch_hybrid(req_config)
         elif type == 'browser':
+            if req_config.get('browser_session') and page_num is not None:
+                return await self._fetch_browser_session(req_config, page_num)
             return await self._fetch_browser(req_config)
         else:
             raise ValueError(f"Unknown fetch type: {type}")
@@ -62,59 +159,192 @@ class AsyncFetcher:
             headers=self._get_headers()
         ) as response:
             response.raise_for_status()
+            # 본문은 한 번만 읽힘 (text()/json()은 읽어둔 본문을 그대로 씀)
+            Metrics.inc("crawler_bytes_downloaded_total", len(await response.read()), kind="list")
             if 'application/json' in response.headers.get('Content-Type', ''):
                 return await response.json()
             return await response.text()
 
-    async def _fetch_browser(self, config):
+    async def _fetch_hybrid(self, config):
+        """
+        브라우저로 한 번 통과(보안 확인/로그인)한 뒤 쿠키를 aiohttp 세션으로 넘겨 HTTP로 수집.
+        응답이 보안 확인 페이지처럼 보이면 브라우저로 돌아가 세션을 새로 받음.
+        """
+        warmup = config.get('warmup', {})
+        statuses = set(warmup.get('challenge_statuses', [403, 429, 503]))
+        markers = warmup.get('challenge_markers', [])
+        max_rewarms = warmup.get('max_rewarms', 3)
+
+        retry = False
+        while True:
+            if self.hybrid_headers is None:
+                await self._warm_up(config, self._warm_generation)
+            generation = self._warm_generation
+            if retry and self.rate_limiter:
+                # 세션을 새로 받은 뒤 다시 보내는 요청도 속도 제한을 거침
+                await self.rate_limiter.acquire()
+            try:
+                content = await self._fetch_http(config)
+                challenged = isinstance(content, str) and any(marker in content for marker in markers)
+                if challenged:
+                    self._report_challenge(None, "challenge page")
+            except aiohttp.ClientResponseError as e:
+                if e.status not in statuses:
+                    raise
+                challenged = True
+                self._report_challenge(e.headers, f"challenge HTTP {e.status}")
+
+            if not challenged:
+                # 연속 re-warm 횟수만 셈 (한 번 통과하면 다시 처음부터)
+                self._rewarms = 0
+                return content
+            if self._rewarms >= max_rewarms:
+                raise RuntimeError(f"Still challenged after {max_rewarms} browser re-warms in a row")
+            self.logger.warning("🧩 Challenge page detected. Refreshing session in browser...")
+            await self._warm_up(config, generation)
+            retry = True
+
+    def _report_challenge(self, headers, reason):
+        """보안 확인에 걸린 것도 서버가 버거워한다는 신호로 보고 속도 제한기를 늦춤"""
+        if self.rate_limiter:
+            self.rate_limiter.on_throttle(retry_after_seconds(headers) if headers else None, reason=reason)
+
+    async def _warm_up(self, config, generation):
+        """브라우저에서 warmup 액션 실행 후 쿠키/User-Agent/저장소 값을 HTTP 세션으로 복사"""
+        async with self._warm_lock:
+            # 다른 요청이 이미 새 세션을 받아왔으면 다시 하지 않음
+            if generation != self._warm_generation:
+                return
+            warmup = config.get('warmup', {})
+            if self.hybrid_headers is not None:
+                self._rewarms += 1
+                # 지금 쿠키로는 통과가 안 되므로 저장된 상태도 버리고 처음부터 다시 받음
+                await self.invalidate_state("challenged again after hand-off")
+            elif await self._restore_hybrid_session(warmup):
+                return
+
+            url = warmup.get('url', config['url'])
+            policy = ResourcePolicy.from_config(config)
+            page = await self.new_page(policy=policy)
+            try:
+                self.logger.info(f"🔥 Browser warm-up: {url}")
+                await self.open_url(page, url, policy)
+                if warmup.get('actions'):
+                    await self.run_actions(page, warmup['actions'])
+                user_agent = await page.evaluate("navigator.userAgent")
+                headers = {"User-Agent": user_agent}
+                # localStorage 값이 필요한 API는 헤더로 넘김 (예: {"Authorization": "token"})
+                for header, key in warmup.get('storage_headers', {}).items():
+                    value = await page.evaluate("(key) => window.localStorage.getItem(key)", key)
+                    if value:
+                        headers[header] = value
+            finally:
+                await page.close()
+
+            await self._hand_off(headers)
+            await self.save_state(fresh=True)
+
+    async def _restore_hybrid_session(self, warmup):
+        """저장된 브라우저 상태가 있으면 warmup 접속 없이 바로 HTTP로 넘김"""
         await self._ensure_browser()
-        
-        page = await self.context.new_page()
-        await page.set_viewport_size({"width": 1920, "height": 1080})
-        page.on("dialog", lambda dialog: dialog.accept())
+        if not self._state_restored or warmup.get('storage_headers'):
+            return False
+        user_agent = self.state_store.user_agent
+        if not user_agent:
+            page = await self.new_page()
+            try:
+                user_agent = await page.evaluate("navigator.userAgent")
+            finally:
+                await page.close()
+        await self._hand_off({"User-Agent": user_agent})
+        return True
+
+    async def _hand_off(self, headers):
+        """(warm-up 락 안에서) 브라우저 쿠키를 HTTP 세션 쿠키 저장소로 복사"""
+        cookies = await self.context.cookies()
+        session = await self._get_http_session()
+        session.cookie_jar.clear()
+        for cookie in cookies:
+            jar_cookie = SimpleCookie()
+            jar_cookie[cookie['name']] = cookie['value']
+            morsel = jar_cookie[cookie['name']]
+            morsel['domain'] = cookie['domain']
+            morsel['path'] = cookie.get('path', '/')
+            if cookie.get('secure'):
+                morsel['secure'] = True
+            session.cookie_jar.update_cookies(jar_cookie)
+
+        self.hybrid_headers = headers
+        self._warm_generation += 1
+        self.logger.info(f"🍪 Session handed off to HTTP: {len(cookies)} cookies")
+
+    async def save_state(self, fresh=False):
+        """
+        현재 컨텍스트의 쿠키/localStorage를 파일로 저장.
+        fresh=True는 방금 warm-up/로그인으로 새로 얻은 상태 (저장 시각 갱신), 아니면 복원한 상태의 시각을 유지.
+        복원하지도 새로 통과하지도 않은(또는 버린) 상태는 저장하지 않음
+        """
+        if fresh:
+            self._state_fresh = True
+        if not self.state_store or not self.context:
+            return
+        if not (self._state_restored or self._state_fresh):
+            return
+        try:
+            state = await self.context.storage_state()
+            user_agent = (self.hybrid_headers or {}).get("User-Agent")
+            self.state_store.save(state, user_agent, fresh=fresh)
+        except Exception as e:
+            self.logger.warning(f"Browser state save failed: {e}")
+
+    async def invalidate_state(self, reason):
+        """저장된/현재 브라우저 상태가 더 이상 통하지 않음: 파일을 지우고 쿠키를 비워 처음부터 다시 통과하게 함"""
+        if self.state_store and (self._state_restored or self._state_fresh or self.state_store.saved_at):
+            self.logger.warning(f"🗑️ Discarding browser state: {reason}")
+        if self.state_store:
+            self.state_store.invalidate()
+        self._state_restored = False
+        self._state_fresh = False
+        if self.context:
+            await self.context.clear_cookies()
+
+    def note_browser_success(self):
+        """(browser 모드) 복원하지 않은 컨텍스트로 페이지를 받았으면 그 상태를 이번 실행에서 새로 얻은 것으로 봄"""
+        if not self._state_restored:
+            self._state_fresh = True
+
+    async def check_challenge(self, config, content):
+        """(browser 모드) request.challenge_markers 문구가 보이면 상태를 버리고 실패 처리"""
+        markers = config.get('challenge_markers') or []
+        if isinstance(content, str) and any(marker in content for marker in markers):
+            self._report_challenge(None, "challenge page")
+            await self.invalidate_state("challenge page in browser")
+            raise RuntimeError("Challenge page detected in browser")
+
+    async def _fetch_browser(self, config):
+        policy = ResourcePolicy.from_config(config)
+        capture = ResponseCapture.from_config(config)
+        page = await self.new_page(policy=policy)
+        page_capture = capture.attach(page) if capture else None
         try:
             self.logger.debug(f"Browsing: {config['url']}")
-            await page.goto(config['url'], wait_until='networkidle', timeout=60000)
+            try:
+                started = await self.open_url(page, config['url'], policy)
+                if 'actions' in config:
+                    await self.run_actions(page, config['actions'])
+            except Exception as e:
+                # 저장된 상태로 로그인/검색 설정이 안 되는 것일 수 있으므로 버림
+                await self.invalidate_state(f"page setup failed ({type(e).__name__})")
+                raise
             
-            if 'actions' in config:
-                for action in config['actions']:
-                    act_type = action.get('type')
-                    selector = action.get('selector')
-                    
-                    if act_type == 'wait':
-                        await page.wait_for_selector(selector, state='visible', timeout=10000)
-                    elif act_type == 'click':
-                        await asyncio.sleep(random.uniform(0.1, 0.3))
-                        await page.click(selector, delay=random.randint(100, 300))
-                        await asyncio.sleep(random.uniform(0.5, 1.5))
-                    elif act_type == 'sleep':
-                        await asyncio.sleep(action.get('seconds', 1))
-                    elif act_type == 'input':
-                        await page.fill(selector, action.get('value'))
-                    elif act_type == 'press':
-                        key = action.get('key')
-                        await page.keyboard.press(key)
-                        await asyncio.sleep(random.uniform(0.2,0.5))
-                    elif act_type == 'mouse_move':
-                        try:
-                            element = await page.wait_for_selector(selector, state='visible', timeout=5000)
-                            box = await element.bounding_box()
-                            
-                            if box:
-                                target_x = box['x'] + box['width'] / 2 + random.uniform(-5, 5)
-                                target_y = box['y'] + box['height'] / 2 + random.uniform(-5, 5)
-                                
-                                await page.mouse.move(target_x, target_y, steps=random.randint(30, 60))
-                        except Exception as e:
-                            self.logger.warning(f"Mouse move failed: {e}")
-                    elif act_type == 'hover':
-                        try:
-                            await page.hover(selector)
-                            await asyncio.sleep(random.uniform(0.3, 0.8))
-                        except Exception:
-                            pass
-            
-            content = await page.content()
+            if page_capture:
+                # 렌더링된 HTML 대신 API 응답(JSON)을 그대로 반환
+                content = await page_capture.json()
+            else:
+                content = await page.content()
+            self.finish_load(page, started)
+            await self.check_challenge(config, content)
+            self.note_browser_success()
             return content
             
         except Exception as e:
@@ -123,6 +353,136 @@ class AsyncFetcher:
         finally:
             await page.close()
 
+    async def _fetch_browser_session(self, config, page_num):
+        """탭을 재사용하며 페이지를 넘김 (설정 액션은 탭마다 한 번만 실행)"""
+        if self.tab_pool is None:
+            self.tab_pool = BrowserTabPool(self, config, logger=self.logger)
+        try:
+            content = await self.tab_pool.fetch(config, page_num)
+            try:
+                await self.check_challenge(config, content)
+            except RuntimeError:
+                # 쿠키를 비웠으므로 모든 탭을 설정 액션부터 다시 실행
+                self.tab_pool.reset()
+                raise
+            self.note_browser_success()
+            return content
+        except Exception as e:
+            self.logger.error(f"Browser Fetch Error (page {page_num}): {e}")
+            raise
+
+    async def new_page(self, context=None, policy=None):
+        """브라우저 탭 생성 (기본 설정 적용, policy가 있으면 리소스 차단)"""
+        await self._ensure_browser()
+        page = await (context or self.context).new_page()
+        await page.set_viewport_size({"width": 1920, "height": 1080})
+        page.on("dialog", lambda dialog: dialog.accept())
+        if policy is not None:
+            meter = PageMeter(page)
+            await policy.attach(page, meter)
+            self._meters[page] = meter
+            page.on("close", lambda _: self._meters.pop(page, None))
+        return page
+
+    async def open_url(self, page, url, policy=None):
+        """
+        탭에서 url 접속. 차단 정책이 있으면 networkidle 대신 가벼운 조건(domcontentloaded + 선택자)으로 대기.
+        반환값은 finish_load에 넘길 계측 시작 시각 (정책 없으면 None)
+        """
+        started = self.begin_load(page, policy)
+        meter = self._meters.get(page)
+        if policy is None or meter is None or not meter.blocking:
+            # 정책이 없거나 비교 기준(baseline) 로드면 기존과 같이 networkidle까지 대기
+            await page.goto(url, wait_until='networkidle', timeout=60000)
+            return started
+
+        await page.goto(url, wait_until=policy.wait_until, timeout=60000)
+        if policy.wait_for:
+            await page.wait_for_selector(policy.wait_for, state='visible', timeout=30000)
+        return started
+
+    def begin_load(self, page, policy=None):
+        """로드 구간 계측 시작 (baseline_pages만큼은 차단 없이 로드)"""
+        meter = self._meters.get(page)
+        if meter is None:
+            return None
+        if policy is not None:
+            meter.blocking = self.resource_stats.baseline_loads() >= policy.baseline_pages
+        return self.resource_stats.start(meter)
+
+    def finish_load(self, page, started):
+        meter = self._meters.get(page)
+        if meter is None or started is None:
+            return
+        self.resource_stats.record(meter, started)
+        meter.blocking = True
+
+    async def new_context(self):
+        """쿠키/저장소가 분리된 새 컨텍스트 생성 (탭끼리 검색 상태가 섞이는 사이트용)"""
+        await self._ensure_browser()
+        context = await self.browser.new_context(**self._context_options())
+        if not USING_PATCHRIGHT:
+            await context.add_init_script(WEBDRIVER_PATCH)
+        return context
+
+    async def run_actions(self, page, actions, page_num=None):
+        """
+        설정 파일의 액션 목록 실행.
+        page_num을 주면 selector/value/script 안의 {page}를 페이지 번호로 바꿈.
+        """
+        for action in actions:
+            if page_num is not None:
+                action = {
+                    k: v.replace('{page}', str(page_num)) if isinstance(v, str) else v
+                    for k, v in action.items()
+                }
+            act_type = action.get('type')
+            selector = action.get('selector')
+            
+            if act_type == 'wait':
+                await page.wait_for_selector(selector, state='visible', timeout=10000)
+            elif act_type == 'click':
+                await asyncio.sleep(random.uniform(0.1, 0.3))
+                await page.click(selector, delay=random.randint(100, 300))
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+            elif act_type == 'sleep':
+                await asyncio.sleep(action.get('seconds', 1))
+            elif act_type == 'input':
+                await page.fill(selector, action.get('value'))
+            elif act_type == 'press':
+                key = action.get('key')
+                await page.keyboard.press(key)
+                await asyncio.sleep(random.uniform(0.2,0.5))
+            elif act_type == 'evaluate':
+                await page.evaluate(action.get('script'))
+            elif act_type == 'mouse_move':
+                try:
+                    element = await page.wait_for_selector(selector, state='visible', timeout=5000)
+                    box = await element.bounding_box()
+                    
+                    if box:
+                        target_x = box['x'] + box['width'] / 2 + random.uniform(-5, 5)
+                        target_y = box['y'] + box['height'] / 2 + random.uniform(-5, 5)
+                        
+                        await page.mouse.move(target_x, target_y, steps=random.randint(30, 60))
+                except Exception as e:
+                    self.logger.warning(f"Mouse move failed: {e}")
+            elif act_type == 'hover':
+                try:
+                    await page.hover(selector)
+                    await asyncio.sleep(random.uniform(0.3, 0.8))
+                except Exception:
+                    pass
+
+    def _context_options(self):
+        return dict(
+            viewport=None,  # 윈도우 크기에 맞춤
+            locale="ko-KR",
+            timezone_id="Asia/Seoul",
+            device_scale_factor=1,
+            # Patchright 사용 시 navigator.webdriver는 자동 처리되므로 스크립트 최소화
+        )
+
     async def _ensure_browser(self):
         if not self.playwright:
             self.playwright = await async_playwright().start()
@@ -146,23 +506,24 @@ class AsyncFetcher:
 
             self.browser = await self.playwright.chromium.launch(**launch_args)
             
-            # Context 생성
-            self.context = await self.browser.new_context(
-                viewport=None,  # 윈도우 크기에 맞춤
-                locale="ko-KR",
-                timezone_id="Asia/Seoul",
-                device_scale_factor=1,
-                # Patchright 사용 시 navigator.webdriver는 자동 처리되므로 스크립트 최소화
-            )
+            # Context 생성 (지난 실행의 쿠키/localStorage가 있으면 복원)
+            context_options = self._context_options()
+            state = self.state_store.load() if self.state_store else None
+            if state:
+                context_options['storage_state'] = state
+                self._state_restored = True
+            self.context = await self.browser.new_context(**context_options)
             
             # Playwright일 때만 수동 우회 스크립트 주입 (Patchright는 내부 처리됨)
             if not USING_PATCHRIGHT:
-                await self.context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                """)
+                await self.context.add_init_script(WEBDRIVER_PATCH)
 
     async def close(self):
+        self.resource_stats.report()
+        if self.tab_pool: await self.tab_pool.close()
         if self.http_session: await self.http_session.close()
-        if self.context: await self.context.close()
+        if self.context:
+            await self.save_state()
+            await self.context.close()
         if self.browser: await self.browser.close()
         if self.playwright: await self.playwright.stop()
\ No newline at end of file
@@ -0,0 +1,116 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import PARSE_POOL_CONFIG
+
+
+def _init_worker():
+    """워커 프로세스 시작 시 1회: 로그 형식 설정 후 전략/추출기를 미리 만들어 둠"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(processName)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    from core.strategies import StrategyFactory
+    for strategy_type in ('css', 'json', 'regex', 'xml'):
+        StrategyFactory.get(strategy_type)
+
+
+def _ping():
+    return os.getpid()
+
+
+class ParsePool:
+    """
+    목록 페이지 추출, 홈페이지 연락처 스캔처럼 CPU만 쓰는 작업을 돌리는 프로세스 풀 (프로세스 전체에서 하나).
+
+    - 워커는 시작할 때 전략 인스턴스를 만들어 두고 계속 재사용하므로,
+      컴파일된 추출 계획/정규식이 워커마다 설정당 한 번만 만들어짐
+    - 넘기는 함수는 모듈 최상위 함수여야 하고(이름으로 전달됨), 인자/결과는 dict/list/str 등 pickle 가능한 값만
+    - 내용이 작으면(inline_below_bytes) 전달 비용이 더 크므로 이벤트 루프에서 바로 실행
+    - 워커가 죽어서 풀이 깨지면 경고 후 이벤트 루프에서 바로 실행하는 방식으로 계속 진행
+    """
+    _executor = None
+    _disabled = False
+    workers = PARSE_POOL_CONFIG['workers']
+    inline_below_bytes = PARSE_POOL_CONFIG['inline_below_bytes']
+    _logger = logging.getLogger("ParsePool")
+
+    # 통계
+    offloaded = 0
+    inline = 0
+
+    @classmethod
+    def configure(cls, workers=None, inline_below_bytes=None):
+        """start() 전에 호출. 멀티 프로세스 실행처럼 프로세스마다 워커 수를 나눠야 할 때 사용"""
+        if workers is not None:
+            cls.workers = workers
+        if inline_below_bytes is not None:
+            cls.inline_below_bytes = inline_below_bytes
+
+    @classmethod
+    def _worker_count(cls):
+        if cls.workers is None:
+            return max(1, (os.cpu_count() or 2) - 1)
+        return max(0, int(cls.workers))
+
+    @classmethod
+    async def start(cls):
+        """풀을 만들고 모든 워커를 미리 띄워 둠 (첫 페이지에서 프로세스 시작 비용을 내지 않도록)"""
+        if cls._executor is not None or cls._disabled:
+            return
+        workers = cls._worker_count()
+        if workers == 0:
+            cls._disabled = True
+            return
+
+        # 이벤트 루프/스레드가 돌고 있는 프로세스를 fork하면 위험하므로 항상 새로 시작
+        cls._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(*(loop.run_in_executor(cls._executor, _ping) for _ in range(workers)))
+            cls._logger.info(f"🧮 Parse pool ready ({workers} workers)")
+        except Exception as e:
+            cls._fail(e)
+
+    @classmethod
+    async def run(cls, func, *args, size=None):
+        """`func(*args)`를 워커에서 실행하고 결과 반환. size(바이트/글자 수)가 작으면 바로 실행"""
+        if cls._executor is None and not cls._disabled:
+            await cls.start()
+        if cls._executor is None or (size is not None and size < cls.inline_below_bytes):
+            cls.inline += 1
+            return func(*args)
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(cls._executor, func, *args)
+            cls.offloaded += 1
+            return result
+        except BrokenProcessPool as e:
+            cls._fail(e)
+            cls.inline += 1
+            return func(*args)
+
+    @classmethod
+    def _fail(cls, error):
+        cls._logger.warning(f"⚠️ Parse pool unavailable, parsing on the event loop instead: {error}")
+        executor, cls._executor = cls._executor, None
+        cls._disabled = True
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    async def shutdown(cls):
+        if cls.offloaded or cls.inline:
+            cls._logger.info(f"🧮 Parse pool: {cls.offloaded} offloaded, {cls.inline} inline")
+        executor, cls._executor = cls._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
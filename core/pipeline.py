@@ -0,0 +1,58 @@
+import asyncio
+import logging
+
+
+class DeepCrawlStage:
+    """
+    기업 홈페이지 심층 크롤링 전용 단계.
+
+    목록 페이지 워커는 `submit()`으로 아이템을 큐에 넣기만 하고 바로 다음 페이지로 넘어가며,
+    별도의 워커 풀이 홈페이지를 병렬로 방문해 연락처를 보강한 뒤 DataProcessor로 넘김.
+    큐가 가득 차면 `submit()`이 대기하므로 목록 수집이 심층 크롤링보다 너무 앞서 나가지 않음.
+    """
+    def __init__(self, extractor, processor, concurrency=5, queue_size=None, logger=None):
+        self.extractor = extractor
+        self.processor = processor
+        self.concurrency = max(1, concurrency)
+        self.queue = asyncio.Queue(maxsize=queue_size or self.concurrency * 4)
+        self.logger = logger or logging.getLogger("DeepCrawlStage")
+        self._workers = []
+        self.enriched = 0
+        self.failed = 0
+
+    def start(self):
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def submit(self, item, spool_id=None):
+        """spool_id: DataProcessor.spool()로 적어둔 item_id (보강 후 process()에 그대로 넘김)"""
+        await self.queue.put((item, spool_id))
+
+    async def close(self):
+        """남은 아이템을 모두 처리한 뒤 워커 종료"""
+        if not self._workers:
+            return
+        for _ in self._workers:
+            await self.queue.put(None)
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.logger.info(f"🔎 Deep crawl finished: {self.enriched} enriched, {self.failed} failed.")
+
+    async def _worker(self):
+        while True:
+            entry = await self.queue.get()
+            if entry is None:
+                return
+            item, spool_id = entry
+            try:
+                item = await self.extractor.process_company(item)
+                self.enriched += 1
+            except Exception as e:
+                # 보강에 실패해도 목록에서 얻은 정보는 그대로 업로드
+                self.failed += 1
+                self.logger.warning(f"Deep crawl failed for {item.get('홈페이지')}: {e}")
+
+            try:
+                await self.processor.process(item, spool_id)
+            except Exception as e:
+                self.logger.error(f"Failed to queue enriched item: {e}")
@@ -0,0 +1,169 @@
+import time
+import random
+import asyncio
+import logging
+from collections import OrderedDict
+
+from config import RATE_LIMIT_CONFIG, HOST_RATE_LIMIT_CONFIG
+
+# 제한기 동작에 쓰는 설정 키 (for_key에서 설정이 서로 다른지 비교할 때 이것만 봄)
+_OPTION_KEYS = ('initial_rate', 'min_rate', 'max_rate', 'burst', 'increase_step', 'decrease_factor', 'jitter')
+
+
+def retry_after_seconds(headers):
+    """Retry-After 헤더(초 단위)를 읽음. 없거나 날짜 형식이면 None"""
+    if not headers:
+        return None
+    value = headers.get('Retry-After')
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    도메인(domain_group 또는 호스트)별 요청 속도 제한기 (토큰 버킷 / GCRA).
+
+    - acquire()는 다음 요청을 보내도 되는 시각까지 기다렸다가 바로 반환하므로,
+      요청을 보내는 동안에는 아무것도 붙잡고 있지 않음
+    - 성공하면 초당 요청 수를 increase_step만큼 올리고(덧셈),
+      429/503/타임아웃을 받으면 decrease_factor를 곱해 줄임(곱셈). min_rate~max_rate 사이에서만 움직임
+    - Retry-After를 받으면 그 시간 동안 해당 도메인의 모든 요청을 멈춤
+    - jitter는 요청 간격에만 더해짐
+
+    같은 키는 모든 크롤러와 SmartExtractor가 같은 인스턴스를 공유함 (for_key).
+    처음 만든 쪽의 설정을 쓰므로, 다른 설정으로 같은 키를 요청하면 경고만 남김.
+    심층 크롤링 호스트("host:...")는 수가 계속 늘어나므로 idle_seconds 동안 안 쓴 것은 등록부에서 빼고
+    통계만 합계로 남김.
+    """
+    _registry = OrderedDict()
+    _logger = logging.getLogger("RateLimiter")
+    host_idle_seconds = HOST_RATE_LIMIT_CONFIG.get('idle_seconds', 300)
+    _last_sweep = 0.0
+    _evicted_hosts = 0
+    _evicted_requests = 0
+    _evicted_throttled = 0
+
+    def __init__(self, key, config=None):
+        options = dict(RATE_LIMIT_CONFIG)
+        options.update(config or {})
+        self.options = {k: options[k] for k in _OPTION_KEYS}
+        self.key = key
+        self.rate = float(options['initial_rate'])
+        self.min_rate = float(options['min_rate'])
+        self.max_rate = float(options['max_rate'])
+        self.burst = max(1, int(options['burst']))
+        self.increase_step = float(options['increase_step'])
+        self.decrease_factor = float(options['decrease_factor'])
+        self.jitter = float(options['jitter'])
+
+        self._tat = 0.0            # 다음 요청의 이론상 도착 시각 (GCRA)
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._last_used = time.monotonic()
+
+        # 통계
+        self.requests = 0
+        self.throttled = 0
+
+    @classmethod
+    def for_key(cls, key, config=None):
+        limiter = cls._registry.get(key)
+        if limiter is None:
+            if key.startswith("host:"):
+                cls._evict_idle_hosts()
+            limiter = cls(key, config)
+            cls._registry[key] = limiter
+            return limiter
+
+        cls._registry.move_to_end(key)
+        # 호스트 제한기는 요청마다 불리고 설정이 모두 같으므로 비교하지 않음
+        if not key.startswith("host:"):
+            wanted = {**RATE_LIMIT_CONFIG, **(config or {})}
+            conflicts = [k for k in _OPTION_KEYS if float(wanted[k]) != float(limiter.options[k])]
+            if conflicts:
+                # domain_group이 같은 설정끼리 rate_limit이 다르면 먼저 만든 쪽 설정만 쓰임
+                cls._logger.warning(
+                    f"⚠️ [{key}] rate_limit differs from the limiter already in use "
+                    f"({', '.join(f'{k}: {limiter.options[k]} vs {wanted[k]}' for k in conflicts)}). "
+                    f"Keeping the existing one."
+                )
+        return limiter
+
+    @classmethod
+    def _evict_idle_hosts(cls):
+        """오래 안 쓴 호스트 제한기를 등록부에서 뺌 (최근에 쓴 순서대로 정렬돼 있으므로 앞에서부터 봄)"""
+        now = time.monotonic()
+        if now - cls._last_sweep < min(60.0, cls.host_idle_seconds):
+            return
+        cls._last_sweep = now
+        for key in list(cls._registry):
+            if not key.startswith("host:"):
+                continue
+            limiter = cls._registry[key]
+            if now - limiter._last_used < cls.host_idle_seconds:
+                break
+            del cls._registry[key]
+            if limiter.requests:
+                cls._evicted_hosts += 1
+                cls._evicted_requests += limiter.requests
+                cls._evicted_throttled += limiter.throttled
+
+    @property
+    def interval(self):
+        return 1.0 / self.rate
+
+    async def acquire(self):
+        """보낼 차례가 될 때까지 대기 (자리를 예약하고 나서 잠들기 때문에 잠금 불필요)"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        interval = self.interval * (1 + random.uniform(0, self.jitter))
+        tolerance = (self.burst - 1) * self.interval
+
+        send_at = max(now, self._tat - tolerance, self._paused_until)
+        self._tat = max(self._tat, send_at) + interval
+        self.requests += 1
+        # 기다리는 시간까지 포함해 마지막으로 쓴 시각 (멈춘 동안 정리되지 않도록)
+        self._last_used = time.monotonic() + (send_at - now)
+
+        delay = send_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase_step * self.interval)
+
+    def on_throttle(self, retry_after=None, reason="throttled"):
+        """429/503/타임아웃 등 서버가 버거워한다는 신호"""
+        loop_time = asyncio.get_running_loop().time()
+        self.throttled += 1
+        if retry_after:
+            self._paused_until = max(self._paused_until, loop_time + retry_after)
+
+        # 동시에 나간 요청들이 한꺼번에 실패해도 한 번만 줄임
+        if loop_time - self._last_decrease < max(1.0, self.interval):
+            return
+        self._last_decrease = loop_time
+        old_rate = self.rate
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._logger.warning(
+            f"🐢 [{self.key}] {reason}: {old_rate:.2f} → {self.rate:.2f} req/s"
+            + (f", paused {retry_after:.0f}s" if retry_after else "")
+        )
+
+    @classmethod
+    def report(cls):
+        hosts = [l for key, l in cls._registry.items() if key.startswith("host:") and l.requests]
+        host_count = len(hosts) + cls._evicted_hosts
+        for key, limiter in cls._registry.items():
+            if limiter.requests and not key.startswith("host:"):
+                cls._logger.info(
+                    f"🚦 [{key}] {limiter.requests} requests, final {limiter.rate:.2f} req/s, throttled {limiter.throttled}"
+                )
+        if host_count:
+            # 심층 크롤링 호스트는 수가 많으므로 합계만 (정리된 호스트 포함)
+            cls._logger.info(
+                f"🚦 [hosts] {host_count} hosts, {sum(l.requests for l in hosts) + cls._evicted_requests} requests, "
+                f"throttled {sum(l.throttled for l in hosts) + cls._evicted_throttled}"
+            )
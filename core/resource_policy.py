@@ -0,0 +1,108 @@
+import re
+import time
+import fnmatch
+import logging
+
+from config import RESOURCE_POLICY
+
+
+class ResourcePolicy:
+    """
+    브라우저 탭에서 불필요한 리소스(이미지, 폰트, 광고/분석 스크립트 등)를 route로 차단.
+
+    설정 파일 request.resource_policy:
+        true                              → config.py의 RESOURCE_POLICY 그대로 사용
+        { "block_types": [...], ... }     → 기본값 위에 덮어씀
+    """
+    def __init__(self, spec=True):
+        options = dict(RESOURCE_POLICY)
+        if isinstance(spec, dict):
+            options.update(spec)
+        self.block_types = set(options.get('block_types') or [])
+        patterns = options.get('block_patterns') or []
+        self._pattern = re.compile("|".join(fnmatch.translate(p) for p in patterns)) if patterns else None
+        self.wait_until = options.get('wait_until', 'domcontentloaded')
+        self.wait_for = options.get('wait_for')
+        self.baseline_pages = options.get('baseline_pages', 0)
+
+    @classmethod
+    def from_config(cls, req_config):
+        spec = req_config.get('resource_policy')
+        return cls(spec) if spec else None
+
+    def should_block(self, resource_type, url):
+        if resource_type in self.block_types:
+            return True
+        return bool(self._pattern and self._pattern.match(url))
+
+    async def attach(self, page, meter):
+        async def handle(route):
+            request = route.request
+            if meter.blocking and self.should_block(request.resource_type, request.url):
+                meter.blocked += 1
+                await route.abort()
+            else:
+                await route.continue_()
+        await page.route("**/*", handle)
+
+
+class PageMeter:
+    """탭 하나의 로드 구간별 수신 바이트(Content-Length 기준)와 차단 요청 수"""
+    def __init__(self, page):
+        self.bytes = 0
+        self.blocked = 0
+        self.blocking = True
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        try:
+            self.bytes += int(response.headers.get('content-length') or 0)
+        except ValueError:
+            pass
+
+    def reset(self):
+        self.bytes = 0
+        self.blocked = 0
+
+
+class ResourceStats:
+    """페이지 로드당 바이트/시간 집계. baseline(차단 없이 로드)과 비교해 절약량을 보여줌"""
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger("ResourceStats")
+        self._buckets = {
+            'blocked': {'loads': 0, 'bytes': 0, 'seconds': 0.0, 'requests_blocked': 0},
+            'baseline': {'loads': 0, 'bytes': 0, 'seconds': 0.0, 'requests_blocked': 0},
+        }
+
+    def start(self, meter):
+        meter.reset()
+        return time.perf_counter()
+
+    def record(self, meter, started):
+        bucket = self._buckets['blocked' if meter.blocking else 'baseline']
+        bucket['loads'] += 1
+        bucket['bytes'] += meter.bytes
+        bucket['seconds'] += time.perf_counter() - started
+        bucket['requests_blocked'] += meter.blocked
+
+    def baseline_loads(self):
+        return self._buckets['baseline']['loads']
+
+    def _average(self, name):
+        bucket = self._buckets[name]
+        loads = bucket['loads']
+        if not loads:
+            return None
+        return bucket['bytes'] / loads, bucket['seconds'] / loads, bucket['requests_blocked'] / loads
+
+    def report(self):
+        current = self._average('blocked')
+        if current is None:
+            return
+        kb, sec, blocked = current[0] / 1024, current[1], current[2]
+        message = f"🧱 Resource policy: {kb:.0f} KB, {sec:.2f}s per page, {blocked:.1f} requests blocked per page"
+        baseline = self._average('baseline')
+        if baseline is not None:
+            base_kb, base_sec = baseline[0] / 1024, baseline[1]
+            message += f" (saved {base_kb - kb:.0f} KB, {base_sec - sec:.2f}s vs. unblocked {base_kb:.0f} KB, {base_sec:.2f}s)"
+        self.logger.info(message)
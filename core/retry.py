@@ -0,0 +1,77 @@
+import random
+import asyncio
+import logging
+import aiohttp
+
+from config import RETRY_CONFIG
+from .rate_limiter import retry_after_seconds
+from .capture import CaptureTimeout
+
+
+def classify_error(error):
+    """
+    예외를 재시도 정책의 오류 종류로 분류.
+    throttle(429/503) / server(5xx) / timeout / network는 재시도하고, 나머지(client 4xx, 파싱 오류 등)는 하지 않음
+    """
+    if isinstance(error, CaptureTimeout):
+        # 응답 URL 패턴이 틀린 설정 문제 (서버가 느린 게 아님)
+        return 'other'
+    if isinstance(error, aiohttp.ClientResponseError):
+        if error.status in (429, 503):
+            return 'throttle'
+        if error.status >= 500:
+            return 'server'
+        return 'client'
+    # Playwright/Patchright의 TimeoutError도 같은 이름을 씀
+    if isinstance(error, asyncio.TimeoutError) or type(error).__name__ == 'TimeoutError':
+        return 'timeout'
+    if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return 'network'
+    return 'other'
+
+
+class RetryPolicy:
+    """
+    오류 종류별 지수 백오프(+jitter) 재시도.
+
+    설정 예 (config.py의 RETRY_CONFIG, 설정 파일 "retry"로 덮어쓰기):
+        "classes": {"timeout": {"attempts": 3, "base_delay": 2}, ...}
+    대기 시간 = min(max_delay, base_delay * 2^(시도-1)) * (0.5 ~ 1.5), Retry-After가 있으면 그 이상
+    """
+    def __init__(self, config=None, logger=None):
+        options = dict(RETRY_CONFIG)
+        options.update(config or {})
+        self.classes = {**RETRY_CONFIG['classes'], **options.get('classes', {})}
+        self.max_delay = options['max_delay']
+        self.logger = logger or logging.getLogger("RetryPolicy")
+        self.retried = 0
+        self.recovered = 0
+
+    def _delay(self, error, error_class, attempt):
+        base = self.classes[error_class].get('base_delay', 1)
+        delay = min(self.max_delay, base * (2 ** (attempt - 1))) * random.uniform(0.5, 1.5)
+        retry_after = retry_after_seconds(getattr(error, 'headers', None))
+        if retry_after:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    async def run(self, func, *args, label="", **kwargs):
+        attempt = 1
+        while True:
+            try:
+                result = await func(*args, **kwargs)
+                if attempt > 1:
+                    self.recovered += 1
+                return result
+            except Exception as e:
+                error_class = classify_error(e)
+                rule = self.classes.get(error_class)
+                if not rule or attempt >= rule.get('attempts', 1):
+                    raise
+                delay = self._delay(e, error_class, attempt)
+                self.retried += 1
+                self.logger.warning(
+                    f"🔁 {label} {error_class} error ({e}). Retry {attempt}/{rule['attempts'] - 1} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import asyncio
+import logging
+import multiprocessing
+from collections import Counter
+
+from config import OUTBOX_CONFIG, UPLOAD_CONFIG, PARSE_POOL_CONFIG
+from core.engine import GenericAsyncCrawler
+from core.parse_pool import ParsePool
+from core.rate_limiter import AdaptiveRateLimiter
+from utils.data_processor import DataProcessor
+from utils.metrics import Metrics
+
+
+def plan_jobs(config_files):
+    """설정 파일마다 "shards" 값만큼 (설정 경로, 샤드 번호, 샤드 수) 작업을 만듦"""
+    jobs = []
+    for conf_path in config_files:
+        try:
+            with open(conf_path, 'r', encoding='utf-8') as f:
+                shards = max(1, int(json.load(f).get('shards', 1)))
+        except Exception as e:
+            logging.error(f"Config Error {conf_path}: {e}")
+            continue
+        jobs.extend((conf_path, index, shards) for index in range(shards))
+    return jobs
+
+
+def run_multiprocess(config_files, processes):
+    """
+    크롤러(와 샤드)를 여러 프로세스로 나눠 실행.
+
+    - 크롤링 프로세스 N개: 작업을 번갈아 나눠 받아 각자의 이벤트 루프에서 실행
+      (파싱/중복 검사 같은 CPU 작업이 한 프로세스에 몰리지 않음)
+    - 업로드 프로세스 1개: 모든 크롤링 프로세스의 배치를 프로세스 간 큐로 받아
+      기존 보관함(outbox) + 업로더로 전송. 보관함과 GAS 연결은 이 프로세스만 가짐
+
+    프로세스 간 큐는 크기가 정해져 있어서 업로드가 밀리면 크롤링 쪽이 기다림.
+    """
+    jobs = plan_jobs(config_files)
+    if not jobs:
+        logging.error("❌ 실행할 작업 없음")
+        return
+
+    processes = max(1, min(processes, len(jobs)))
+    assignments = [jobs[i::processes] for i in range(processes)]
+
+    # fork는 부모의 이벤트 루프/스레드 상태까지 복사하므로 항상 새로 시작
+    ctx = multiprocessing.get_context("spawn")
+    # 배치 단위로 오가므로 항목 수 기준 버퍼 크기를 배치 수로 환산
+    ipc_queue = ctx.Queue(maxsize=max(4, OUTBOX_CONFIG['buffer_size'] // UPLOAD_CONFIG['batch_size']))
+
+    # 파싱 풀 워커 수를 따로 정하지 않았으면 CPU를 크롤링 프로세스끼리 나눠 씀
+    parse_workers = PARSE_POOL_CONFIG['workers']
+    if parse_workers is None:
+        parse_workers = max(1, (os.cpu_count() or 2) // processes - 1)
+
+    # 지난 실행이 남긴 spool 아이템은 크롤링 프로세스가 spool에 쓰기 시작하기 전에 보관함 배치로 옮겨둠
+    asyncio.run(DataProcessor.recover_spool())
+
+    uploader = ctx.Process(
+        target=_upload_worker, args=(ipc_queue, processes, _metrics_options("Uploader", 0)), name="Uploader"
+    )
+    uploader.start()
+    workers = [
+        ctx.Process(
+            target=_crawl_worker,
+            args=(assigned, ipc_queue, parse_workers, _metrics_options(f"Crawler-{i}", i + 1)),
+            name=f"Crawler-{i}"
+        )
+        for i, assigned in enumerate(assignments)
+    ]
+    for worker in workers:
+        worker.start()
+    logging.info(f"🧵 {len(jobs)} jobs on {processes} crawler processes + 1 uploader")
+
+    # 종료 신호는 종료 코드와 상관없이 부모가 크롤링 프로세스마다 하나씩 보냄
+    # (프로세스가 끝났으면 그 프로세스가 큐에 넣은 배치는 이미 모두 전달된 뒤임)
+    signalled = set()
+    try:
+        for worker in workers:
+            worker.join()
+            if worker.exitcode != 0:
+                logging.error(f"💥 {worker.name} exited with code {worker.exitcode}")
+            ipc_queue.put(None)
+            signalled.add(worker.name)
+        uploader.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.join(timeout=30)
+            if worker.name not in signalled:
+                ipc_queue.put(None)
+        uploader.join(timeout=30)
+        raise
+
+
+def _metrics_options(name, offset):
+    """프로세스마다 지표 포트(port + offset)와 스냅샷 파일(metrics_{name}.json)을 따로 씀"""
+    options = Metrics.options()
+    if options['port']:
+        options['port'] += offset
+    if options['snapshot_path']:
+        root, ext = os.path.splitext(options['snapshot_path'])
+        options['snapshot_path'] = f"{root}_{name}{ext}"
+    return options
+
+
+def _setup_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(processName)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _set_event_loop_policy():
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+def _crawl_worker(jobs, ipc_queue, parse_workers, metrics_options):
+    _setup_logging()
+    _set_event_loop_policy()
+    ParsePool.configure(workers=parse_workers)
+    Metrics.configure(**metrics_options)
+    try:
+        asyncio.run(_crawl_main(jobs, ipc_queue))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        # 종료 신호는 부모(run_multiprocess)가 보내므로 여기서는 기록만 함
+        logging.error(f"Crawler process error: {e}")
+
+
+async def _crawl_main(jobs, ipc_queue):
+    DataProcessor.attach_ipc(ipc_queue)
+    try:
+        await Metrics.start()
+        await DataProcessor.start_worker()
+        await ParsePool.start()
+
+        # 이 프로세스가 맡은 샤드 수 / 전체 샤드 수 = 이 프로세스가 쓸 도메인 속도 몫
+        local_shards = Counter(conf_path for conf_path, _, _ in jobs)
+        crawlers = []
+        for conf_path, index, count in jobs:
+            try:
+                crawlers.append(GenericAsyncCrawler(
+                    conf_path, shard=(index, count), rate_share=local_shards[conf_path] / count
+                ))
+            except Exception as e:
+                logging.error(f"Config Error {conf_path}: {e}")
+        if crawlers:
+            await asyncio.gather(*(crawler.run() for crawler in crawlers))
+    finally:
+        # 남은 데이터를 업로드 프로세스로 넘김
+        await DataProcessor.stop_worker()
+        await ParsePool.shutdown()
+        AdaptiveRateLimiter.report()
+        await Metrics.shutdown()
+
+
+def _upload_worker(ipc_queue, producers, metrics_options):
+    _setup_logging()
+    _set_event_loop_policy()
+    Metrics.configure(**metrics_options)
+    try:
+        asyncio.run(_upload_main(ipc_queue, producers))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _upload_main(ipc_queue, producers):
+    try:
+        await Metrics.start()
+        await DataProcessor.start_worker(recover_spool=False)
+        await DataProcessor.feed_from_ipc(ipc_queue, producers)
+    finally:
+        await DataProcessor.stop_worker()
+        await Metrics.shutdown()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import logging
+
+
+class PageScheduler:
+    """
+    페이지 번호를 필요할 때마다 하나씩 만들어 워커에게 나눠주는 스케줄러.
+
+    체크포인트에는 '여기까지는 빠짐없이 끝났다'는 연속 완료 지점(watermark)과
+    그보다 앞서 먼저 끝난 페이지들을 저장하므로, 재시작 시 정확히 빈 곳부터 이어감.
+    먼저 끝난 페이지는 완료될 때마다 한 줄씩만 추가하므로(state DB의 checkpoint_pages),
+    앞쪽 페이지 하나가 계속 실패해 목록이 길어져도 저장 비용은 페이지당 일정함.
+    """
+    def __init__(self, state_manager, checkpoint_key, start, end, step=1, concurrency=3, logger=None):
+        self.state_manager = state_manager
+        self.checkpoint_key = checkpoint_key
+        self.start = start
+        self.end = end
+        self.step = step
+        self.concurrency = max(1, concurrency)
+        self.logger = logger or logging.getLogger("PageScheduler")
+
+        self.watermark = start - step   # 연속으로 완료된 마지막 페이지
+        self.done = set()               # watermark 이후에 먼저 끝난 페이지들
+        self.in_flight = set()          # 현재 처리 중인 페이지들
+        self._lock = asyncio.Lock()
+
+    async def load(self, legacy_key=None):
+        """저장된 진행 상황 복원. 구버전 체크포인트(`legacy_key`)도 인식함"""
+        raw, pages = await self.state_manager.get_progress(self.checkpoint_key)
+        if raw:
+            try:
+                saved = json.loads(raw)
+                self.watermark = int(saved.get('watermark', self.watermark))
+                legacy_done = saved.get('done', [])
+                self.done = {int(p) for p in list(legacy_done) + pages if int(p) > self.watermark}
+            except (ValueError, TypeError, AttributeError) as e:
+                self.logger.warning(f"체크포인트 형식 오류, 처음부터 시작합니다: {e}")
+                return
+            if legacy_done:
+                # 예전 형식(값 안에 done 목록)은 한 번만 줄 단위로 옮김
+                await self.state_manager.save_progress(self.checkpoint_key, self.watermark, sorted(self.done))
+            return
+
+        if legacy_key:
+            # 구버전은 '이 페이지부터 다시 시작'을 의미했음
+            legacy = await self.state_manager.get_checkpoint(legacy_key)
+            if legacy:
+                self.watermark = int(legacy) - self.step
+
+    @property
+    def next_page(self):
+        return self.watermark + self.step
+
+    @property
+    def is_finished(self):
+        return self.next_page > self.end
+
+    def pending_pages(self):
+        """아직 처리되지 않은 페이지 번호를 지연 생성"""
+        for page in range(self.next_page, self.end + 1, self.step):
+            if page not in self.done:
+                yield page
+
+    async def mark_done(self, page):
+        """페이지 완료 처리 후 watermark를 최대한 앞으로 당기고 체크포인트 저장"""
+        async with self._lock:
+            self.in_flight.discard(page)
+            if page <= self.watermark:
+                return
+            previous = self.watermark
+            self.done.add(page)
+            while self.next_page in self.done:
+                self.done.remove(self.next_page)
+                self.watermark = self.next_page
+
+            # 바뀐 부분만 기록 (watermark가 그대로면 이 페이지 한 줄 추가, 움직였으면 지나간 줄 삭제)
+            advanced = self.watermark != previous
+            await self.state_manager.save_progress(
+                self.checkpoint_key, self.watermark, [page] if page > self.watermark else [], advanced
+            )
+
+    async def run(self, handler, on_failure=None):
+        """
+        `handler(page)`를 최대 concurrency개까지 동시에 실행.
+        handler가 True를 반환한 페이지만 완료로 기록함.
+        실패한 페이지는 `on_failure(page)`가 True를 반환하면(=다른 곳에 재시도 대상으로 저장됨)
+        완료로 보고 watermark가 그 페이지를 지나갈 수 있게 함.
+        """
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def producer():
+            for page in self.pending_pages():
+                await queue.put(page)
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def worker():
+            while True:
+                page = await queue.get()
+                if page is None:
+                    return
+                self.in_flight.add(page)
+                try:
+                    ok = await handler(page)
+                except Exception as e:
+                    self.logger.error(f"Unhandled error on page {page}: {e}")
+                    ok = False
+
+                if not ok and on_failure is not None:
+                    try:
+                        ok = await on_failure(page)
+                    except Exception as e:
+                        self.logger.error(f"Failed to record failed page {page}: {e}")
+
+                if ok:
+                    await self.mark_done(page)
+                else:
+                    self.in_flight.discard(page)
+
+        await asyncio.gather(producer(), *(worker() for _ in range(self.concurrency)))
@@ -3,6 +3,11 @@ import json
 import re
 from bs4 import BeautifulSoup
 from utils.smart_extractor import SmartExtractor
+from .extraction_plan import (
+    ExtractionPlan, PlanUnsupported, parse_field_rule, node_field_names,
+    smart_selector, needs_smart_extraction, CONTACT_SEPARATOR
+)
+from .field_extractors import build_field_extractor
 
 class BaseStrategy:
     def extract(self, content, rules):
@@ -51,25 +56,97 @@ class JsonStrategy(BaseStrategy):
 
 class CssStrategy(BaseStrategy):
     """HTML 파싱 및 스마트 추출"""
+    plan_mode = 'html'
+
     def __init__(self):
         self.smart_extractor = SmartExtractor()
         self.logger = logging.getLogger("CssStrategy")
+        self._plans = {}
+        self._field_extractors = {}
+
+    def _get_plan(self, rules):
+        """설정별 컴파일된 추출 계획 (지원하지 않는 선택자면 None)"""
+        key = json.dumps(rules, sort_keys=True, ensure_ascii=False)
+        if key not in self._plans:
+            try:
+                self._plans[key] = ExtractionPlan(rules, mode=self.plan_mode)
+            except PlanUnsupported as e:
+                self.logger.info(f"Compiled plan unavailable, using BeautifulSoup: {e}")
+                self._plans[key] = None
+        return key, self._plans[key]
 
     def extract(self, content, rules):
-        soup = BeautifulSoup(content, 'html.parser')
+        key, plan = self._get_plan(rules)
+        if plan is None:
+            return self._extract_with_soup(content, rules)
+
+        try:
+            records = plan.extract(content, self.smart_extractor)
+        except PlanUnsupported as e:
+            self.logger.info(f"Compiled plan unavailable, using BeautifulSoup: {e}")
+            self._plans[key] = None
+            return self._extract_with_soup(content, rules)
+
+        if not plan.verified:
+            # 설정별 첫 페이지는 기존 경로와 결과를 비교해, 파서 차이로 달라지면 기존 경로로 고정
+            expected = self._extract_with_soup(content, rules)
+            if self._same_records(records, expected, plan):
+                plan.verified = bool(records)
+            else:
+                self.logger.warning("Compiled plan output differs from BeautifulSoup, falling back.")
+                self._plans[key] = None
+                return expected
+
+        return records
+
+    def _same_records(self, records, expected, plan):
+        """inner_html은 직렬화 방식만 다르므로 비교에서 제외 ('> node' 필드가 있으면 계획을 만들지 않음)"""
+        markup_fields = {f.name for f in plan.fields if f.attr == 'inner_html'}
+        if len(records) != len(expected):
+            return False
+        for a, b in zip(records, expected):
+            for k in set(a) | set(b):
+                if k in markup_fields: continue
+                if a.get(k) != b.get(k):
+                    return False
+        return True
+
+    def _make_soup(self, content):
+        return BeautifulSoup(content, 'html.parser')
+
+    def _get_field_extractor(self, spec):
+        key = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+        if key not in self._field_extractors:
+            self._field_extractors[key] = build_field_extractor(spec)
+        return self._field_extractors[key]
+
+    def _contact_text(self, el, rules):
+        """smart_extraction이 스캔할 텍스트: 텍스트 노드(주석 포함)와 tel:/mailto: 링크"""
+        selector = smart_selector(rules)
+        scopes = el.select(selector) if selector else [el]
+        parts = []
+        for scope in scopes:
+            parts.extend(s for s in scope.find_all(string=True) if not s.isspace())
+            parts.extend(a['href'] for a in scope.select('a[href^="tel:"], a[href^="mailto:"]'))
+        return CONTACT_SEPARATOR.join(parts)
+
+    def _extract_with_soup(self, content, rules):
+        soup = self._make_soup(content)
         
         base_selector = rules.get('base_selector', 'body')
-        elements = soup.select(base_selector)
+        elements = soup.select(base_selector) if base_selector else [soup]
+        node_fields = node_field_names(rules)
         
         results = []
         for el in elements:
             record = {}
             
             for field, selector_str in rules.get('fields', {}).items():
-                if ' > ' in selector_str:
-                    selector, attr = selector_str.rsplit(' > ', 1)
-                else:
-                    selector, attr = selector_str, 'text'
+                if isinstance(selector_str, dict):
+                    record[field] = self._get_field_extractor(selector_str).from_soup(el)
+                    continue
+
+                selector, attr = parse_field_rule(selector_str)
                 
                 if selector == 'self':
                     target = el
@@ -81,21 +158,22 @@ class CssStrategy(BaseStrategy):
                         val = target.get_text(strip=True)
                     elif attr == 'inner_html':
                         val = str(target)
+                    elif attr == 'node':
+                        val = target
                     else:
                         val = target.get(attr, '')
                     record[field] = val
                 else:
                     record[field] = ""
 
-            if rules.get('smart_extraction'):
-                full_text = str(el)
-                smart_data = self.smart_extractor.extract_contacts(full_text)
+            if rules.get('smart_extraction') and needs_smart_extraction(record):
+                smart_data = self.smart_extractor.extract_contacts(self._contact_text(el, rules))
                 
                 for k, v in smart_data.items():
                     if k not in record or not record[k]:
                         record[k] = v
             
-            if any(record.values()):
+            if any(v for k, v in record.items() if k not in node_fields):
                 results.append(record)
                 
         return results
@@ -135,60 +213,43 @@ class RegexStrategy(BaseStrategy):
 
 class XmlStrategy(CssStrategy):
     """XML 파싱 전략 (BeautifulSoup 'xml' 파서 사용)"""
+    plan_mode = 'xml'
+
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger("XmlStrategy")
-        
-    def extract(self, content, rules):
+
+    def _make_soup(self, content):
         try:
-            soup = BeautifulSoup(content, 'xml')
+            return BeautifulSoup(content, 'xml')
         except Exception:
-            soup = BeautifulSoup(content, 'html.parser')
-            
-        base_selector = rules.get('base_selector', '')
-        elements = soup.select(base_selector) if base_selector else [soup]
-        
-        results = []
-        for el in elements:
-            record = {}
-            for field, selector_str in rules.get('fields', {}).items():
-                if ' > ' in selector_str:
-                    selector, attr = selector_str.rsplit(' > ', 1)
-                else:
-                    selector, attr = selector_str, 'text'
-                
-                if selector == 'self':
-                    target = el
-                else:
-                    target = el.select_one(selector)
-                
-                if target:
-                    if attr == 'text':
-                        val = target.get_text(strip=True)
-                    elif attr == 'inner_html':
-                        val = str(target)
-                    else:
-                        val = target.get(attr, '')
-                    record[field] = val
-                else:
-                    record[field] = ""
-            
-            if rules.get('smart_extraction'):
-                full_text = str(el)
-                smart_data = self.smart_extractor.extract_contacts(full_text)
-                
-                for k, v in smart_data.items():
-                    if k not in record or not record[k]:
-                        record[k] = v
+            return BeautifulSoup(content, 'html.parser')
+
+    def _extract_with_soup(self, content, rules):
+        # XML은 base_selector가 없으면 문서 전체를 하나의 레코드로 봄
+        rules = dict(rules)
+        rules.setdefault('base_selector', '')
+        return super()._extract_with_soup(content, rules)
 
-            if any(record.values()):
-                results.append(record)
-        return results
 class StrategyFactory:
+    """전략 인스턴스는 종류별로 하나만 만들어 재사용 (컴파일된 정규식/추출 계획 유지)"""
+    _instances = {}
+
+    @classmethod
+    def get(cls, strategy_type):
+        if strategy_type not in cls._instances:
+            cls._instances[strategy_type] = cls._create(strategy_type)
+        return cls._instances[strategy_type]
+
     @staticmethod
-    def get(strategy_type):
+    def _create(strategy_type):
         if strategy_type == 'json': return JsonStrategy()
         if strategy_type == 'css': return CssStrategy()
         if strategy_type == 'regex': return RegexStrategy()
         if strategy_type == 'xml': return XmlStrategy()
-        raise ValueError(f"Unknown strategy type: {strategy_type}")
\ No newline at end of file
+        raise ValueError(f"Unknown strategy type: {strategy_type}")
+
+
+def extract_records(strategy_type, content, rules):
+    """ParsePool 워커에서 실행하는 추출 함수 (워커마다 전략 인스턴스와 컴파일된 계획을 재사용)"""
+    return StrategyFactory.get(strategy_type).extract(content, rules)
@@ -40,11 +40,20 @@ async def before_save(item):
     
     :param item: 추출된 데이터 딕셔너리 (예: {'기업명': '...', ...})
     :return: 수정된 item (None을 리턴하면 이 데이터는 저장하지 않음)
+
+    설정에서 "_node": "self > node" 로 지정하면 item['_node']에 이미 파싱된 요소(BeautifulSoup Tag)가 들어옴.
+    (문자열을 다시 파싱할 필요 없음. 저장 전에 엔진이 자동으로 제거함)
     """
     # 예: 금액에서 '원' 제거 및 숫자 변환
     # if '매출액' in item:
     #     item['매출액'] = item['매출액'].replace('원', '').replace(',', '')
     
+    # 예: 파싱된 요소에서 직접 값 꺼내기
+    # (항상 BeautifulSoup Tag. 데이터가 없으면 빈 문자열)
+    # node = item.get('_node')
+    # if node:
+    #     item['비고'] = node.get_text(strip=True)
+
     # 예: 특정 조건 데이터 필터링 (저장 안 함)
     # if item.get('상태') == '폐업':
     #     return None
@@ -1,12 +1,20 @@
+import argparse
 import asyncio
+import csv
 import glob
+import json
 import logging
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from core.engine import GenericAsyncCrawler
+from core.rate_limiter import AdaptiveRateLimiter
+from core.parse_pool import ParsePool
+from core.runner import run_multiprocess
 from utils.data_processor import DataProcessor
+from utils.metrics import Metrics
+from utils.state_manager import StateManager
 
 # 로깅 설정
 logging.basicConfig(
@@ -15,16 +23,11 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-async def main():
-    config_pattern = os.path.join("configs", "*.json")
-    config_files = glob.glob(config_pattern)
-    
-    if not config_files:
-        logging.error("❌ 설정 파일 없음")
-        return
-
-    # 1. 전역 업로드 워커 시작
+async def main(config_files):
+    # 1. 전역 업로드 워커 + 파싱용 프로세스 풀 (+ 지표 엔드포인트) 시작
+    await Metrics.start()
     await DataProcessor.start_worker()
+    await ParsePool.start()
 
     try:
         crawlers = []
@@ -42,11 +45,63 @@ async def main():
     finally:
         # 3. 크롤링 끝나면 큐에 남은 데이터 다 보낼 때까지 대기 후 종료
         await DataProcessor.stop_worker()
+        await ParsePool.shutdown()
+        AdaptiveRateLimiter.report()
+        await Metrics.shutdown()
+
+async def import_keys(config_files, csv_path):
+    """구글 시트를 내보낸 CSV로 identity_fields 설정의 식별 키를 미리 채움 (이미 올린 기업 재업로드 방지)"""
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.DictReader(f))
+
+    for conf_path in config_files:
+        with open(conf_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not config.get('identity_fields'):
+            continue
+        name = config.get('name', 'Unknown')
+        # 시트에는 모든 출처가 섞여 있으므로 이 설정이 올린 행만 사용 (수집출처 열이 없으면 전부)
+        records = [row for row in rows if row.get('수집출처', name) == name]
+        state_manager = StateManager(config.get('domain_group', 'default'), identity_fields=config['identity_fields'])
+        try:
+            added = await state_manager.import_identity_keys(records)
+        finally:
+            await state_manager.close()
+        logging.info(f"🔑 {name}: {added} identity keys imported from {len(records)} rows")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--processes", type=int, default=1,
+        help="크롤링 프로세스 수 (2 이상이면 설정/샤드를 여러 프로세스에 나눠 실행)"
+    )
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="단계별 지표 기록 + JSON 스냅샷 저장 (config.py METRICS_CONFIG)"
+    )
+    parser.add_argument(
+        "--metrics-port", type=int,
+        help="지표를 http://127.0.0.1:포트/metrics 로 제공 (--metrics 포함)"
+    )
+    parser.add_argument(
+        "--import-keys", metavar="CSV",
+        help="수집하지 않고, 시트를 내보낸 CSV로 identity_fields 중복 키만 채운 뒤 종료"
+    )
+    args = parser.parse_args()
+    if args.metrics or args.metrics_port:
+        Metrics.configure(enabled=True, port=args.metrics_port)
+
+    config_files = glob.glob(os.path.join("configs", "*.json"))
     try:
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-        asyncio.run(main())
+        if not config_files:
+            logging.error("❌ 설정 파일 없음")
+        elif args.import_keys:
+            asyncio.run(import_keys(config_files, args.import_keys))
+        elif args.processes > 1:
+            run_multiprocess(config_files, args.processes)
+        else:
+            if sys.platform == 'win32':
+                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+            asyncio.run(main(config_files))
     except KeyboardInterrupt:
         logging.info("🛑 강제 종료")
\ No newline at end of file
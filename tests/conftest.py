@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# config.py는 WEBHOOK_URL이 없으면 불러올 수 없음 (테스트는 실제로 전송하지 않음)
+os.environ.setdefault("WEBHOOK_URL", "http://127.0.0.1:9/webhook")
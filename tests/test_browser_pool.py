@@ -0,0 +1,90 @@
+"""BrowserTabPool이 페이지를 넘기는 횟수 (실제 브라우저 없이 가짜 fetcher/page로 확인)"""
+import asyncio
+
+from core.browser_pool import BrowserTabPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def content(self):
+        return "<html></html>"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeFetcher:
+    async def new_page(self, context=None, policy=None):
+        return FakePage()
+
+    async def open_url(self, page, url, policy=None):
+        await asyncio.sleep(0)
+        return 0
+
+    async def run_actions(self, page, actions, page_num=None):
+        await asyncio.sleep(0)
+
+    def begin_load(self, page):
+        return 0
+
+    def finish_load(self, page, started):
+        pass
+
+
+def _crawl(next_page, tabs=2, pages=10, jumpable=None):
+    session = {"tabs": tabs, "next_page": next_page}
+    if jumpable is not None:
+        session["jumpable"] = jumpable
+    config = {"url": "https://example.com/list", "browser_session": session, "pagination": {"start": 1}}
+
+    async def run():
+        pool = BrowserTabPool(FakeFetcher(), config)
+        turns = []
+        original = pool._turn
+
+        async def counting_turn(tab, target):
+            turns.append(target)
+            await original(tab, target)
+
+        pool._turn = counting_turn
+        queue = asyncio.Queue()
+        for page in range(1, pages + 1):
+            queue.put_nowait(page)
+
+        async def worker():
+            # PageScheduler처럼 동시에 tabs개씩 순서대로 요청
+            while not queue.empty():
+                await pool.fetch(config, queue.get_nowait())
+
+        await asyncio.gather(*(worker() for _ in range(tabs)))
+        await pool.close()
+        return pool, turns
+
+    return asyncio.run(run())
+
+
+def test_sequential_pager_turns_each_page_once_with_two_tabs():
+    pool, turns = _crawl([{"type": "click", "selector": "a.next"}])
+    assert pool.size == 1
+    assert turns == list(range(2, 11))
+    assert pool.setups == 1
+
+
+def test_non_jumpable_page_selector_uses_one_tab():
+    pool, turns = _crawl([{"type": "click", "selector": "a[data-page='{page}']"}], jumpable=False)
+    assert pool.size == 1
+    assert len(turns) == 9
+    assert pool.setups == 1
+
+
+def test_jumpable_pager_keeps_tabs():
+    pool, turns = _crawl([{"type": "click", "selector": "a[data-page='{page}']"}])
+    assert pool.size == 2
+    # 탭마다 설정은 한 번, 첫 페이지 말고는 페이지마다 한 번에 이동
+    assert pool.setups == 2
+    assert len(turns) == 9
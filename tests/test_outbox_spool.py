@@ -0,0 +1,105 @@
+"""
+업로드 전에 프로세스가 죽어도 큐에 있던 아이템이 다음 실행 때 전송되는지 확인.
+
+첫 실행은 업로드 큐/심층 크롤링 큐에 아이템이 남아 있고 배치 하나가 전송 중인 상태에서 SIGKILL로 죽고,
+두 번째 실행은 보관함/spool에 남은 것을 다시 보내기만 함. 각 실행은 별도 프로세스에서 돌림.
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+ITEMS = 300
+DIRECT = 200  # 업로드 큐로 바로 가는 아이템 수 (나머지는 심층 크롤링 큐에서 멈춤)
+
+PRELUDE = f"""
+import asyncio, json, os, signal, sys
+sys.path.insert(0, {ROOT!r})
+import utils.data_processor as dp
+from core.pipeline import DeepCrawlStage
+
+class FakeUploader:
+    batch_size = 50
+    sent = []
+    hang = False
+
+    def __init__(self, *args, **kwargs):
+        self._slots = asyncio.Semaphore(3)
+
+    async def start(self):
+        pass
+
+    async def acquire_slot(self):
+        await self._slots.acquire()
+
+    def release_slot(self):
+        self._slots.release()
+
+    async def send(self, data_list):
+        if FakeUploader.hang:
+            await asyncio.sleep(3600)
+        FakeUploader.sent.extend(record['고유키'] for record in data_list)
+        return True
+
+    async def close(self):
+        pass
+
+dp.WebhookUploader = FakeUploader
+"""
+
+CRASH_RUN = PRELUDE + f"""
+class HangingExtractor:
+    async def process_company(self, item):
+        await asyncio.sleep(3600)
+
+async def main():
+    FakeUploader.hang = True
+    await dp.DataProcessor.start_worker()
+    processor = dp.DataProcessor('test')
+    stage = DeepCrawlStage(HangingExtractor(), processor, concurrency=2, queue_size=1000)
+    stage.start()
+
+    items = [{{'기업명': f'기업{{i}}', '대표자명': '대표'}} for i in range({ITEMS})]
+    spool_ids = await processor.spool(items)
+    for item, spool_id in zip(items[:{DIRECT}], spool_ids):
+        await processor.process(item, spool_id)
+    for item, spool_id in zip(items[{DIRECT}:], spool_ids[{DIRECT}:]):
+        await stage.submit(item, spool_id)
+
+    # 배치 몇 개가 보관함에 들어가 전송 중(멈춤)이 될 때까지 기다렸다가 강제 종료
+    await asyncio.sleep(1)
+    os.kill(os.getpid(), signal.SIGKILL)
+
+asyncio.run(main())
+"""
+
+REPLAY_RUN = PRELUDE + """
+async def main():
+    await dp.DataProcessor.start_worker()
+    await dp.DataProcessor.stop_worker()
+    print(json.dumps(FakeUploader.sent, ensure_ascii=False))
+
+asyncio.run(main())
+"""
+
+
+def _run(code, cwd):
+    return subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, timeout=60)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="SIGKILL not available")
+def test_items_queued_before_crash_are_replayed(tmp_path):
+    crashed = _run(CRASH_RUN, tmp_path)
+    assert crashed.returncode == -signal.SIGKILL, crashed.stderr
+
+    replayed = _run(REPLAY_RUN, tmp_path)
+    assert replayed.returncode == 0, replayed.stderr
+    sent = json.loads(replayed.stdout.strip().splitlines()[-1])
+
+    expected = {f"기업{i}_대표" for i in range(ITEMS)}
+    assert sorted(sent) == sorted(expected)
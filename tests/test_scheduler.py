@@ -0,0 +1,92 @@
+"""PageScheduler 체크포인트: 앞쪽 페이지 하나가 계속 실패해도 저장량이 페이지당 일정한지 확인"""
+import asyncio
+import sqlite3
+
+from core.scheduler import PageScheduler
+from utils.state_manager import StateManager
+
+KEY = "test_progress"
+
+
+def _scheduler(state_manager, end):
+    return PageScheduler(state_manager, KEY, start=1, end=end, concurrency=3)
+
+
+def test_permanently_failing_low_page_saves_incrementally(tmp_path):
+    async def first_run():
+        state_manager = StateManager("test", db_dir=str(tmp_path))
+        saved = []
+        original = state_manager.save_progress
+
+        async def spy(key, watermark, pages=(), advanced=True):
+            saved.append(list(pages))
+            await original(key, watermark, pages, advanced)
+
+        state_manager.save_progress = spy
+        scheduler = _scheduler(state_manager, 50)
+        await scheduler.load()
+
+        async def handler(page):
+            return page != 2
+
+        async def on_failure(page):
+            return False  # 재시도 목록에 남기지 못함 → watermark가 지나갈 수 없음
+
+        await scheduler.run(handler, on_failure=on_failure)
+        await state_manager.close()
+        return scheduler, saved
+
+    scheduler, saved = asyncio.run(first_run())
+    assert scheduler.watermark == 1
+    assert scheduler.done == set(range(3, 51))
+    # 완료 때마다 전체 목록이 아니라 많아야 한 페이지만 기록
+    assert all(len(pages) <= 1 for pages in saved)
+
+    with sqlite3.connect(tmp_path / "crawl_state_test.db") as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM checkpoint_pages WHERE key = ?", (KEY,)).fetchone()[0]
+    assert rows == 48
+
+    async def second_run():
+        state_manager = StateManager("test", db_dir=str(tmp_path))
+        scheduler = _scheduler(state_manager, 50)
+        await scheduler.load()
+        resumed = (scheduler.watermark, set(scheduler.done), list(scheduler.pending_pages()))
+
+        async def handler(page):
+            return True
+
+        await scheduler.run(handler)
+        await state_manager.close()
+        return scheduler, resumed
+
+    scheduler, (watermark, done, pending) = asyncio.run(second_run())
+    assert watermark == 1
+    assert done == set(range(3, 51))
+    assert pending == [2]
+    assert scheduler.watermark == 50
+    assert scheduler.is_finished
+
+    with sqlite3.connect(tmp_path / "crawl_state_test.db") as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM checkpoint_pages WHERE key = ?", (KEY,)).fetchone()[0]
+    assert rows == 0
+
+
+def test_legacy_done_list_is_migrated(tmp_path):
+    async def run():
+        state_manager = StateManager("legacy", db_dir=str(tmp_path))
+        await state_manager.save_checkpoint(KEY, '{"watermark": 3, "done": [5, 6]}')
+        scheduler = _scheduler(state_manager, 10)
+        await scheduler.load()
+        await scheduler.mark_done(4)
+        await state_manager.close()
+
+        state_manager = StateManager("legacy", db_dir=str(tmp_path))
+        resumed = _scheduler(state_manager, 10)
+        await resumed.load()
+        await state_manager.close()
+        return scheduler, resumed
+
+    scheduler, resumed = asyncio.run(run())
+    assert scheduler.watermark == 6
+    assert resumed.watermark == 6
+    assert resumed.done == set()
@@ -1,15 +1,26 @@
 import re
-import json
 import logging
 import asyncio
-import random
-import aiohttp
-from config import WEBHOOK_URL
+from concurrent.futures import ThreadPoolExecutor
+from config import WEBHOOK_URL, OUTBOX_CONFIG, UPLOAD_CONFIG
+from utils.outbox import UploadOutbox
+from utils.uploader import WebhookUploader
+from utils.metrics import Metrics
 
 class DataProcessor:
-    # 모든 크롤러가 공유하는 '전역 컨베이어 벨트' (Queue)
-    _global_queue = asyncio.Queue()
+    # 모든 크롤러가 공유하는 '전역 컨베이어 벨트' (Queue). 항목은 (spool item_id, 레코드)
+    # 크기 제한이 있어서 업로드가 밀리면 크롤러의 process()가 자리가 날 때까지 기다림
+    _global_queue = asyncio.Queue(maxsize=OUTBOX_CONFIG.get("buffer_size", 0))
     _worker_task = None
+    # 전송 전에 배치를 디스크에 적어두는 보관함 (성공 응답을 받아야 삭제)
+    # 멀티 프로세스 실행 시 크롤링 프로세스도 spool 기록용으로 같은 파일을 엶
+    _outbox = None
+    # 세션 하나로 여러 배치를 동시에 보내는 업로더
+    _uploader = None
+    _inflight = set()
+    _inflight_items = 0
+    # 멀티 프로세스 실행 시 업로드 프로세스로 배치를 넘기는 프로세스 간 큐 (attach_ipc)
+    _ipc_queue = None
     _logger = logging.getLogger("GlobalProcessor")
 
     def __init__(self, source_name="Unknown"):
@@ -28,115 +39,241 @@ class DataProcessor:
         self.IGNORED_KEYS = ['국가', '설립일', '설립연도', 'Country', 'Establishment']
 
     @classmethod
-    async def start_worker(cls):
-        """백그라운드 배송 트럭 시동 걸기"""
-        if cls._worker_task is None:
+    def attach_ipc(cls, ipc_queue):
+        """(크롤링 프로세스) 직접 업로드하지 않고 배치를 업로드 프로세스로 넘기도록 설정"""
+        cls._ipc_queue = ipc_queue
+
+    @classmethod
+    def _upload_backlog(cls):
+        return cls._global_queue.qsize() + cls._inflight_items
+
+    @classmethod
+    async def start_worker(cls, recover_spool=True):
+        """백그라운드 배송 트럭 시동 걸기
+
+        recover_spool: 지난 실행이 남긴 spool 아이템을 배치로 옮겨 재전송할지 여부.
+        멀티 프로세스 실행에서는 크롤링 프로세스가 spool에 쓰기 전에 부모가 미리 옮기므로 False
+        """
+        Metrics.register_gauge("crawler_queue_items", cls._global_queue.qsize, queue="upload")
+        Metrics.register_gauge("crawler_upload_backlog_items", cls._upload_backlog)
+        if cls._worker_task is None and cls._ipc_queue is not None:
+            cls._outbox = UploadOutbox(OUTBOX_CONFIG["path"])
+            cls._worker_task = asyncio.create_task(cls._forward_loop())
+        elif cls._worker_task is None:
+            cls._outbox = UploadOutbox(OUTBOX_CONFIG["path"])
+            if recover_spool:
+                await cls.recover_spool(cls._outbox)
+            cls._uploader = WebhookUploader(WEBHOOK_URL, logger=cls._logger)
+            await cls._uploader.start()
+            await cls._replay_outbox()
             cls._logger.info("🚚 Data Upload Worker Started...")
             cls._worker_task = asyncio.create_task(cls._process_queue_loop())
 
+    @classmethod
+    async def recover_spool(cls, outbox=None):
+        """지난 실행이 죽으면서 큐에 남긴 아이템(spool)을 보관함 배치로 옮김 (크롤링 시작 전에만 호출)"""
+        own = outbox is None
+        outbox = outbox or UploadOutbox(OUTBOX_CONFIG["path"])
+        try:
+            recovered = await outbox.recover_spool(UPLOAD_CONFIG["batch_size"])
+            if recovered:
+                cls._logger.warning(f"📦 Recovered {recovered} queued items left by an interrupted run.")
+            return recovered
+        finally:
+            if own:
+                await outbox.close()
+
+    @classmethod
+    async def _replay_outbox(cls):
+        """지난 실행에서 전송하지 못한 배치를 먼저 보냄"""
+        max_replays = OUTBOX_CONFIG.get("max_replays")
+        pending = await cls._outbox.pending(max_attempts=max_replays)
+        if pending:
+            cls._logger.info(f"📦 Replaying {len(pending)} unsent batches from outbox...")
+        for batch_id, data_list in pending:
+            await cls._dispatch(batch_id, data_list)
+        await cls._wait_inflight()
+
+        batches, items = await cls._outbox.count()
+        if batches:
+            cls._logger.warning(
+                f"📦 {batches} batches ({items} items) still in outbox "
+                f"({cls._outbox.db_path}). Batches failed {max_replays}+ times are kept but not replayed."
+            )
+
     @classmethod
     async def stop_worker(cls):
         """작업 종료 및 남은 데이터 처리"""
         if cls._worker_task:
             cls._logger.info("🛑 Waiting for remaining data to upload...")
-            await cls._global_queue.join() # 큐가 빌 때까지 대기
+            await cls._global_queue.join() # 큐가 빌 때까지 대기 (전송 중인 배치 포함)
             cls._worker_task.cancel()
             try:
                 await cls._worker_task
             except asyncio.CancelledError:
                 pass
+            cls._worker_task = None
+            if cls._ipc_queue is not None:
+                # 모은 배치는 모두 프로세스 간 큐로 넘김 (종료 신호는 run_multiprocess가 프로세스 종료 후 보냄)
+                await cls._outbox.close()
+                cls._outbox = None
+                return
+            await cls._wait_inflight()
+
+            batches, items = await cls._outbox.count()
+            if batches:
+                cls._logger.warning(f"📦 {batches} batches ({items} items) left in outbox. They will be resent on next start.")
+            await cls._uploader.close()
+            cls._uploader = None
+            await cls._outbox.close()
+            cls._outbox = None
             cls._logger.info("✅ All Uploads Finished.")
 
+    @classmethod
+    async def _collect_batch(cls, batch_size):
+        """큐에서 하나를 기다렸다가, 0.1초 안에 더 들어오는 것까지 batch_size만큼 모음"""
+        # 1. 큐에서 아이템 하나 꺼냄
+        buffer = [await cls._global_queue.get()]
+
+        # 2. 버퍼가 찰 때까지 추가로 꺼냄
+        while len(buffer) < batch_size:
+            try:
+                # 0.1초 안에 더 들어오는게 있으면 같이 보냄
+                extra_item = await asyncio.wait_for(cls._global_queue.get(), timeout=0.1)
+                buffer.append(extra_item)
+            except asyncio.TimeoutError:
+                break # 더 없으면 그냥 보냄
+        return buffer
+
+    @classmethod
+    async def _forward_loop(cls):
+        """(크롤링 프로세스) 모은 배치를 업로드 프로세스로 넘기는 루프. 프로세스 간 큐가 가득 차면 대기"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                batch = await cls._collect_batch(UPLOAD_CONFIG['batch_size'])
+                # 업로드 프로세스가 밀려서 프로세스 간 큐가 가득 차 있으면 여기서 기다림
+                with Metrics.timer("upload_forward"):
+                    await loop.run_in_executor(None, cls._ipc_queue.put, batch)
+                for _ in range(len(batch)):
+                    cls._global_queue.task_done()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                cls._logger.error(f"Forward Error: {e}")
+
+    @classmethod
+    async def feed_from_ipc(cls, ipc_queue, producers):
+        """(업로드 프로세스) 크롤링 프로세스들이 보낸 배치를 업로드 큐에 넣음. 모든 프로세스가 끝나면 반환"""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while producers > 0:
+                batch = await loop.run_in_executor(executor, ipc_queue.get)
+                if batch is None:
+                    producers -= 1
+                    continue
+                for item in batch:
+                    await cls._global_queue.put(item)
+        finally:
+            executor.shutdown(wait=False)
+
     @classmethod
     async def _process_queue_loop(cls):
         """큐에서 데이터를 꺼내 GAS로 보내는 무한 루프"""
-        batch_size = 150
-        buffer = []
-        
         while True:
             try:
-                # 1. 큐에서 아이템 하나 꺼냄
-                item = await cls._global_queue.get()
-                buffer.append(item)
-                
-                # 2. 버퍼가 찰 때까지 추가로 꺼냄 (기다리지 않고 있는 거 다 긁어모음)
-                while len(buffer) < batch_size:
+                # 배치 크기는 업로더가 응답 속도를 보고 조절
+                entries = await cls._collect_batch(cls._uploader.batch_size)
+
+                # 보관함에 먼저 기록한 뒤 GAS 전송 (성공해야 보관함에서 삭제)
+                if entries:
+                    batch = [record for _, record in entries]
                     try:
-                        # 0.1초 안에 더 들어오는게 있으면 같이 보냄
-                        extra_item = await asyncio.wait_for(cls._global_queue.get(), timeout=0.1)
-                        buffer.append(extra_item)
-                    except asyncio.TimeoutError:
-                        break # 더 없으면 그냥 보냄
-                
-                # 3. GAS 전송
-                if buffer:
-                    await cls._send_batch_to_gas(list(buffer))
-                    # 큐 작업 완료 신호 (buffer 개수만큼)
-                    for _ in range(len(buffer)):
-                        cls._global_queue.task_done()
-                    buffer.clear()
-                    
+                        # 배치로 옮긴 아이템은 같은 트랜잭션에서 spool에서 지움
+                        batch_id = await cls._outbox.append(
+                            batch, [item_id for item_id, _ in entries if item_id is not None]
+                        )
+                    except Exception as e:
+                        # 디스크 기록에 실패해도 전송은 시도함 (spool에 남은 아이템은 다음 실행 때 다시 전송됨)
+                        cls._logger.error(f"📦 Outbox write failed: {e}")
+                        batch_id = None
+                    # 동시 전송 자리가 날 때까지만 기다리고, 전송은 백그라운드에서 진행
+                    await cls._dispatch(batch_id, batch, from_queue=True)
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 cls._logger.error(f"Worker Error: {e}")
 
     @classmethod
-    async def _send_batch_to_gas(cls, data_list):
-        """실제 HTTP 전송 로직"""
-        if not data_list: return
+    async def _dispatch(cls, batch_id, data_list, from_queue=False):
+        """전송 자리를 잡고 배치 전송 태스크 시작"""
+        await cls._uploader.acquire_slot()
+        task = asyncio.create_task(cls._deliver(batch_id, data_list, from_queue))
+        cls._inflight.add(task)
+        task.add_done_callback(cls._inflight.discard)
 
-        # 로그에 어떤 출처의 데이터가 섞여있는지 표시
-        sources = set(d.get("수집출처", "Unknown") for d in data_list)
-        cls._logger.info(f"📤 Uploading batch of {len(data_list)} items (Sources: {', '.join(sources)})")
+    @classmethod
+    async def _wait_inflight(cls):
+        if cls._inflight:
+            await asyncio.gather(*list(cls._inflight), return_exceptions=True)
 
-        max_retries = 10
-        payload = {'data': data_list}
-        headers = {'Content-Type': 'application/json'}
+    @classmethod
+    async def _deliver(cls, batch_id, data_list, from_queue=False):
+        """배치 전송 후 성공하면 보관함에서 삭제(ack), 실패하면 실패 횟수만 기록"""
+        cls._inflight_items += len(data_list)
+        result = "error"
+        try:
+            with Metrics.timer("upload"):
+                sent = await cls._uploader.send(data_list)
+            result = "ok" if sent else "failed"
+            if sent:
+                if batch_id is not None:
+                    await cls._outbox.ack(batch_id)
+            elif batch_id is not None:
+                await cls._outbox.mark_failed(batch_id)
+                cls._logger.error(f"📦 Batch #{batch_id} kept in outbox for the next run.")
+        except Exception as e:
+            cls._logger.error(f"Upload Error: {e}")
+        finally:
+            cls._inflight_items -= len(data_list)
+            Metrics.inc("crawler_upload_batches_total", result=result)
+            Metrics.inc("crawler_upload_items_total", len(data_list), result=result)
+            cls._uploader.release_slot()
+            if from_queue:
+                # 큐 작업 완료 신호 (배치 개수만큼)
+                for _ in range(len(data_list)):
+                    cls._global_queue.task_done()
 
-        for attempt in range(max_retries):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        WEBHOOK_URL, 
-                        data=json.dumps(payload, ensure_ascii=False), 
-                        headers=headers,
-                        timeout=45
-                    ) as response:
-                        
-                        if response.status == 200:
-                            resp_json = await response.json()
-                            if resp_json.get("result") == "busy":
-                                wait = (2 ** attempt) + random.uniform(1, 3)
-                                cls._logger.warning(f"⚠️ GAS Busy. Retry in {wait:.1f}s...")
-                                await asyncio.sleep(wait)
-                                continue
-                            
-                            if resp_json.get("result") == "error":
-                                cls._logger.error(f"❌ GAS Error: {resp_json.get('msg')}")
-                                return
-
-                            cls._logger.info(f"✅ Sent {len(data_list)} items.")
-                            return
-
-                        elif response.status >= 500:
-                            await asyncio.sleep(3)
-                            continue
-                        elif response.status == 429:
-                            await asyncio.sleep(5)
-                            continue
+    async def spool(self, raw_items):
+        """중복 검사를 통과한 아이템을 큐에 넣기 전에 디스크(spool)에 적어둠 (커밋 1회). 아이템별 item_id 반환
 
-            except Exception as e:
-                cls._logger.error(f"⚠️ Network Error: {e}")
-                await asyncio.sleep(2)
-        
-        cls._logger.error(f"💀 Failed to upload batch of {len(data_list)} items.")
+        중복 검사 DB에는 이미 '본 것'으로 기록됐으므로, 배치로 보관함에 들어가기 전에 죽어도
+        다음 실행 때 spool에서 다시 보낼 수 있게 함. 심층 크롤링 전 레코드라 보강된 연락처는 빠질 수 있음
+        """
+        return await self._spool_records([self.create_record(item) for item in raw_items])
+
+    @classmethod
+    async def _spool_records(cls, records):
+        if not records or cls._outbox is None:
+            return [None] * len(records)
+        try:
+            return await cls._outbox.spool(records)
+        except Exception as e:
+            cls._logger.error(f"📦 Spool write failed: {e}")
+            return [None] * len(records)
+
+    async def process(self, raw_item, spool_id=None):
+        """ 데이터를 큐에 넣기만 함 (큐가 가득 차 있으면 자리가 날 때까지 대기)
 
-    async def process(self, raw_item):
-        """ 데이터를 큐에 넣기만 함 (즉시 리턴)"""
+        spool_id: spool()로 미리 적어둔 item_id. 없으면 여기서 적어둔 뒤 큐에 넣음
+        """
         cleaned_record = self.create_record(raw_item)
+        if spool_id is None:
+            spool_id = (await self._spool_records([cleaned_record]))[0]
         # 전역 큐에 투입
-        await self._global_queue.put(cleaned_record)
+        await self._global_queue.put((spool_id, cleaned_record))
 
     async def flush(self):
         """이제 개별 flush는 필요 없음 (Global Worker가 처리)"""
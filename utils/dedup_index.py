@@ -0,0 +1,61 @@
+import hashlib
+import sys
+from array import array
+from bisect import bisect_left
+
+
+class FingerprintIndex:
+    """
+    중복 검사용 해시를 64비트 지문(fingerprint)으로 줄여 메모리에 들고 있는 인덱스.
+
+    - 시작할 때 DB에서 읽은 지문: 정렬된 array('Q') → 100만 건당 약 8MB
+    - 실행 중 새로 등록된 지문: set → 건당 약 60~70B (많이 쌓이면 정렬 배열로 합침)
+
+    인덱스에 있으면 이미 본 아이템으로 보고 DB를 건너뜀.
+    (서로 다른 아이템이 같은 64비트 지문을 가질 확률은 100만 건 기준 약 5e-14)
+    인덱스에 없으면 SQLite의 INSERT OR IGNORE로 최종 확인 및 저장함.
+    """
+    MERGE_THRESHOLD = 65536
+
+    def __init__(self):
+        self._base = array('Q')
+        self._delta = set()
+
+    @staticmethod
+    def fingerprint(item_hash):
+        try:
+            return int(item_hash[:16], 16)
+        except ValueError:
+            return int.from_bytes(hashlib.blake2b(item_hash.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def load(self, item_hashes):
+        """DB의 해시 목록으로 정렬 배열을 새로 만듦"""
+        fingerprint = self.fingerprint
+        base = array('Q', (fingerprint(h) for h in item_hashes))
+        self._base = array('Q', sorted(base))
+        self._delta = set()
+
+    def __contains__(self, fp):
+        if fp in self._delta:
+            return True
+        base = self._base
+        i = bisect_left(base, fp)
+        return i < len(base) and base[i] == fp
+
+    def add(self, fp):
+        self._delta.add(fp)
+        if len(self._delta) > max(self.MERGE_THRESHOLD, len(self._base) // 4):
+            self._merge()
+
+    def _merge(self):
+        merged = array('Q', sorted(set(self._base).union(self._delta)))
+        # 참조 교체만 하므로 다른 스레드에서 읽는 중이어도 안전
+        self._base = merged
+        self._delta = set()
+
+    def __len__(self):
+        return len(self._base) + len(self._delta)
+
+    def memory_bytes(self):
+        """대략적인 메모리 사용량 (정렬 배열 + set)"""
+        return self._base.itemsize * len(self._base) + sys.getsizeof(self._delta) + 32 * len(self._delta)
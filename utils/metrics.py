@@ -0,0 +1,333 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from bisect import bisect_left
+
+from config import METRICS_CONFIG
+
+# /metrics에 붙는 설명 (여기 없는 지표는 이름만 나감)
+_HELP = {
+    "crawler_stage_seconds": "Time spent in each crawl stage",
+    "crawler_pages_total": "Listing pages processed",
+    "crawler_items_total": "Listing items by outcome (extracted/new/duplicate)",
+    "crawler_requests_total": "HTTP/browser requests by kind and result",
+    "crawler_bytes_downloaded_total": "Response bytes downloaded",
+    "crawler_inflight_requests": "Requests currently in flight",
+    "crawler_queue_items": "Items waiting in an in-process queue",
+    "crawler_deep_crawl_total": "Company homepages visited by result",
+    "crawler_dedup_lookups_total": "Dedup lookups answered by the in-memory index or SQLite",
+    "crawler_upload_batches_total": "Upload batches by result",
+    "crawler_upload_items_total": "Uploaded items by result",
+    "crawler_upload_backlog_items": "Items queued or in flight to the webhook",
+}
+
+
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self, size):
+        self.counts = [0] * (size + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, buckets, value):
+        self.counts[bisect_left(buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, buckets, q):
+        """버킷 경계로 추정한 분위수 (해당 버킷의 상한값)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return buckets[i] if i < len(buckets) else "+Inf"
+        return "+Inf"
+
+
+class _Timer:
+    """`with Metrics.timer(...)`: 블록에 걸린 시간을 히스토그램에 기록"""
+    __slots__ = ("name", "labels", "started")
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        Metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    단계별 카운터/지연 히스토그램/게이지 (프로세스 전체에서 하나).
+
+    - 꺼져 있으면(기본값) 모든 기록 함수가 바로 반환하고 timer()는 아무것도 안 하는 객체를 돌려줌
+    - 큐 길이처럼 계속 바뀌는 값은 register_gauge()로 읽는 함수만 등록해 두고, 내보낼 때 한 번 읽음
+    - start() 후 port가 있으면 http://host:port/metrics (Prometheus 텍스트), /metrics.json 제공
+    - snapshot_path가 있으면 snapshot_interval초마다, 그리고 종료할 때 JSON 스냅샷 저장
+    """
+    enabled = METRICS_CONFIG['enabled']
+    host = METRICS_CONFIG['host']
+    port = METRICS_CONFIG['port']
+    snapshot_path = METRICS_CONFIG['snapshot_path']
+    snapshot_interval = METRICS_CONFIG['snapshot_interval']
+    buckets = tuple(METRICS_CONFIG['buckets'])
+    _logger = logging.getLogger("Metrics")
+
+    _counters = {}
+    _gauges = {}
+    _gauge_callbacks = {}
+    _histograms = {}
+    _runner = None
+    _snapshot_task = None
+    _started_at = time.time()
+
+    @classmethod
+    def configure(cls, enabled=None, host=None, port=None, snapshot_path=None, snapshot_interval=None):
+        """start() 전에 호출 (명령줄 옵션, 멀티 프로세스 실행 시 프로세스별 포트/파일 지정)"""
+        if enabled is not None:
+            cls.enabled = enabled
+        if host is not None:
+            cls.host = host
+        if port is not None:
+            cls.port = port
+        if snapshot_path is not None:
+            cls.snapshot_path = snapshot_path
+        if snapshot_interval is not None:
+            cls.snapshot_interval = snapshot_interval
+
+    @classmethod
+    def options(cls):
+        """다른 프로세스에 그대로 넘길 수 있는 현재 설정"""
+        return {
+            "enabled": cls.enabled, "host": cls.host, "port": cls.port,
+            "snapshot_path": cls.snapshot_path, "snapshot_interval": cls.snapshot_interval
+        }
+
+    # --- 기록 ---
+
+    @classmethod
+    def inc(cls, name, value=1, **labels):
+        if not cls.enabled:
+            return
+        series = cls._counters.setdefault(name, {})
+        key = _key(labels)
+        series[key] = series.get(key, 0) + value
+
+    @classmethod
+    def add_gauge(cls, name, value, **labels):
+        """게이지 증감 (진행 중인 요청 수 등)"""
+        if not cls.enabled:
+            return
+        series = cls._gauges.setdefault(name, {})
+        key = _key(labels)
+        series[key] = series.get(key, 0) + value
+
+    @classmethod
+    def register_gauge(cls, name, func, **labels):
+        """내보낼 때마다 func()로 값을 읽는 게이지 (큐 길이 등)"""
+        if not cls.enabled:
+            return
+        cls._gauge_callbacks.setdefault(name, {})[_key(labels)] = func
+
+    @classmethod
+    def observe(cls, name, seconds, **labels):
+        if not cls.enabled:
+            return
+        series = cls._histograms.setdefault(name, {})
+        key = _key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram(len(cls.buckets))
+        histogram.observe(cls.buckets, seconds)
+
+    @classmethod
+    def timer(cls, stage, **labels):
+        """`with Metrics.timer("fetch", crawler=name):` → crawler_stage_seconds{stage="fetch",...}"""
+        if not cls.enabled:
+            return _NULL_TIMER
+        return _Timer("crawler_stage_seconds", {"stage": stage, **labels})
+
+    # --- 내보내기 ---
+
+    @classmethod
+    def _read_gauges(cls):
+        gauges = {name: dict(series) for name, series in cls._gauges.items()}
+        for name, callbacks in cls._gauge_callbacks.items():
+            series = gauges.setdefault(name, {})
+            for key, func in callbacks.items():
+                try:
+                    series[key] = func()
+                except Exception:
+                    continue
+        return gauges
+
+    @classmethod
+    def prometheus(cls):
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines = []
+
+        def header(name, kind):
+            if name in _HELP:
+                lines.append(f"# HELP {name} {_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(cls._counters.items()):
+            header(name, "counter")
+            lines.extend(f"{name}{_format_labels(key)} {value}" for key, value in series.items())
+        for name, series in sorted(cls._read_gauges().items()):
+            header(name, "gauge")
+            lines.extend(f"{name}{_format_labels(key)} {value}" for key, value in series.items())
+        bounds = [f"{b:g}" for b in cls.buckets] + ["+Inf"]
+        for name, series in sorted(cls._histograms.items()):
+            header(name, "histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, n in zip(bounds, histogram.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_format_labels(key, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def snapshot(cls):
+        """JSON으로 저장/비교하기 쉬운 형태 (히스토그램은 개수/합계/평균/추정 p50·p99)"""
+        def flatten(name, key):
+            return f"{name}{_format_labels(key)}"
+
+        histograms = {}
+        for name, series in cls._histograms.items():
+            for key, h in series.items():
+                histograms[flatten(name, key)] = {
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "avg": round(h.sum / h.count, 6) if h.count else None,
+                    "p50": h.quantile(cls.buckets, 0.5),
+                    "p99": h.quantile(cls.buckets, 0.99),
+                }
+        return {
+            "timestamp": time.time(),
+            "uptime": round(time.time() - cls._started_at, 1),
+            "pid": os.getpid(),
+            "counters": {flatten(n, k): v for n, s in cls._counters.items() for k, v in s.items()},
+            "gauges": {flatten(n, k): v for n, s in cls._read_gauges().items() for k, v in s.items()},
+            "histograms": histograms,
+        }
+
+    @classmethod
+    def write_snapshot(cls):
+        if not cls.snapshot_path:
+            return
+        directory = os.path.dirname(cls.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{cls.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cls.snapshot(), f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, cls.snapshot_path)
+
+    # --- 수명 ---
+
+    @classmethod
+    async def start(cls):
+        """엔드포인트와 주기적 스냅샷 시작 (꺼져 있으면 아무것도 안 함)"""
+        if not cls.enabled or cls._runner is not None or cls._snapshot_task is not None:
+            return
+        cls._started_at = time.time()
+        if cls.port:
+            from aiohttp import web
+            app = web.Application()
+            app.router.add_get('/metrics', cls._handle_prometheus)
+            app.router.add_get('/metrics.json', cls._handle_json)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            try:
+                await web.TCPSite(runner, cls.host, cls.port).start()
+                cls._runner = runner
+                cls._logger.info(f"📊 Metrics on http://{cls.host}:{cls.port}/metrics")
+            except OSError as e:
+                await runner.cleanup()
+                cls._logger.warning(f"⚠️ Metrics endpoint not started ({cls.host}:{cls.port}): {e}")
+        if cls.snapshot_path and cls.snapshot_interval:
+            cls._snapshot_task = asyncio.create_task(cls._snapshot_loop())
+
+    @classmethod
+    async def _handle_prometheus(cls, request):
+        from aiohttp import web
+        return web.Response(text=cls.prometheus(), content_type='text/plain', charset='utf-8',
+                            headers={'X-Content-Type-Options': 'nosniff'})
+
+    @classmethod
+    async def _handle_json(cls, request):
+        from aiohttp import web
+        return web.json_response(cls.snapshot(), dumps=lambda d: json.dumps(d, ensure_ascii=False, default=str))
+
+    @classmethod
+    async def _snapshot_loop(cls):
+        while True:
+            await asyncio.sleep(cls.snapshot_interval)
+            try:
+                cls.write_snapshot()
+            except Exception as e:
+                cls._logger.error(f"Metrics snapshot failed: {e}")
+
+    @classmethod
+    async def shutdown(cls):
+        """주기 스냅샷/엔드포인트 종료 후 마지막 스냅샷 저장"""
+        if not cls.enabled:
+            return
+        task, cls._snapshot_task = cls._snapshot_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        runner, cls._runner = cls._runner, None
+        if runner is not None:
+            await runner.cleanup()
+        try:
+            cls.write_snapshot()
+            if cls.snapshot_path:
+                cls._logger.info(f"📊 Metrics snapshot saved: {cls.snapshot_path}")
+        except Exception as e:
+            cls._logger.error(f"Metrics snapshot failed: {e}")
@@ -0,0 +1,155 @@
+import sqlite3
+import json
+import os
+import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+class UploadOutbox:
+    """
+    업로드 대기 배치를 디스크(SQLite)에 먼저 적어두는 보관함.
+
+    배치는 전송 전에 한 줄(row)로 순서대로 추가되고, 웹훅이 성공을 돌려줬을 때만 삭제(ack)됨.
+    전송에 끝내 실패하거나 도중에 프로그램이 죽어도 남아 있다가 다음 실행 때 다시 전송됨.
+
+    배치로 묶이기 전의 아이템(업로드 큐, 심층 크롤링 큐, 프로세스 간 큐에 있는 것)은
+    중복 검사 직후 spool 테이블에 한 줄씩 적어둠. 배치로 추가될 때 같은 트랜잭션에서 지워지고,
+    도중에 죽어서 남은 것은 다음 실행 시작 시 recover_spool()이 배치로 옮겨 다시 전송함.
+    StateManager와 마찬가지로 전용 스레드 하나가 연결 하나를 계속 재사용함.
+    """
+    def __init__(self, db_path=os.path.join("states", "upload_outbox.db")):
+        self.db_path = db_path
+        self.logger = logging.getLogger("UploadOutbox")
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._conn = None
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _get_conn(self):
+        """(전용 스레드) 계속 재사용하는 연결"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS outbox (
+                    batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    item_count INTEGER NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS spool (
+                    item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._conn.commit()
+        return self._conn
+
+    async def spool(self, records):
+        """배치로 묶이기 전의 아이템을 적어두고 아이템별 item_id 목록 반환 (커밋 1회)"""
+        payloads = [json.dumps(record, ensure_ascii=False) for record in records]
+        return await self._run(self._spool_sync, payloads)
+
+    def _spool_sync(self, payloads):
+        conn = self._get_conn()
+        item_ids = [
+            conn.execute("INSERT INTO spool (payload) VALUES (?)", (payload,)).lastrowid
+            for payload in payloads
+        ]
+        conn.commit()
+        return item_ids
+
+    async def append(self, data_list, spool_ids=()):
+        """배치를 보관함에 추가하고 batch_id 반환. 같은 트랜잭션에서 spool_ids 아이템을 spool에서 지움"""
+        payload = json.dumps(data_list, ensure_ascii=False)
+        return await self._run(self._append_sync, payload, len(data_list), list(spool_ids))
+
+    def _append_sync(self, payload, item_count, spool_ids):
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "INSERT INTO outbox (payload, item_count) VALUES (?, ?)", (payload, item_count)
+        )
+        if spool_ids:
+            conn.executemany("DELETE FROM spool WHERE item_id = ?", [(item_id,) for item_id in spool_ids])
+        conn.commit()
+        return cursor.lastrowid
+
+    async def recover_spool(self, batch_size):
+        """지난 실행이 배치로 옮기지 못하고 남긴 spool 아이템을 배치로 옮김. 옮긴 아이템 수 반환
+
+        크롤러가 spool에 쓰기 시작하기 전에만 호출해야 함 (진행 중인 아이템까지 옮기면 두 번 전송됨)
+        """
+        return await self._run(self._recover_spool_sync, max(1, batch_size))
+
+    def _recover_spool_sync(self, batch_size):
+        conn = self._get_conn()
+        rows = conn.execute("SELECT item_id, payload FROM spool ORDER BY item_id").fetchall()
+        for i in range(0, len(rows), batch_size):
+            chunk = [json.loads(payload) for _, payload in rows[i:i + batch_size]]
+            conn.execute(
+                "INSERT INTO outbox (payload, item_count) VALUES (?, ?)",
+                (json.dumps(chunk, ensure_ascii=False), len(chunk))
+            )
+        if rows:
+            conn.execute("DELETE FROM spool WHERE item_id <= ?", (rows[-1][0],))
+        conn.commit()
+        return len(rows)
+
+    async def ack(self, batch_id):
+        """전송 성공한 배치 삭제"""
+        await self._run(self._ack_sync, batch_id)
+
+    def _ack_sync(self, batch_id):
+        conn = self._get_conn()
+        conn.execute("DELETE FROM outbox WHERE batch_id = ?", (batch_id,))
+        conn.commit()
+
+    async def mark_failed(self, batch_id):
+        """전송 실패 횟수 기록 (배치는 남겨둠)"""
+        await self._run(self._mark_failed_sync, batch_id)
+
+    def _mark_failed_sync(self, batch_id):
+        conn = self._get_conn()
+        conn.execute("UPDATE outbox SET attempts = attempts + 1 WHERE batch_id = ?", (batch_id,))
+        conn.commit()
+
+    async def pending(self, max_attempts=None):
+        """아직 전송되지 않은 배치 목록 [(batch_id, data_list), ...] (오래된 순)"""
+        rows = await self._run(self._pending_sync, max_attempts)
+        return [(batch_id, json.loads(payload)) for batch_id, payload in rows]
+
+    def _pending_sync(self, max_attempts):
+        conn = self._get_conn()
+        if max_attempts is None:
+            cursor = conn.execute("SELECT batch_id, payload FROM outbox ORDER BY batch_id")
+        else:
+            cursor = conn.execute(
+                "SELECT batch_id, payload FROM outbox WHERE attempts < ? ORDER BY batch_id", (max_attempts,)
+            )
+        return cursor.fetchall()
+
+    async def count(self):
+        """(배치 수, 아이템 수)"""
+        return await self._run(self._count_sync)
+
+    def _count_sync(self):
+        row = self._get_conn().execute("SELECT COUNT(*), COALESCE(SUM(item_count), 0) FROM outbox").fetchone()
+        return row[0], row[1]
+
+    async def close(self):
+        await self._run(self._close_sync)
+
+    def _close_sync(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
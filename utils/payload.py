@@ -0,0 +1,95 @@
+"""
+웹훅 업로드 본문 형식.
+
+- rows (기본): {"data": [{"기업명": ..., "대표자명": ..., ...}, ...]}
+- columnar: 같은 키를 행마다 반복하지 않고 헤더 한 줄 + 값 배열로 보냄.
+  수집출처별로 묶고, 묶음 안에서 모든 행이 같은 값을 갖는 열(수집출처, 빈 팩스 등)은
+  constants로 빼서 한 번만 보냄. 행에 없는 키는 null로 채움.
+
+    {"format": "columnar",
+     "groups": [{"constants": {"수집출처": "innobiz", "팩스": ""},
+                 "columns": ["기업명", "대표자명", ...],
+                 "rows": [["가나다", "홍길동", ...], ...]}]}
+
+- gzip (UPLOAD_CONFIG["gzip"]): 위 본문을 gzip 후 base64로 감싸서 보냄.
+  GAS 웹 앱은 요청 헤더(Content-Encoding)를 볼 수 없고 본문을 문자열로만 받으므로 바이너리 대신 이 형식을 씀.
+
+    {"encoding": "gzip", "payload": "<base64>"}
+
+GAS 쪽 수신 코드는 README의 decodeBatch 참고. decode_batch()는 그 코드를 그대로 옮긴 것으로,
+로컬 테스트/벤치마크에서 GAS 대신 씀.
+"""
+import json
+import gzip
+import base64
+
+FORMATS = ('rows', 'columnar')
+
+
+def to_columnar(data_list):
+    groups = {}
+    for record in data_list:
+        groups.setdefault(record.get("수집출처"), []).append(record)
+
+    encoded = []
+    for records in groups.values():
+        columns = []
+        seen = set()
+        for record in records:
+            for key in record:
+                if key not in seen:
+                    seen.add(key)
+                    columns.append(key)
+
+        constants = {}
+        if len(records) > 1:
+            missing = object()
+            for key in columns:
+                first = records[0].get(key, missing)
+                if first is not missing and all(r.get(key, missing) == first for r in records):
+                    constants[key] = first
+
+        columns = [key for key in columns if key not in constants]
+        rows = [[record.get(key) for key in columns] for record in records]
+        encoded.append({"constants": constants, "columns": columns, "rows": rows})
+
+    return {"format": "columnar", "groups": encoded}
+
+
+def from_columnar(payload):
+    records = []
+    for group in payload["groups"]:
+        constants = group.get("constants") or {}
+        columns = group["columns"]
+        for row in group["rows"]:
+            record = dict(constants)
+            for key, value in zip(columns, row):
+                if value is not None:
+                    record[key] = value
+            records.append(record)
+    return records
+
+
+def serialize(data_list, fmt='rows', compress=False):
+    """요청 본문(bytes) 생성. compress면 gzip+base64 봉투로 감쌈"""
+    if fmt == 'columnar':
+        body = to_columnar(data_list)
+    elif fmt == 'rows':
+        body = {'data': data_list}
+    else:
+        raise ValueError(f"Unknown upload format: {fmt}")
+    encoded = json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if compress:
+        envelope = {"encoding": "gzip", "payload": base64.b64encode(gzip.compress(encoded)).decode('ascii')}
+        encoded = json.dumps(envelope, separators=(',', ':')).encode('utf-8')
+    return encoded
+
+
+def decode_batch(body):
+    """(GAS decodeBatch 대역) 요청 본문을 레코드 목록으로 복원"""
+    params = json.loads(body)
+    if params.get("encoding") == "gzip":
+        params = json.loads(gzip.decompress(base64.b64decode(params["payload"])))
+    if params.get("format") == "columnar":
+        return from_columnar(params)
+    return params.get("data")
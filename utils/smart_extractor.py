@@ -1,15 +1,122 @@
 # smart_extractor.py
 import re
 import aiohttp
+import asyncio
+import hashlib
 import concurrent.futures
 import time
 import random
+from collections import OrderedDict
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+
+from config import HOST_RATE_LIMIT_CONFIG
+from core.rate_limiter import AdaptiveRateLimiter, retry_after_seconds
+from core.parse_pool import ParsePool
+from utils.metrics import Metrics
+
+# 기업 홈페이지 하위 리소스(frame, script) 수집 한도
+SUBRESOURCE_LIMITS = {
+    "max_bytes_per_resource": 512 * 1024,    # 리소스 하나당 최대 크기
+    "max_bytes_per_company": 2 * 1024 * 1024, # 기업 하나당 하위 리소스 총량
+    "time_budget": 8.0,                      # 기업 하나당 하위 리소스 수집 시간(초)
+    "max_resources": 16                      # 기업 하나당 최대 리소스 개수
+}
+
+# JS/JSON 문자열 안의 이스케이프 (\uXXXX, \xHH, \n 등). 한글 같은 다른 문자는 그대로 둠
+_ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|[\\\'"abfnrtv])')
+_SIMPLE_ESCAPES = {
+    '\\': '\\', "'": "'", '"': '"', 'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v'
+}
+
+# 전화번호가 들어 있을 수 있는 구간: 숫자/+로 시작해서 숫자와 구분자가 8자 이상 이어진 곳
+# (전화번호 정규식에 쓰이는 문자만 포함하므로, 이 구간 밖에서는 전화번호가 나올 수 없음)
+_PHONE_REGION = re.compile(r'[+\d][\d\s.\-()+]{7,}')
+
+# 이메일이 들어 있을 수 있는 구간: '@'를 포함하고 이메일에 쓰이는 문자만 이어진 곳
+_EMAIL_TOKEN_TAIL = re.compile(r'[a-zA-Z0-9._%+\-@]*')
+_EMAIL_TOKEN_HEAD = re.compile(r'[a-zA-Z0-9._%+\-]*')
+_EMAIL_LOOKBACK = 256  # '@' 앞쪽으로 확인하는 최대 글자 수
+
+_EMAIL_JUNK = ['.png', '.jpg', '.gif', '.js', 'w3.org', 'example', 'sentry', 'u003e', '.css', 'node_modules']
+_GARBAGE_PARTS = frozenset([
+    '0000', '1111', '2222', '3333', '4444', '5555', '6666', '7777', '8888', '9999', '1234', '2345', '5678', '4321'
+])
+
+
+def _replace_escape(match):
+    code = match.group(1)
+    if len(code) > 1:
+        return chr(int(code[1:], 16))
+    return _SIMPLE_ESCAPES[code]
+
+
+def unescape_js(text):
+    """이스케이프된 부분만 풀어냄 (없으면 그대로 반환)"""
+    if '\\' not in text:
+        return text
+    return _ESCAPE_PATTERN.sub(_replace_escape, text)
+
+
+def _keyword_regex(keywords, flags=0):
+    """키워드 목록 중 하나라도 들어 있는지 한 번에 찾는 정규식"""
+    return re.compile('|'.join(re.escape(k) for k in keywords), flags)
+
+
+class SubresourceCache:
+    """
+    여러 기업이 같은 호스팅 업체의 번들을 쓰는 경우가 많아서,
+    URL → 내용 해시, 내용 해시 → 추출 결과를 LRU로 기억해 한 번만 받고 한 번만 스캔함.
+    """
+    TOO_LARGE = "too_large"
+    EMPTY_RESULT = (frozenset(), frozenset(), frozenset())
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._digest_by_url = OrderedDict()
+        self._result_by_digest = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, table, key):
+        value = table.get(key)
+        if value is not None:
+            table.move_to_end(key)
+        return value
+
+    def _put(self, table, key, value):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def lookup_url(self, url):
+        """URL로 이미 스캔한 결과가 있으면 반환"""
+        digest = self._get(self._digest_by_url, url)
+        result = self._get(self._result_by_digest, digest) if digest else None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def lookup_digest(self, url, digest):
+        """다른 URL에서 받은 같은 내용이면 스캔 결과 재사용"""
+        self._put(self._digest_by_url, url, digest)
+        return self._get(self._result_by_digest, digest)
+
+    def store(self, url, digest, result):
+        self._put(self._digest_by_url, url, digest)
+        self._put(self._result_by_digest, digest, result)
 
 class SmartExtractor:
-    def __init__(self, session=None):
+    # 프로세스(=실행 1회) 전체에서 공유하는 하위 리소스 캐시
+    subresource_cache = SubresourceCache()
+
+    def __init__(self, session=None, rate_limit=None):
         self.session = session
+        # 기업 홈페이지 호스트별 속도 제한 (모든 크롤러가 공유, False면 끔)
+        self.rate_limit = HOST_RATE_LIMIT_CONFIG if rate_limit is None else rate_limit
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
@@ -69,11 +176,16 @@ class SmartExtractor:
         
         # 쓰레기 번호 목록
         # 웹사이트 템플릿에 자주 쓰이는 가짜 번호들
-        self.garbage_full_numbers = [
+        self.garbage_full_numbers = frozenset([
             '02-1212-2121', '02-1231-2132', '010-101-0101', '010-0000-0000', 
             '02-000-0000', '02-1111-1111', '010-1234-5678', '010-1111-2222',
             '000-0000-0000', '123-456-7890', '070-1234-5678'
-        ]
+        ])
+
+        # 매치마다 키워드 목록을 도는 대신 한 번에 검사
+        self.fax_regex = _keyword_regex(self.fax_keywords)
+        self.negative_regex = _keyword_regex(self.negative_keywords)
+        self.email_junk_regex = _keyword_regex(_EMAIL_JUNK, re.IGNORECASE)
 
         self.blocked_domains = [
             'facebook.com', 'instagram.com', 'jobkorea.co.kr', 'saramin.co.kr', 
@@ -90,9 +202,7 @@ class SmartExtractor:
             return True
 
         # 2. 단순 연속/반복 숫자 패턴
-        garbage_patterns = ['0000', '1111', '2222', '3333', '4444', '5555', '6666', '7777', '8888', '9999', '1234', '2345', '5678', '4321']
-        
-        if mid in garbage_patterns or end in garbage_patterns:
+        if mid in _GARBAGE_PARTS or end in _GARBAGE_PARTS:
             return True
             
         # 3. 국번과 뒷자리가 똑같은 경우 (예: 1234-1234)
@@ -105,57 +215,185 @@ class SmartExtractor:
 
         return False
 
-    async def _fetch_text(self, url, session):
-        """내부 헬퍼: URL에서 텍스트만 안전하게 가져옴"""
+    def _limiter_for(self, url):
+        host = urlparse(url).hostname
+        if self.rate_limit is False or not host:
+            return None
+        return AdaptiveRateLimiter.for_key(f"host:{host}", self.rate_limit)
+
+    def _feedback(self, limiter, resp):
+        """응답 상태를 속도 제한기에 알려줌"""
+        if limiter is None:
+            return
+        if resp.status in (429, 503):
+            limiter.on_throttle(retry_after_seconds(resp.headers), reason=f"HTTP {resp.status}")
+        elif resp.status < 400:
+            limiter.on_success()
+
+    async def _fetch_text(self, url, session, budget=None):
+        """
+        내부 헬퍼: URL에서 텍스트만 안전하게 가져옴.
+        `budget`이 주어지면 리소스 하나/기업 전체 바이트 한도를 넘지 않게 읽다가 끊음.
+        반환값: (텍스트, 원본 바이트의 해시)
+        """
+        resource_limit = SUBRESOURCE_LIMITS['max_bytes_per_resource']
+        max_bytes = resource_limit
+        if budget is not None:
+            max_bytes = min(max_bytes, budget['bytes'])
+            if max_bytes <= 0:
+                return "", None
+
+        limiter = self._limiter_for(url)
         try:
-            async with session.get(url, headers=self.headers, timeout=5) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-        except:
+            if limiter:
+                await limiter.acquire()
+            Metrics.add_gauge("crawler_inflight_requests", 1, kind="subresource")
+            try:
+                async with session.get(url, headers=self.headers, timeout=5) as resp:
+                    self._feedback(limiter, resp)
+                    if resp.status != 200:
+                        return "", None
+                    if resp.content_length and resp.content_length > max_bytes:
+                        too_large = resp.content_length > resource_limit
+                        return "", (SubresourceCache.TOO_LARGE if too_large else None)
+
+                    chunks = []
+                    size = 0
+                    async for chunk in resp.content.iter_chunked(16 * 1024):
+                        size += len(chunk)
+                        if budget is not None:
+                            budget['bytes'] -= len(chunk)
+                        if size > resource_limit:
+                            return "", SubresourceCache.TOO_LARGE
+                        if size > max_bytes or (budget is not None and budget['bytes'] < 0):
+                            return "", None
+                        chunks.append(chunk)
+
+                    body = b"".join(chunks)
+                    Metrics.inc("crawler_bytes_downloaded_total", size, kind="subresource")
+                    return body.decode(resp.charset or 'utf-8', errors='replace'), hashlib.md5(body).hexdigest()
+            finally:
+                Metrics.add_gauge("crawler_inflight_requests", -1, kind="subresource")
+        except asyncio.TimeoutError:
+            if limiter:
+                limiter.on_throttle(reason="timeout")
+        except Exception:
             pass
-        return ""
+        return "", None
+
+    def _frame_urls(self, soup, base_url):
+        urls = []
+        for frame in soup.select('frame, iframe'):
+            src = frame.get('src')
+            if src:
+                urls.append(urljoin(base_url, src))
+        return urls
+
+    def _script_urls(self, soup, base_url):
+        urls = []
+        for script in soup.select('script[src]'):
+            src = script.get('src')
+            if not src: continue
+
+            lower_src = src.lower()
+            if any(x in lower_src for x in ['google', 'facebook', 'kakao', 'naver', 'analytics', 'ad', 'tracker', 'jquery', 'bootstrap', 'swiper', 'slick', 'aos', 'gsap']):
+                continue
 
-    async def get_text_with_frames(self, soup, base_url, session):
-        text_content = ""
-        try:
-            frames = soup.select('frame, iframe')
-            if not frames: return ""
-            
-            for frame in frames:
-                src = frame.get('src')
-                if not src: continue
-                frame_url = urljoin(base_url, src)
-                
-                html = await self._fetch_text(frame_url, session)
-                if html:
-                    frame_soup = BeautifulSoup(html, 'html.parser')
-                    text_content += " " + frame_soup.get_text(separator=' ', strip=True)
-        except: pass
-        return text_content
-    
-    async def get_js_content(self, soup, base_url, session):
-        js_text = ""
-        try:
-            scripts = soup.select('script[src]')
-            for script in scripts:
-                src = script.get('src')
-                if not src: continue
-                
-                lower_src = src.lower()
-                if any(x in lower_src for x in ['google', 'facebook', 'kakao', 'naver', 'analytics', 'ad', 'tracker', 'jquery', 'bootstrap', 'swiper', 'slick', 'aos', 'gsap']):
-                    continue
+            if not (src.startswith('/') or './' in src or 'main' in lower_src or 'bundle' in lower_src or 'app' in lower_src or 'chunk' in lower_src):
+                continue
 
-                if not (src.startswith('/') or './' in src or 'main' in lower_src or 'bundle' in lower_src or 'app' in lower_src or 'chunk' in lower_src):
-                    continue
+            urls.append(urljoin(base_url, src))
+        return urls
 
-                js_url = urljoin(base_url, src)
-                
-                content = await self._fetch_text(js_url, session)
-                if content:
-                    js_text += " " + content
-        except:
-            pass
-        return js_text
+    def scan_resource_text(self, raw, kind):
+        """(CPU 작업) frame/script 내용 하나를 스캔해 (이메일, 전화, 팩스) frozenset 튜플로 반환"""
+        text = raw
+        if kind == 'frame':
+            text = BeautifulSoup(raw, 'html.parser').get_text(separator=' ', strip=True)
+
+        info = {'email': set(), 'tel': set(), 'fax': set()}
+        self.extract_info_from_text(text, info)
+        return (frozenset(info['email']), frozenset(info['tel']), frozenset(info['fax']))
+
+    def analyze_html(self, raw_source_text, url):
+        """(CPU 작업) 홈페이지 HTML에서 연락처를 뽑고, 추가로 받아볼 frame/script 목록을 반환"""
+        info = {'email': set(), 'tel': set(), 'fax': set()}
+        soup = BeautifulSoup(raw_source_text, 'html.parser')
+
+        self.extract_links_from_soup(soup, info)
+
+        # 보이는 텍스트(태그 사이에 끊긴 번호)와 원본(속성, 스크립트 안의 번호)을 각각 한 번씩만 스캔
+        visible_text = soup.get_text(separator=' ', strip=True)
+        self.extract_info_from_text(visible_text, info)
+        if raw_source_text != visible_text:
+            self.extract_info_from_text(raw_source_text, info)
+
+        try:
+            targets = [(u, 'frame') for u in self._frame_urls(soup, url)]
+            targets += [(u, 'js') for u in self._script_urls(soup, url)]
+        except Exception:
+            targets = []
+        return info, targets
+
+    async def _scan_subresource(self, url, kind, session, budget):
+        """frame/script 하나를 받아 연락처를 스캔. 같은 URL이나 같은 내용은 캐시 결과를 재사용"""
+        cache = self.subresource_cache
+        result = cache.lookup_url(url)
+        if result is not None:
+            return result
+
+        raw, digest = await self._fetch_text(url, session, budget)
+        if digest == SubresourceCache.TOO_LARGE:
+            # 한도를 넘는 리소스는 다음 기업에서도 다시 받지 않음
+            cache.store(url, digest, SubresourceCache.EMPTY_RESULT)
+            return None
+        if not raw:
+            return None
+
+        result = cache.lookup_digest(url, digest)
+        if result is not None:
+            return result
+
+        result = await ParsePool.run(scan_resource, raw, kind, size=len(raw))
+        cache.store(url, digest, result)
+        return result
+
+    async def scan_subresources(self, targets, session, info):
+        """
+        frame과 script(`targets`: [(url, 'frame'|'js'), ...])를 동시에 받아 스캔하고 결과를 info에 합침.
+        기업 하나당 바이트/시간 한도를 넘으면 끝난 것까지만 반영함.
+        """
+        seen = set()
+        unique_targets = []
+        for url, kind in targets:
+            if url in seen: continue
+            seen.add(url)
+            unique_targets.append((url, kind))
+        unique_targets = unique_targets[:SUBRESOURCE_LIMITS['max_resources']]
+        if not unique_targets:
+            return
+
+        budget = {'bytes': SUBRESOURCE_LIMITS['max_bytes_per_company']}
+        tasks = [
+            asyncio.create_task(self._scan_subresource(url, kind, session, budget))
+            for url, kind in unique_targets
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=SUBRESOURCE_LIMITS['time_budget'])
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            if task.cancelled() or task.exception() is not None:
+                continue
+            result = task.result()
+            if not result:
+                continue
+            emails, tels, faxes = result
+            info['email'].update(emails)
+            info['tel'].update(tels)
+            info['fax'].update(faxes)
 
     def normalize_phone(self, area, mid, end):
         if mid is None:
@@ -206,55 +444,65 @@ class SmartExtractor:
             if '@' in raw_mail:
                  info_dict['email'].add(raw_mail)
 
+    def _iter_emails(self, text):
+        """'@' 주변 구간에서만 이메일 정규식을 돌림 (전체 텍스트에 돌린 것과 같은 결과)"""
+        at = text.find('@')
+        while at != -1:
+            head = text[max(0, at - _EMAIL_LOOKBACK):at][::-1]
+            start = at - _EMAIL_TOKEN_HEAD.match(head).end()
+            end = _EMAIL_TOKEN_TAIL.match(text, at).end()
+            yield from self.email_pattern.findall(text, start, end)
+            at = text.find('@', end)
+
     def extract_info_from_text(self, text, info_dict):
+        """
+        텍스트 하나를 한 번만 훑어서 이메일/전화번호/팩스를 info_dict에 추가.
+        이메일은 '@' 주변만, 전화번호는 숫자가 이어진 구간만 정규식으로 확인하고 나머지는 건너뜀.
+        """
         if not text: return
-        
-        try:
-            text = text.encode('utf-8').decode('unicode_escape')
-        except:
-            pass
 
-        text_lower = text.lower()
-        
-        emails = self.email_pattern.findall(text)
-        for email in emails:
-            if not any(ext in email.lower() for ext in ['.png', '.jpg', '.gif', '.js', 'w3.org', 'example', 'sentry', 'u003e', '.css', 'node_modules']):
-                info_dict['email'].add(email)
-
-        matches = self.phone_regex.finditer(text_lower)
-        for match in matches:
-            groups = match.groupdict()
-            
-            area, mid, end = "", "", ""
-
-            if groups['intl_area']:
-                area, mid, end = groups['intl_area'], groups['intl_mid'], groups['intl_end']
-                if not area.startswith('0'): area = '0' + area
-            elif groups['rep_head']:
-                area, mid, end = groups['rep_head'], None, groups['rep_tail']
-            elif groups['dom_area_sep']:
-                area, mid, end = groups['dom_area_sep'], groups['dom_mid_sep'], groups['dom_end_sep']
-            elif groups['dom_area_raw']:
-                area, mid, end = groups['dom_area_raw'], groups['dom_mid_raw'], groups['dom_end_raw']
-            
-            full_number = self.normalize_phone(area, mid, end)
+        # 예전처럼 전체를 unicode_escape로 디코딩하면 한글이 깨져서 '팩스', '계좌' 같은 키워드를 못 찾았음
+        text = unescape_js(text)
 
-            # 가짜 번호 판별 시 full_number도 함께 전달
-            if self.is_garbage_number(mid, end, full_number):
-                continue
+        if '@' in text:
+            for email in self._iter_emails(text):
+                if not self.email_junk_regex.search(email):
+                    info_dict['email'].add(email)
 
-            start_pos = match.start()
-            context_prev = text_lower[max(0, start_pos - 20):start_pos]
-            context_next = text_lower[match.end():min(len(text_lower), match.end() + 10)]
-            combined_context = context_prev + " " + context_next
-            
-            if any(k in combined_context for k in self.negative_keywords):
-                continue
+        for region in _PHONE_REGION.finditer(text):
+            for match in self.phone_regex.finditer(text, region.start(), region.end()):
+                groups = match.groupdict()
+
+                area, mid, end = "", "", ""
+
+                if groups['intl_area']:
+                    area, mid, end = groups['intl_area'], groups['intl_mid'], groups['intl_end']
+                    if not area.startswith('0'): area = '0' + area
+                elif groups['rep_head']:
+                    area, mid, end = groups['rep_head'], None, groups['rep_tail']
+                elif groups['dom_area_sep']:
+                    area, mid, end = groups['dom_area_sep'], groups['dom_mid_sep'], groups['dom_end_sep']
+                elif groups['dom_area_raw']:
+                    area, mid, end = groups['dom_area_raw'], groups['dom_mid_raw'], groups['dom_end_raw']
+
+                full_number = self.normalize_phone(area, mid, end)
+
+                # 가짜 번호 판별 시 full_number도 함께 전달
+                if self.is_garbage_number(mid, end, full_number):
+                    continue
 
-            if any(keyword in context_prev for keyword in self.fax_keywords):
-                info_dict['fax'].add(full_number)
-            else:
-                info_dict['tel'].add(full_number)
+                # 앞뒤 문맥만 소문자로 바꿔서 키워드 확인
+                start_pos = match.start()
+                context_prev = text[max(0, start_pos - 20):start_pos].lower()
+                context_next = text[match.end():match.end() + 10].lower()
+
+                if self.negative_regex.search(context_prev + " " + context_next):
+                    continue
+
+                if self.fax_regex.search(context_prev):
+                    info_dict['fax'].add(full_number)
+                else:
+                    info_dict['tel'].add(full_number)
 
     async def extract_from_url(self, url):
         info = {'email': set(), 'tel': set(), 'fax': set()}
@@ -268,28 +516,40 @@ class SmartExtractor:
             session = aiohttp.ClientSession()
             should_close_session = True
 
+        limiter = self._limiter_for(url)
         try:
-            async with session.get(url, headers=self.headers, timeout=10) as resp:
-                if resp.status != 200: 
-                    return False, info
-
-                raw_source_text = await resp.text()
-
-                soup = BeautifulSoup(raw_source_text, 'html.parser')
-                
-                self.extract_links_from_soup(soup, info)
-                
-                visible_text = soup.get_text(separator=' ', strip=True)
-                
-                frame_text = await self.get_text_with_frames(soup, url, session)
-                js_text = await self.get_js_content(soup, url, session) 
-                
-                combined_text = f"{visible_text} {frame_text} {raw_source_text} {js_text}"
-                
-                self.extract_info_from_text(combined_text, info)
-                        
+            if limiter:
+                await limiter.acquire()
+            Metrics.add_gauge("crawler_inflight_requests", 1, kind="homepage")
+            try:
+                with Metrics.timer("homepage_request"):
+                    async with session.get(url, headers=self.headers, timeout=10) as resp:
+                        self._feedback(limiter, resp)
+                        if resp.status != 200:
+                            return False, info
+                        body = await resp.read()
+                        raw_source_text = await resp.text()
+            finally:
+                Metrics.add_gauge("crawler_inflight_requests", -1, kind="homepage")
+            Metrics.inc("crawler_bytes_downloaded_total", len(body), kind="homepage")
+
+            # 파싱/스캔은 프로세스 풀에서 (soup은 넘길 수 없으므로 결과와 frame/script 목록만 받음)
+            with Metrics.timer("homepage_parse"):
+                page_info, targets = await ParsePool.run(
+                    analyze_homepage, raw_source_text, url, size=len(raw_source_text)
+                )
+            for key in info:
+                info[key].update(page_info[key])
+
+            with Metrics.timer("subresources"):
+                await self.scan_subresources(targets, session, info)
+
             return True, info
 
+        except asyncio.TimeoutError:
+            if limiter:
+                limiter.on_throttle(reason="timeout")
+            return False, info
         except Exception:
             return False, info
         finally:
@@ -303,13 +563,16 @@ class SmartExtractor:
         is_invalid_url = (not url) or (url == "-") or (clean_url in ['http://', 'https://', ''])
         
         if is_invalid_url:
+             Metrics.inc("crawler_deep_crawl_total", result="skipped")
              return company_data
 
         success = False
         contact_info = {'email': set(), 'tel': set(), 'fax': set()}
 
         if url:
-            success, contact_info = await self.extract_from_url(url)
+            with Metrics.timer("deep_crawl"):
+                success, contact_info = await self.extract_from_url(url)
+            Metrics.inc("crawler_deep_crawl_total", result="ok" if success else "failed")
 
         existing_email = company_data.get('이메일', '')
         if existing_email: contact_info['email'].add(existing_email)
@@ -343,4 +606,24 @@ class SmartExtractor:
             "이메일": ", ".join(sorted(list(info['email']))),
             "전화번호": ", ".join(sorted(list(info['tel']))),
             "팩스": ", ".join(sorted(list(info['fax'])))
-        }
\ No newline at end of file
+        }
+
+
+# --- 프로세스 풀(ParsePool)에서 실행하는 함수들 (워커마다 추출기 하나를 만들어 재사용) ---
+
+_pool_extractor = None
+
+
+def _get_pool_extractor():
+    global _pool_extractor
+    if _pool_extractor is None:
+        _pool_extractor = SmartExtractor(rate_limit=False)
+    return _pool_extractor
+
+
+def analyze_homepage(raw_source_text, url):
+    return _get_pool_extractor().analyze_html(raw_source_text, url)
+
+
+def scan_resource(raw, kind):
+    return _get_pool_extractor().scan_resource_text(raw, kind)
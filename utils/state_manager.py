@@ -2,28 +2,61 @@ import sqlite3
 import hashlib
 import json
 import os
+import re
 import logging
 import asyncio
+import time
 from concurrent.futures import ThreadPoolExecutor
 
+from utils.dedup_index import FingerprintIndex
+from utils.metrics import Metrics
+
+# DataProcessor가 고유키를 만들 때와 같은 정규화 (한글/영문/숫자만 남김)
+_KEY_CLEAN_PATTERN = re.compile(r'[^가-힣a-zA-Z0-9]')
+
 class StateManager:
-    def __init__(self, domain_group, db_dir="states"):
-        self.domain_group = domain_group 
+    """
+    중복 방지 해시와 체크포인트를 SQLite에 저장.
+
+    모든 읽기/쓰기는 전용 쓰기 스레드 하나와 그 스레드가 계속 들고 있는 WAL 연결을 거침.
+    요청은 큐에 쌓였다가 한 번에 처리되고 커밋도 한 번만 하므로(group commit),
+    페이지당 수백 번이던 fsync가 한 번으로 줄고 체크포인트가 아이템 저장과 순서가 뒤섞이지 않음.
+
+    저장된 해시는 처음 중복 검사할 때 FingerprintIndex로 메모리에 올려두고,
+    이미 본 아이템은 DB까지 가지 않고 바로 걸러냄.
+
+    `identity_fields`(예: ["기업명", "대표자명"])를 주면 아이템 전체가 아니라 그 필드만으로
+    같은 기업인지 판단함 (item_keys 테이블). 예전 방식(items 테이블)의 해시로는 식별 키를 만들 수 없으므로,
+    이미 올린 기업은 import_identity_keys()로 업로드된 레코드(시트 내보내기)에서 한 번 채워 넣어야 함.
+    """
+    def __init__(self, domain_group, db_dir="states", commit_interval=0.0, use_index=True, identity_fields=None):
+        self.domain_group = domain_group
         self.db_dir = db_dir
-        
+
         if not os.path.exists(self.db_dir):
             os.makedirs(self.db_dir, exist_ok=True)
-            
+
         self.db_path = os.path.join(self.db_dir, f"crawl_state_{domain_group}.db")
         self.logger = logging.getLogger(f"StateManager-{domain_group}")
         self.executor = ThreadPoolExecutor(max_workers=1)
+        # 요청을 모으기 위해 추가로 기다리는 시간(초). 0이면 이미 쌓인 것만 묶음
+        self.commit_interval = commit_interval
+        self._conn = None
+        self._requests = None
+        self._writer_task = None
+        self.index = FingerprintIndex() if use_index else None
+        self._index_loaded = False
+        self.identity_fields = list(identity_fields or [])
+        self.items_table = 'item_keys' if self.identity_fields else 'items'
         self._init_db()
 
     def _init_db(self):
         """DB 초기화 (동기 실행)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # 여러 프로세스가 같은 DB를 동시에 열 수 있으므로 잠겨 있으면 기다림
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
                 cursor = conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
                 # 수집된 아이템 해시 저장 (중복 방지)
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS items (
@@ -31,6 +64,13 @@ class StateManager:
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
+                # 식별 필드 기반 해시 저장 (identity_fields 사용 시)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS item_keys (
+                        item_hash TEXT PRIMARY KEY,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
                 # 체크포인트 저장
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS checklist (
@@ -38,62 +78,335 @@ class StateManager:
                         value TEXT
                     )
                 ''')
+                # 체크포인트 watermark보다 앞서 먼저 끝난 페이지 (완료될 때마다 한 줄씩 추가)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS checkpoint_pages (
+                        key TEXT NOT NULL,
+                        page INTEGER NOT NULL,
+                        PRIMARY KEY (key, page)
+                    )
+                ''')
+                # 재시도해도 실패한 목록 페이지 (다음 재시도 대상)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS failed_pages (
+                        crawler TEXT NOT NULL,
+                        page INTEGER NOT NULL,
+                        attempts INTEGER DEFAULT 1,
+                        last_error TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (crawler, page)
+                    )
+                ''')
                 conn.commit()
         except Exception as e:
             self.logger.error(f"DB Init Failed: {e}")
 
     def _calculate_hash(self, data: dict) -> str:
         """데이터의 고유 해시값 생성"""
+        if self.identity_fields:
+            identity = self._identity(data)
+            if identity.strip('_'):
+                return self._identity_hash(identity)
+        # identity_fields가 없거나 모두 비어 있으면 아이템 전체를 직렬화한 MD5
         unique_str = json.dumps(data, sort_keys=True, ensure_ascii=False)
         return hashlib.md5(unique_str.encode('utf-8')).hexdigest()
 
+    def _identity(self, data):
+        return "_".join(_KEY_CLEAN_PATTERN.sub('', str(data.get(field) or '')) for field in self.identity_fields)
+
+    @staticmethod
+    def _identity_hash(identity):
+        return hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest()
+
+    async def import_identity_keys(self, records):
+        """(비동기) 이미 업로드된 레코드(시트 내보내기 등)로 식별 키를 미리 채움. 새로 등록한 키 수 반환
+
+        업로드된 레코드의 기업명은 법인 표기가 빠진 값이라 원본과 다를 수 있으므로,
+        식별 필드가 기업명+대표자명이면 원본으로 만든 '고유키' 열을 그대로 씀
+        """
+        if not self.identity_fields:
+            raise ValueError("identity_fields가 없는 설정은 식별 키를 가져올 수 없음")
+        use_unique_key = self.identity_fields == ['기업명', '대표자명']
+        hashes = set()
+        for record in records:
+            identity = record.get('고유키') if use_unique_key else None
+            identity = identity or self._identity(record)
+            if identity.strip('_'):
+                hashes.add(self._identity_hash(identity))
+        if not hashes:
+            return 0
+        if not self._index_loaded:
+            await self._submit('load_index', None)
+            self._index_loaded = True
+        flags = await self._submit('insert', list(hashes))
+        return sum(flags)
+
+    async def filter_new(self, items):
+        """(비동기) 처음 보는 아이템만 골라 반환하고, 모두 DB에 등록 (커밋 1회)"""
+        if not items:
+            return []
+        flags = await self._check_items(items)
+        return [item for item, is_new in zip(items, flags) if is_new]
+
     async def is_new(self, item: dict) -> bool:
         """(비동기) 새로운 데이터인지 확인하고, 새로우면 DB에 등록"""
-        item_hash = self._calculate_hash(item)
-        loop = asyncio.get_running_loop()
-        
-        exists = await loop.run_in_executor(
-            self.executor, self._check_and_insert, item_hash
-        )
-        return not exists
+        flags = await self._check_items([item])
+        return flags[0]
 
-    def _check_and_insert(self, item_hash):
-        """(동기) 실제 DB 조회 및 삽입"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1 FROM items WHERE item_hash = ?", (item_hash,))
-                if cursor.fetchone():
-                    return True # 이미 존재함
-                
-                cursor.execute("INSERT INTO items (item_hash) VALUES (?)", (item_hash,))
-                conn.commit()
-                return False # 새로운 데이터
-        except Exception as e:
-            self.logger.error(f"DB Error: {e}")
-            return True # 에러 발생 시 중복으로 처리하여 안전장치
+    async def _check_items(self, items):
+        """메모리 인덱스에 있는 해시는 바로 중복 처리하고, 나머지만 DB로 보냄"""
+        if not self._index_loaded:
+            await self._submit('load_index', None)
+            self._index_loaded = True
+
+        hashes = [self._calculate_hash(item) for item in items]
+        flags = [False] * len(hashes)
+        pending = []
+        for i, item_hash in enumerate(hashes):
+            if self.index is None or self.index.fingerprint(item_hash) not in self.index:
+                pending.append(i)
+
+        if pending:
+            results = await self._submit('insert', [hashes[i] for i in pending])
+            for i, is_new in zip(pending, results):
+                flags[i] = is_new
+        Metrics.inc("crawler_dedup_lookups_total", len(items) - len(pending), db=self.domain_group, source="index")
+        Metrics.inc("crawler_dedup_lookups_total", len(pending), db=self.domain_group, source="sqlite")
+        return flags
 
     async def save_checkpoint(self, key, value):
         """(비동기) 진행 상황 저장"""
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._save_checkpoint_sync, key, str(value))
-
-    def _save_checkpoint_sync(self, key, value):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.cursor().execute(
-                "INSERT OR REPLACE INTO checklist (key, value) VALUES (?, ?)", 
-                (key, value)
-            )
-            conn.commit()
+        await self._submit('save_checkpoint', (key, str(value)))
 
     async def get_checkpoint(self, key, default=None):
-        loop = asyncio.get_running_loop()
-        val = await loop.run_in_executor(None, self._get_checkpoint_sync, key)
+        val = await self._submit('get_checkpoint', key)
         return val if val else default
 
-    def _get_checkpoint_sync(self, key):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM checklist WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            return row[0] if row else None
\ No newline at end of file
+    async def save_progress(self, key, watermark, pages=(), advanced=True):
+        """
+        (비동기) 페이지 진행 상황 저장. 전체 목록을 다시 쓰지 않고 변경분만 기록함
+        - pages: watermark 이후에 새로 끝난 페이지 (checkpoint_pages에 추가)
+        - advanced: watermark가 움직였으면 그 이하 페이지 줄을 지움
+        """
+        await self._submit('save_progress', (key, int(watermark), [int(p) for p in pages], advanced))
+
+    async def get_progress(self, key):
+        """(비동기) (체크포인트 값, watermark 이후에 먼저 끝난 페이지 목록)"""
+        return await self._submit('get_progress', key)
+
+    async def record_failed_page(self, crawler, page, error):
+        """(비동기) 실패한 페이지 기록. 누적 실패 횟수 반환"""
+        return await self._submit('record_failed', (crawler, page, str(error)[:500]))
+
+    async def resolve_failed_page(self, crawler, page):
+        """(비동기) 다시 성공한 페이지를 실패 목록에서 제거"""
+        await self._submit('resolve_failed', (crawler, page))
+
+    async def get_failed_pages(self, crawler, max_attempts=None):
+        """(비동기) 재시도 대상 [(page, attempts), ...]. max_attempts 이상 실패한 페이지는 제외"""
+        return await self._submit('get_failed', (crawler, max_attempts))
+
+    async def count_failed_pages(self, crawler):
+        return len(await self._submit('get_failed', (crawler, None)))
+
+    async def close(self):
+        """남은 요청을 처리하고 연결 종료"""
+        if self._writer_task:
+            await self._requests.put(None)
+            await self._writer_task
+            self._writer_task = None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self._close_conn)
+
+    # --- 쓰기 채널 ---
+
+    async def _submit(self, kind, payload):
+        if self._writer_task is None:
+            self._requests = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            Metrics.register_gauge("crawler_queue_items", self._requests.qsize, queue="state_db", db=self.domain_group)
+        future = asyncio.get_running_loop().create_future()
+        await self._requests.put((kind, payload, future))
+        return await future
+
+    async def _writer_loop(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            request = await self._requests.get()
+            if request is None:
+                break
+            batch = [request]
+
+            # 처리 중에 쌓인 요청(과 commit_interval 동안 들어온 요청)을 한 트랜잭션으로 묶음
+            deadline = loop.time() + self.commit_interval
+            while True:
+                try:
+                    remaining = deadline - loop.time()
+                    if remaining > 0:
+                        request = await asyncio.wait_for(self._requests.get(), remaining)
+                    else:
+                        request = self._requests.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            ops = [(kind, payload) for kind, payload, _ in batch]
+            try:
+                with Metrics.timer("state_db", db=self.domain_group):
+                    results = await loop.run_in_executor(self.executor, self._apply_batch, ops)
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (kind, payload, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    if kind == 'insert':
+                        # 에러 발생 시 중복으로 처리하여 안전장치
+                        future.set_result([False] * len(payload))
+                    else:
+                        future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _get_conn(self):
+        """(쓰기 스레드 전용) 계속 재사용하는 연결"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _close_conn(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _apply_batch(self, ops):
+        """(동기, 쓰기 스레드) 요청 묶음을 처리하고 한 번만 커밋"""
+        conn = self._get_conn()
+        results = []
+        # 이번 묶음에서 넣은 해시의 지문. 커밋이 성공해야 메모리 인덱스에 반영함
+        fingerprints = []
+        for kind, payload in ops:
+            try:
+                if kind == 'insert':
+                    results.append(self._insert_hashes(conn, payload, fingerprints))
+                elif kind == 'load_index':
+                    results.append(self._load_index(conn))
+                elif kind == 'save_checkpoint':
+                    conn.execute(
+                        "INSERT OR REPLACE INTO checklist (key, value) VALUES (?, ?)",
+                        payload
+                    )
+                    results.append(None)
+                elif kind == 'get_checkpoint':
+                    row = conn.execute("SELECT value FROM checklist WHERE key = ?", (payload,)).fetchone()
+                    results.append(row[0] if row else None)
+                elif kind == 'save_progress':
+                    key, watermark, pages, advanced = payload
+                    conn.execute(
+                        "INSERT OR REPLACE INTO checklist (key, value) VALUES (?, ?)",
+                        (key, json.dumps({'watermark': watermark}))
+                    )
+                    if pages:
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO checkpoint_pages (key, page) VALUES (?, ?)",
+                            [(key, page) for page in pages]
+                        )
+                    if advanced:
+                        conn.execute("DELETE FROM checkpoint_pages WHERE key = ? AND page <= ?", (key, watermark))
+                    results.append(None)
+                elif kind == 'get_progress':
+                    row = conn.execute("SELECT value FROM checklist WHERE key = ?", (payload,)).fetchone()
+                    pages = conn.execute(
+                        "SELECT page FROM checkpoint_pages WHERE key = ? ORDER BY page", (payload,)
+                    ).fetchall()
+                    results.append((row[0] if row else None, [p[0] for p in pages]))
+                elif kind == 'record_failed':
+                    conn.execute(
+                        """INSERT INTO failed_pages (crawler, page, last_error) VALUES (?, ?, ?)
+                           ON CONFLICT(crawler, page) DO UPDATE SET
+                               attempts = attempts + 1, last_error = excluded.last_error,
+                               updated_at = CURRENT_TIMESTAMP""",
+                        payload
+                    )
+                    row = conn.execute(
+                        "SELECT attempts FROM failed_pages WHERE crawler = ? AND page = ?", payload[:2]
+                    ).fetchone()
+                    results.append(row[0])
+                elif kind == 'resolve_failed':
+                    conn.execute("DELETE FROM failed_pages WHERE crawler = ? AND page = ?", payload)
+                    results.append(None)
+                elif kind == 'get_failed':
+                    crawler, max_attempts = payload
+                    if max_attempts is None:
+                        cursor = conn.execute(
+                            "SELECT page, attempts FROM failed_pages WHERE crawler = ? ORDER BY page", (crawler,)
+                        )
+                    else:
+                        cursor = conn.execute(
+                            "SELECT page, attempts FROM failed_pages WHERE crawler = ? AND attempts < ? ORDER BY page",
+                            (crawler, max_attempts)
+                        )
+                    results.append(cursor.fetchall())
+                else:
+                    results.append(ValueError(f"Unknown request: {kind}"))
+            except Exception as e:
+                self.logger.error(f"DB Error: {e}")
+                results.append(e)
+
+        try:
+            conn.commit()
+        except Exception as e:
+            # 롤백된 아이템은 저장되지 않았으므로 인덱스에도 넣지 않음 (다음에 다시 새 아이템으로 처리됨)
+            self.logger.error(f"DB Commit Error: {e}")
+            conn.rollback()
+            return [e] * len(ops)
+        if self.index is not None:
+            for fp in fingerprints:
+                self.index.add(fp)
+        return results
+
+    def _insert_hashes(self, conn, hashes, fingerprints):
+        """INSERT OR IGNORE 후 changes()로 실제로 들어갔는지(=새 아이템) 확인"""
+        insert_sql = f"INSERT OR IGNORE INTO {self.items_table} (item_hash) VALUES (?)"
+        flags = []
+        for item_hash in hashes:
+            # cursor.rowcount는 sqlite3_changes() 값을 그대로 돌려줌
+            cursor = conn.execute(insert_sql, (item_hash,))
+            flags.append(cursor.rowcount > 0)
+            if self.index is not None:
+                # 다른 프로세스가 넣은 해시(rowcount 0)도 커밋 후엔 메모리에서 바로 거름
+                fingerprints.append(self.index.fingerprint(item_hash))
+        return flags
+
+    def _load_index(self, conn):
+        """(쓰기 스레드) DB에 저장된 해시를 모두 읽어 메모리 인덱스 구성"""
+        if self._index_loaded:
+            return None
+        if self.identity_fields and conn.execute("SELECT 1 FROM item_keys LIMIT 1").fetchone() is None:
+            if conn.execute("SELECT 1 FROM items LIMIT 1").fetchone() is not None:
+                # 예전 해시(아이템 전체 MD5)로는 식별 키를 만들 수 없음 → 한 번은 다시 올라감
+                self.logger.warning(
+                    "⚠️ Identity keys are empty but whole-item hashes exist: already uploaded companies "
+                    "will be uploaded once more. Run `python main.py --import-keys <sheet.csv>` first to avoid it."
+                )
+        if self.index is None:
+            self._index_loaded = True
+            return None
+
+        started = time.perf_counter()
+        cursor = conn.execute(f"SELECT item_hash FROM {self.items_table}")
+        self.index.load(row[0] for row in cursor)
+        self._index_loaded = True
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"📚 Dedup index loaded: {len(self.index):,} hashes in {elapsed:.2f}s "
+            f"(~{self.index.memory_bytes() / 1024 / 1024:.1f} MB)"
+        )
+        return None
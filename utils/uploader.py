@@ -0,0 +1,177 @@
+import time
+import random
+import logging
+import asyncio
+import aiohttp
+
+from config import UPLOAD_CONFIG
+from utils.payload import serialize
+
+
+class WebhookUploader:
+    """
+    GAS 웹훅으로 배치를 보내는 업로더.
+
+    - 세션(커넥션 풀) 하나를 계속 재사용하고, 최대 `max_in_flight`개 배치를 동시에 보냄
+    - 배치 크기는 AIMD 방식으로 조절: 빠르게 성공하면 조금씩 늘리고,
+      busy/429를 받거나 응답이 `target_latency`보다 느리면 절반으로 줄임
+    - 요청 본문은 배치당 한 번만 직렬화(+선택적으로 columnar 형식, gzip)해서 재시도 때 그대로 씀
+    - 누적 전송량(items/s)을 주기적으로 로그로 남김
+    """
+    def __init__(self, url, config=None, logger=None):
+        self.url = url
+        self.config = {**UPLOAD_CONFIG, **(config or {})}
+        self.logger = logger or logging.getLogger("WebhookUploader")
+
+        self.max_in_flight = max(1, int(self.config["max_in_flight"]))
+        self.min_batch_size = self.config["min_batch_size"]
+        self.max_batch_size = self.config["max_batch_size"]
+        self._batch_size = float(self.config["batch_size"])
+
+        self._session = None
+        self._slots = None
+
+        # 통계
+        self.sent_items = 0
+        self.sent_batches = 0
+        self.failed_batches = 0
+        self.throttled = 0
+        self._started_at = None
+        self._last_report = 0.0
+
+    @property
+    def batch_size(self):
+        return int(self._batch_size)
+
+    async def start(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_in_flight, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config["timeout"])
+            )
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    async def acquire_slot(self):
+        """동시 전송 자리가 날 때까지 대기 (release_slot과 짝)"""
+        await self.start()
+        await self._slots.acquire()
+
+    def release_slot(self):
+        self._slots.release()
+
+    def encode(self, data_list):
+        """요청 본문과 헤더를 한 번만 만듦"""
+        body = serialize(data_list, self.config.get("format", "rows"), compress=self.config.get("gzip", False))
+        return body, {'Content-Type': 'application/json'}
+
+    async def send(self, data_list):
+        """배치 하나 전송 (성공 응답을 받으면 True)"""
+        if not data_list: return True
+        await self.start()
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+
+        # 로그에 어떤 출처의 데이터가 섞여있는지 표시
+        sources = set(d.get("수집출처", "Unknown") for d in data_list)
+        self.logger.info(f"📤 Uploading batch of {len(data_list)} items (Sources: {', '.join(sources)})")
+
+        body, headers = self.encode(data_list)
+
+        for attempt in range(self.config["max_retries"]):
+            try:
+                started = time.monotonic()
+                async with self._session.post(self.url, data=body, headers=headers) as response:
+                    if response.status == 200:
+                        resp_json = await response.json(content_type=None)
+                        if resp_json.get("result") == "busy":
+                            self._decrease()
+                            wait = (2 ** attempt) + random.uniform(1, 3)
+                            self.logger.warning(f"⚠️ GAS Busy. Retry in {wait:.1f}s... (batch size → {self.batch_size})")
+                            await asyncio.sleep(wait)
+                            continue
+
+                        if resp_json.get("result") == "error":
+                            self.logger.error(f"❌ GAS Error: {resp_json.get('msg')}")
+                            self.failed_batches += 1
+                            return False
+
+                        if resp_json.get("result") == "no_data":
+                            # 보낸 배치가 비어 보인다는 건 GAS가 형식(columnar/gzip)을 못 푼 것 → 성공으로 치면 데이터가 사라짐
+                            self.logger.error(
+                                "❌ GAS could not decode the batch (no_data). "
+                                "Deploy the README decodeBatch or turn off UPLOAD_CONFIG format/gzip."
+                            )
+                            self.failed_batches += 1
+                            return False
+
+                        self._on_success(len(data_list), time.monotonic() - started)
+                        return True
+
+                    elif response.status >= 500:
+                        await asyncio.sleep(3)
+                        continue
+                    elif response.status == 429:
+                        self._decrease()
+                        await asyncio.sleep(5)
+                        continue
+                    elif response.status >= 400:
+                        # 그 밖의 4xx(잘못된 주소, 권한 없음 등)는 다시 보내도 같으므로 바로 실패 처리 (보관함에 실패로 기록됨)
+                        self.logger.error(f"❌ Webhook rejected batch: HTTP {response.status}")
+                        self.failed_batches += 1
+                        return False
+                    else:
+                        # 예상하지 못한 응답(리다이렉트 등)도 바로 재시도하지 않고 잠시 쉼
+                        self.logger.warning(f"⚠️ Unexpected webhook response: HTTP {response.status}")
+                        await asyncio.sleep(3)
+                        continue
+
+            except Exception as e:
+                self.logger.error(f"⚠️ Network Error: {e}")
+                await asyncio.sleep(2)
+
+        self.logger.error(f"💀 Failed to upload batch of {len(data_list)} items.")
+        self.failed_batches += 1
+        return False
+
+    # --- AIMD ---
+
+    def _on_success(self, count, latency):
+        self.sent_items += count
+        self.sent_batches += 1
+        if latency > self.config["target_latency"]:
+            self._decrease()
+        else:
+            self._batch_size = min(self.max_batch_size, self._batch_size + self.config["increase_step"])
+        self.logger.info(f"✅ Sent {count} items in {latency:.1f}s.")
+
+        now = time.monotonic()
+        if now - self._last_report >= self.config["report_interval"]:
+            self._last_report = now
+            self.report()
+
+    def _decrease(self):
+        self.throttled += 1
+        self._batch_size = max(self.min_batch_size, self._batch_size * self.config["decrease_factor"])
+
+    # --- 통계 ---
+
+    def items_per_sec(self):
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started_at
+        return self.sent_items / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        self.logger.info(
+            f"📈 Upload: {self.sent_items} items / {self.sent_batches} batches, "
+            f"{self.items_per_sec():.1f} items/s (batch size {self.batch_size}, "
+            f"throttled {self.throttled}, failed {self.failed_batches})"
+        )
+
+    async def close(self):
+        if self._session is not None:
+            if self.sent_batches or self.failed_batches:
+                self.report()
+            await self._session.close()
+            self._session = None